@@ -0,0 +1,272 @@
+"""Load benchmark for the Chore Card service and entity paths.
+
+Runs the integration inside an in-process Home Assistant test instance (from
+``pytest-homeassistant-custom-component``, no network needed), creates N
+boards with M chores and K users each, and drives the ``update``,
+``set_selection`` and ``apply_batch`` services at a fixed rate. For every
+board count it records setup time, p50/p99 latency, sensor state writes,
+recorder bytes and peak Python memory, and writes the results as JSON so runs
+can be compared across releases.
+
+Usage::
+
+    pip install -r benchmarks/requirements.txt
+    python benchmarks/bench_services.py --boards 1 10 100 --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import json
+from pathlib import Path
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from homeassistant import loader
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from custom_components.chore_card.const import (  # noqa: E402
+    CHORE_SECTIONS,
+    DEFAULT_WRITE_WINDOW,
+    DOMAIN,
+)
+from custom_components.chore_card.sensor import ChoreCardSensor  # noqa: E402
+
+PATHS = ("update", "set_selection", "apply_batch")
+
+
+def build_board(chores: int, users: int) -> dict[str, Any]:
+    """Board data for one config entry."""
+    data: dict[str, list] = {section: [] for section in CHORE_SECTIONS}
+    for index in range(chores):
+        data[CHORE_SECTIONS[index % len(CHORE_SECTIONS)]].append(
+            {"name": f"Chore {index}", "points": 5, "selections": [None] * 7}
+        )
+    return {
+        "data": data,
+        "users": [{"name": f"User {index}"} for index in range(users)],
+        "user_points": {f"User {index}": 0 for index in range(users)},
+    }
+
+
+def percentile(values: list[float], fraction: float) -> float | None:
+    """Nearest-rank percentile."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class StateWriteRecorder:
+    """Counts Chore Card state writes and the recorder bytes they would add."""
+
+    def __init__(self, entity_ids: list[str]) -> None:
+        # Only the board sensors; the per-user points sensors share the prefix
+        self.entity_ids = frozenset(entity_ids)
+        self.writes = 0
+        self.rows: set[bytes] = set()
+
+    @callback
+    def handle(self, event: Event) -> None:
+        new_state = event.data.get("new_state")
+        if new_state is None or new_state.entity_id not in self.entity_ids:
+            return
+        self.writes += 1
+        recorded = {
+            key: value
+            for key, value in new_state.attributes.items()
+            if key not in ChoreCardSensor._unrecorded_attributes
+        }
+        self.rows.add(json_bytes(recorded))
+
+    @property
+    def recorder_bytes(self) -> int:
+        return sum(len(row) for row in self.rows)
+
+
+async def async_setup_boards(
+    hass: HomeAssistant, boards: int, chores: int, users: int
+) -> list[str]:
+    """Create and set up ``boards`` config entries; return their entity IDs."""
+    # Frontend registration needs http/lovelace; it is not what we measure here
+    hass.config.components.update({"http", "lovelace", "websocket_api"})
+    # The history export and calendar register views; no server is needed
+    hass.http = MagicMock()
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+
+    entity_ids = []
+    for index in range(boards):
+        entity_id = f"sensor.board_{index}"
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=f"Board {index}",
+            data={"sensor_name": entity_id, **build_board(chores, users)},
+        )
+        entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(entry.entry_id)
+        entity_ids.append(entity_id)
+    await hass.async_block_till_done()
+    return entity_ids
+
+
+def make_call(
+    path: str, rng: random.Random, entity_id: str, board: dict, chores: int, users: int
+) -> dict[str, Any]:
+    """Service data for one simulated click (or a 10-cell batch)."""
+
+    def cell() -> dict[str, Any]:
+        index = rng.randrange(chores)
+        return {
+            "section": CHORE_SECTIONS[index % len(CHORE_SECTIONS)],
+            "row": index // len(CHORE_SECTIONS),
+            "day": rng.randrange(7),
+            "user": f"User {rng.randrange(users)}",
+        }
+
+    if path == "set_selection":
+        return {"entity_id": entity_id, **cell()}
+
+    if path == "apply_batch":
+        return {
+            "entity_id": entity_id,
+            "operations": [{"op": "assign", **cell()} for _ in range(10)],
+        }
+
+    # The card's legacy path: send the whole board with one cell changed
+    change = cell()
+    chore = board["data"][change["section"]][change["row"]]
+    previous = chore["selections"][change["day"]]
+    chore["selections"][change["day"]] = change["user"]
+    # The card recomputes the totals it sends along
+    if previous is not None:
+        board["user_points"][previous] -= chore["points"]
+    board["user_points"][change["user"]] += chore["points"]
+    return {"entity_id": entity_id, "attributes": copy.deepcopy(board)}
+
+
+async def async_run_scenario(
+    boards: int, chores: int, users: int, calls: int, rate: float, seed: int
+) -> dict[str, Any]:
+    """Benchmark every service path for one board count."""
+    results: dict[str, Any] = {
+        "boards": boards,
+        "chores": chores,
+        "users": users,
+        "paths": {},
+    }
+
+    async with async_test_home_assistant() as hass:
+        with patch("custom_components.chore_card.install.async_install_frontend"):
+            start = time.perf_counter()
+            entity_ids = await async_setup_boards(hass, boards, chores, users)
+            results["setup_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+        for path in PATHS:
+            # Each path clicks its own cells; replaying the previous path's
+            # clicks would leave every one of them a no-op
+            rng = random.Random(f"{seed}:{path}")
+            local_boards = {
+                entity_id: build_board(chores, users) for entity_id in entity_ids
+            }
+            recorder = StateWriteRecorder(entity_ids)
+            unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, recorder.handle)
+            latencies = []
+            interval = 1 / rate if rate else 0
+
+            tracemalloc.start()
+            started = time.perf_counter()
+            for index in range(calls):
+                entity_id = rng.choice(entity_ids)
+                data = make_call(
+                    path, rng, entity_id, local_boards[entity_id], chores, users
+                )
+                start = time.perf_counter()
+                await hass.services.async_call(
+                    DOMAIN,
+                    path,
+                    data,
+                    blocking=True,
+                    return_response=path != "update",
+                )
+                latencies.append((time.perf_counter() - start) * 1000)
+
+                if interval:
+                    delay = started + (index + 1) * interval - time.perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+            # Let the last coalesced state write land before counting
+            await asyncio.sleep(DEFAULT_WRITE_WINDOW * 2)
+            await hass.async_block_till_done()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            unsub()
+
+            results["paths"][path] = {
+                "calls": calls,
+                "p50_ms": round(percentile(latencies, 0.5), 3),
+                "p99_ms": round(percentile(latencies, 0.99), 3),
+                "mean_ms": round(statistics.fmean(latencies), 3),
+                "state_writes": recorder.writes,
+                "recorder_bytes": recorder.recorder_bytes,
+                "peak_memory_bytes": peak,
+            }
+
+        await hass.async_stop(force=True)
+
+    return results
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run every scenario."""
+    return {
+        "calls": args.calls,
+        "rate": args.rate,
+        "seed": args.seed,
+        "scenarios": [
+            await async_run_scenario(
+                boards, args.chores, args.users, args.calls, args.rate, args.seed
+            )
+            for boards in args.boards
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--boards", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--chores", type=int, default=30)
+    parser.add_argument("--users", type=int, default=4)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument(
+        "--rate", type=float, default=0, help="calls per second (0 = unthrottled)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="write JSON results here")
+    args = parser.parse_args()
+
+    results = asyncio.run(async_main(args))
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Estimate recorder bytes written per 1,000 chore clicks.
+
+The recorder stores each distinct attribute set of an entity as one JSON row
+in ``state_attributes`` (identical rows are shared). This script replays a run
+of random dropdown clicks against a board set up in an in-process Home
+Assistant (see ``bench_services.py``) and sums the size of the attribute rows
+that would be written:
+
+* ``before``: the whole board lived in the sensor's attributes.
+* ``after``: the sensor's real ``extra_state_attributes`` without
+  ``ChoreCardSensor._unrecorded_attributes``.
+
+Usage::
+
+    pip install -r benchmarks/requirements.txt
+    python benchmarks/recorder_bytes.py --chores 30 --users 4 --clicks 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+from typing import Any
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import async_test_home_assistant
+
+# bench_services puts the repository root on sys.path
+from bench_services import async_setup_boards
+
+from custom_components.chore_card.manager import async_get_manager  # noqa: E402
+from custom_components.chore_card.sensor import ChoreCardSensor  # noqa: E402
+
+
+def serialize(attributes: dict) -> bytes:
+    """Serialize attributes the way the recorder does (compact JSON)."""
+    return json.dumps(attributes, separators=(",", ":")).encode()
+
+
+async def async_run(chores: int, users: int, clicks: int, seed: int) -> dict[str, Any]:
+    """Replay ``clicks`` random dropdown changes and measure recorder bytes."""
+    rng = random.Random(seed)
+    before_rows: set[bytes] = set()
+    after_rows: set[bytes] = set()
+
+    async with async_test_home_assistant() as hass:
+        with patch("custom_components.chore_card.install.async_install_frontend"):
+            (entity_id,) = await async_setup_boards(hass, 1, chores, users)
+        manager = async_get_manager(hass)
+        store = manager.async_require_store(entity_id)
+        sensor = manager.async_get_entity(store.entry.entry_id)
+        names = [user["name"] for user in store.board["users"]]
+
+        for _ in range(clicks):
+            section = rng.choice(
+                [name for name, rows in store.board["data"].items() if rows]
+            )
+            row = rng.randrange(len(store.board["data"][section]))
+            store.async_set_selection(
+                section, row, rng.randrange(7), rng.choice(names + [None])
+            )
+
+            before_rows.add(serialize(store.board))
+            recorded = {
+                key: value
+                for key, value in sensor.extra_state_attributes.items()
+                if key not in ChoreCardSensor._unrecorded_attributes
+            }
+            after_rows.add(serialize(recorded))
+
+        await hass.async_stop(force=True)
+
+    before = sum(len(row) for row in before_rows)
+    after = sum(len(row) for row in after_rows)
+    return {
+        "chores": chores,
+        "users": users,
+        "clicks": clicks,
+        "before_bytes": before,
+        "after_bytes": after,
+        "before_bytes_per_1000_clicks": round(before * 1000 / clicks),
+        "after_bytes_per_1000_clicks": round(after * 1000 / clicks),
+        "reduction": round(before / after, 1) if after else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chores", type=int, default=30)
+    parser.add_argument("--users", type=int, default=4)
+    parser.add_argument("--clicks", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    result = asyncio.run(async_run(args.chores, args.users, args.clicks, args.seed))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
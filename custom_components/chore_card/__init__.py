@@ -3,66 +3,64 @@
 from __future__ import annotations
 
 import logging
-import os
-import shutil
+import time
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.const import Platform
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.util import dt as dt_util
 
-PLATFORMS = [Platform.SENSOR]
+PLATFORMS = [Platform.CALENDAR, Platform.SENSOR]
 
 from .const import DOMAIN
-from .frontend import ChoreCardRegistration
+from .manager import async_get_manager
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_RESET_SCHEDULER = f"{DOMAIN}_reset_scheduler"
 
-def ensure_directory(hass: HomeAssistant):
-    """Ensure the frontend destination directory exists (blocking)."""
-    frontend_dest = hass.config.path("www/community/chore-card")
-
-    if not os.path.exists(frontend_dest):
-        os.makedirs(frontend_dest, exist_ok=True)
-        _LOGGER.info(f"✅ Created frontend destination folder: {frontend_dest}")
 
+async def async_setup(hass: HomeAssistant, config: dict):
+    """Set up the Chore Card integration (global setup)."""
+    _LOGGER.info("🛠️ Setting up Chore Card integration (global setup)")
 
-def copy_frontend_files(hass: HomeAssistant):
-    """Copy frontend files synchronously from the integration folder to the www folder."""
-    frontend_source = hass.config.path("custom_components/chore_card/frontend")
-    frontend_dest = hass.config.path("www/community/chore-card")
+    # Imported here so loading the config flow stays cheap
+    from .export import ChoreCardHistoryView
+    from .install import async_ensure_frontend
+    from .reset import ChoreCardResetScheduler
+    from .websocket import async_register_websocket_commands
 
-    try:
-        if not os.path.exists(frontend_source):
-            _LOGGER.error(f"❌ Frontend source folder not found: {frontend_source}")
-            return False  # Prevent further execution if files are missing
+    start = time.perf_counter()
+    manager = async_get_manager(hass)
 
-        files = os.listdir(frontend_source)
-        for filename in files:
-            src_path = os.path.join(frontend_source, filename)
-            dest_path = os.path.join(frontend_dest, filename)
+    # ✅ Install and register the frontend once per boot without blocking startup
+    async_ensure_frontend(hass)
 
-            if os.path.isfile(src_path):
-                should_copy = not os.path.exists(dest_path) or (
-                    os.path.getmtime(src_path) > os.path.getmtime(dest_path)
-                )
+    # ✅ One midnight listener resets every board
+    scheduler = ChoreCardResetScheduler(hass, lambda: manager.stores)
+    scheduler.async_start()
+    hass.data[DATA_RESET_SCHEDULER] = scheduler
 
-                if should_copy:
-                    shutil.copy(src_path, dest_path)
-                    _LOGGER.info(f"✅ Copied {filename} to {frontend_dest}")
+    @callback
+    def async_shutdown(event: Event) -> None:
+        scheduler.async_stop()
+        manager.leaderboard.async_shutdown()
 
-        _LOGGER.info("🎉 Chore Card frontend files copied successfully!")
-    except Exception as e:
-        _LOGGER.error(f"❌ Failed to copy Chore Card frontend files: {e}")
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_shutdown)
 
+    # ✅ One household leaderboard for all boards, owned by none of them
+    hass.async_create_task(
+        async_load_platform(hass, Platform.SENSOR, DOMAIN, {}, config)
+    )
 
-async def async_setup(hass: HomeAssistant, config: dict):
-    """Set up the Chore Card integration (global setup)."""
-    _LOGGER.info("🛠️ Setting up Chore Card integration (global setup)")
+    # ✅ Cards subscribe to board diffs instead of re-reading the sensor
+    async_register_websocket_commands(hass)
 
-    # ✅ Ensure frontend files exist on every Home Assistant startup
-    await hass.async_add_executor_job(ensure_directory, hass)
-    await hass.async_add_executor_job(copy_frontend_files, hass)
+    # ✅ History exports stream from the ledger, not from recorder attributes
+    hass.http.register_view(ChoreCardHistoryView)
 
+    manager.metrics.observe("setup.integration", (time.perf_counter() - start) * 1000)
     return True  # ✅ Ensure Home Assistant knows the setup was successful
 
 
@@ -70,7 +68,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Chore Card from a config entry."""
     _LOGGER.info(f"🔄 Setting up Chore Card integration for {entry.entry_id}")
 
-    hass.data.setdefault(DOMAIN, {})
+    from .install import async_ensure_frontend
+    from .store import ChoreCardStore
+
+    start = time.perf_counter()
+    manager = async_get_manager(hass)
+
+    # ✅ Reinstall the frontend if the last board was removed since startup
+    async_ensure_frontend(hass)
 
     # ✅ Retrieve stored sensor name and friendly name
     friendly_name = entry.title  # Friendly name (user-defined)
@@ -80,16 +85,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     _LOGGER.info(f"✅ Assigned Sensor: {sensor_name} (Friendly Name: {friendly_name})")
 
-    # ✅ Store the config entry
-    hass.data[DOMAIN][entry.entry_id] = {"sensor_name": sensor_name, **entry.data}
+    # ✅ Load the persisted board before any platform needs it
+    store = ChoreCardStore(hass, entry)
+    await store.async_load()
 
-    # ✅ Ensure frontend files exist
-    await hass.async_add_executor_job(ensure_directory, hass)
-    await hass.async_add_executor_job(copy_frontend_files, hass)
+    # ✅ Catch up on any reset missed while Home Assistant was down
+    store.async_reset_if_due(dt_util.now().date())
 
-    # ✅ Register frontend
-    frontend_registration = ChoreCardRegistration(hass)
-    await frontend_registration.async_register()
+    # ✅ Index the board by its config entry
+    manager.async_add_board(entry, store)
 
     # ✅ Check if rename is needed
     new_sensor_name = f"sensor.{friendly_name.lower().replace(' ', '_')}"
@@ -112,23 +116,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # ✅ Forward setup to the sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    _LOGGER.info("🎉 Chore Card Component Setup Completed")
+    # ✅ Apply options when the options flow saves them; a board's stored options
+    # are the result of the latest change, so they are not re-applied on setup
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+
+    elapsed = (time.perf_counter() - start) * 1000
+    manager.metrics.observe("setup.entry", elapsed)
+    _LOGGER.info("🎉 Chore Card Component Setup Completed in %.1f ms", elapsed)
 
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply new options to a running board without reloading it."""
+    store = async_get_manager(hass).async_get_board(entry.entry_id)
+    if store is not None and store.async_apply_options(entry.options):
+        _LOGGER.info(f"🎨 Applied new options to {entry.title}")
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Unload a config entry and remove all related resources if no instances remain."""
+    """Unload a config entry; the frontend stays installed for other boards."""
     _LOGGER.info(f"🔴 Unloading Chore Card integration for {entry.entry_id}")
 
-    def get_instance_count():
-        """Count the number of active instances of Chore Card."""
-        count = sum(
-            1 for e in hass.config_entries.async_entries(DOMAIN) if not e.disabled_by
-        )
-        _LOGGER.info(f"🔍 Active Chore Card instances remaining: {count}")
-        return count
-
     try:
         # ✅ Step 1: Remove sensor entity (if it exists)
         entity_id = f"sensor.{entry.entry_id}"
@@ -136,31 +145,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             hass.states.async_remove(entity_id)
             _LOGGER.info(f"✅ Removed sensor entity: {entity_id}")
 
-        # ✅ Step 2: Remove stored data
-        hass.data[DOMAIN].pop(entry.entry_id, None)
-        _LOGGER.info("✅ Removed stored data for this entry.")
-
-        # ✅ Step 3: If this is the last integration, remove frontend files
-        if get_instance_count() == 1 and "renaming" not in entry.data:
-            _LOGGER.info("🛑 Last instance removed. Cleaning up frontend resources.")
-
-            frontend_registration = ChoreCardRegistration(hass)
-            await frontend_registration.async_unregister()  # ✅ Unregister Lovelace
-            _LOGGER.info("✅ Unregistered Chore Card frontend.")
-
-            # ✅ Remove the frontend files from `/www/community/chore-card/`
-            frontend_dest = hass.config.path("www/community/chore-card")
+        # ✅ Step 2: Flush pending board changes; the stored board is kept
+        store = async_get_manager(hass).async_remove_board(entry.entry_id)
+        if store is not None:
+            await store.async_flush()
+        _LOGGER.info("✅ Saved the board for this entry.")
 
-            def remove_frontend_files():
-                """Delete the Chore Card frontend directory."""
-                if os.path.exists(frontend_dest):
-                    _LOGGER.info(f"🗑️ Removing frontend folder: {frontend_dest}")
-                    shutil.rmtree(frontend_dest, ignore_errors=True)
-
-            await hass.async_add_executor_job(remove_frontend_files)
-            _LOGGER.info("✅ Successfully removed frontend files.")
-
-        # ✅ Step 4: Unload platforms
+        # ✅ Step 3: Unload platforms
         unload_result = await hass.config_entries.async_unload_platforms(
             entry, PLATFORMS
         )
@@ -171,3 +162,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception as e:
         _LOGGER.error(f"❌ Error while unloading Chore Card: {e}")
         return False
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the persisted board when a config entry is removed."""
+    from .store import ChoreCardStore
+
+    await ChoreCardStore(hass, entry).async_remove()
+    _LOGGER.info(f"🗑️ Removed stored board for {entry.entry_id}")
+
+    # ✅ Remove the card's files and resource with the last board, not on unload,
+    # so reloading or disabling a board never leaves dashboards without the card
+    if not hass.config_entries.async_entries(DOMAIN):
+        from .frontend import ChoreCardRegistration
+
+        _LOGGER.info("🛑 Last instance removed. Cleaning up frontend resources.")
+        await ChoreCardRegistration(hass).async_unregister()
+        _LOGGER.info("✅ Unregistered Chore Card frontend.")
@@ -0,0 +1,228 @@
+"""Validation and normalization of a board's configuration.
+
+A board's configuration is its display options, its users and the
+definitions of its chores (everything except selections and points). It is
+validated once, when a card or the options flow saves it, and stored in
+canonical form: short day names, checked colours, weekly ``days`` as a list
+and defaults filled in. Results are cached by a hash of the input, so boards
+and cards that save the same configuration skip normalizing it again.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import hashlib
+import json
+import re
+from typing import Any
+
+import voluptuous as vol
+
+from .const import CHORE_SECTIONS, DEFAULT_OPTIONS
+from .encoding import DERIVED_CHORE_KEYS
+from .reset import normalize_day_name, split_day_names
+
+# Named colours, hex colours, CSS colour functions and custom properties
+COLOR_PATTERN = re.compile(
+    r"^(#(?:[0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})"
+    r"|[a-zA-Z]+"
+    r"|(?:rgba?|hsla?|hwb|lab|lch|oklab|oklch|color|var)\([^()]*(?:\([^()]*\))?\))$"
+)
+
+CONFIG_CACHE_SIZE = 64
+
+POINTS_POSITIONS = ("top", "bottom")
+
+# Points per chore or bonus; totals of many entries still fit the ledger
+MAX_POINTS = 100_000
+
+
+def color(value: Any) -> str:
+    """Validate a CSS colour."""
+    if not isinstance(value, str) or not COLOR_PATTERN.match(value.strip()):
+        raise vol.Invalid(f"Invalid colour: {value}")
+    return value.strip()
+
+
+def day_name(value: Any) -> str:
+    """Validate a day name and return its short form."""
+    short = normalize_day_name(value)
+    if short is None:
+        raise vol.Invalid(f"Invalid day name: {value}")
+    return short
+
+
+def day_names(value: Any) -> list[str]:
+    """Validate ``days`` given as a list or a comma-separated string."""
+    if isinstance(value, str):
+        value = split_day_names(value)
+    return [day_name(day) for day in vol.Schema(list)(value or [])]
+
+
+def points(value: Any) -> int:
+    """Validate the points of a chore or a bonus."""
+    return vol.All(vol.Coerce(int), vol.Range(min=-MAX_POINTS, max=MAX_POINTS))(
+        value
+    )
+
+
+def _unique_names(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    names = [item["name"] for item in items]
+    duplicates = {name for name in names if names.count(name) > 1}
+    if duplicates:
+        raise vol.Invalid(f"Duplicate names: {', '.join(sorted(duplicates))}")
+    return items
+
+
+USER_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): vol.All(str, vol.Strip, vol.Length(min=1)),
+        vol.Optional("background_color", default="transparent"): color,
+        vol.Optional("font_color", default="white"): color,
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+WEEK_OF_MONTH_SCHEMA = vol.Schema(
+    {
+        vol.Required("week"): vol.All(vol.Coerce(int), vol.Range(min=1, max=5)),
+        vol.Optional("highlight_color", default="red"): color,
+    }
+)
+
+_CHORE = {
+    vol.Required("name"): vol.All(str, vol.Strip, vol.Length(min=1)),
+    vol.Optional("points", default=0): points,
+}
+
+CHORE_SCHEMAS = {
+    "daily": vol.Schema(_CHORE, extra=vol.ALLOW_EXTRA),
+    "weekly": vol.Schema(
+        {**_CHORE, vol.Optional("days", default=list): day_names},
+        extra=vol.ALLOW_EXTRA,
+    ),
+    "monthly": vol.Schema(
+        {
+            **_CHORE,
+            vol.Optional("week_of_month"): vol.Any(None, WEEK_OF_MONTH_SCHEMA),
+            vol.Optional("max_days"): vol.Any(
+                None, vol.All(vol.Coerce(int), vol.Range(min=1, max=7))
+            ),
+        },
+        extra=vol.ALLOW_EXTRA,
+    ),
+}
+
+OPTIONS_SCHEMA = {
+    vol.Optional("first_day_of_week"): day_name,
+    vol.Optional("show_long_day_names"): bool,
+    vol.Optional("points_position"): vol.In(POINTS_POSITIONS),
+    vol.Optional("day_header_background_color"): color,
+    vol.Optional("day_header_font_color"): color,
+    vol.Optional("current_day_background_color"): color,
+    vol.Optional("current_day_font_color"): color,
+}
+
+OPTIONS_KEYS = [str(key) for key in OPTIONS_SCHEMA]
+
+BOARD_CONFIG_SCHEMA = vol.Schema(
+    {
+        **OPTIONS_SCHEMA,
+        vol.Optional("users"): vol.All([USER_SCHEMA], _unique_names),
+        vol.Optional("chores"): vol.Schema(
+            {
+                vol.Optional(section): vol.All(
+                    vol.Any(None, [CHORE_SCHEMAS[section]]), lambda value: value or []
+                )
+                for section in CHORE_SECTIONS
+            },
+            extra=vol.ALLOW_EXTRA,
+        ),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+
+def config_hash(config: dict[str, Any]) -> str:
+    """Stable hash of a configuration, independent of key order."""
+    encoded = json.dumps(config, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+def _chore_definition(chore: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: value
+        for key, value in chore.items()
+        if key != "selections" and key not in DERIVED_CHORE_KEYS
+    }
+
+
+def board_config(board: dict[str, Any]) -> dict[str, Any]:
+    """The canonical configuration of a board: options, users and chores."""
+    return {
+        **{key: board.get(key, default) for key, default in DEFAULT_OPTIONS.items()},
+        "users": board.get("users", []),
+        "chores": {
+            section: [
+                _chore_definition(chore)
+                for chore in (board.get("data") or {}).get(section) or []
+            ]
+            for section in CHORE_SECTIONS
+        },
+    }
+
+
+def validate_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Validate and normalize a configuration, reusing cached results.
+
+    The result is shared between callers, so it must not be changed.
+    """
+    key = config_hash(config)
+    normalized = _cache.get(key)
+    if normalized is None:
+        normalized = _cache[key] = BOARD_CONFIG_SCHEMA(config)
+        if len(_cache) > CONFIG_CACHE_SIZE:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(key)
+    return normalized
+
+
+def normalize_board_config(payload: dict[str, Any]) -> dict[str, Any]:
+    """Normalize the options, users and chore definitions of a board payload.
+
+    Only the configuration is validated (and cached); selections, points and
+    reset markers are carried over unchanged. Raises ``vol.Invalid`` for bad
+    configuration.
+    """
+    data = payload.get("data")
+    config = {key: payload[key] for key in OPTIONS_KEYS if key in payload}
+    if "users" in payload:
+        config["users"] = payload["users"]
+    if isinstance(data, dict):
+        config["chores"] = {
+            section: [
+                _chore_definition(chore) if isinstance(chore, dict) else chore
+                for chore in chores or []
+            ]
+            for section, chores in data.items()
+        }
+
+    normalized = validate_config(config)
+    result = {**payload, **normalized}
+    chores = result.pop("chores", None)
+    if chores is not None:
+        result["data"] = {
+            section: [
+                {**definition, "selections": chore.get("selections")}
+                if chore.get("selections") is not None
+                else dict(definition)
+                for definition, chore in zip(
+                    definitions, data.get(section) or [], strict=True
+                )
+            ]
+            for section, definitions in chores.items()
+        }
+    return result
@@ -0,0 +1,113 @@
+"""Calendar of scheduled chores for Chore Card boards."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .manager import async_get_manager
+
+if TYPE_CHECKING:
+    from .store import ChoreCardStore
+
+_LOGGER = logging.getLogger(__name__)
+
+# How far ahead to look for the next event shown as the entity's state
+LOOKAHEAD = timedelta(days=62)
+
+SECTION_NAMES = {"daily": "Daily", "weekly": "Weekly", "monthly": "Monthly"}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the chore calendar of a board."""
+    store = async_get_manager(hass).async_get_board(config_entry.entry_id)
+    async_add_entities([ChoreCardCalendar(config_entry, store)])
+
+
+def _calendar_event(entry_id: str, occurrence: dict[str, Any]) -> CalendarEvent:
+    description = f"{SECTION_NAMES[occurrence['section']]} chore"
+    if occurrence["points"]:
+        description += f", {occurrence['points']} points"
+    if occurrence["max_days"] and occurrence["max_days"] > 1:
+        description += f", up to {occurrence['max_days']} days"
+
+    return CalendarEvent(
+        start=occurrence["start"],
+        end=occurrence["end"],
+        summary=occurrence["chore"],
+        description=description,
+        uid=(
+            f"{entry_id}_{occurrence['section']}_{occurrence['row']}"
+            f"_{occurrence['start'].isoformat()}"
+        ),
+    )
+
+
+class ChoreCardCalendar(CalendarEntity):
+    """Chores of one board as all-day events, served from its recurrence index."""
+
+    _attr_should_poll = False
+    _attr_icon = "mdi:calendar-check"
+
+    def __init__(self, config_entry: ConfigEntry, store: ChoreCardStore):
+        """Initialize the calendar of one board."""
+        self.store = store
+        self._attr_name = f"{config_entry.title} Chores"
+        self._attr_unique_id = f"{config_entry.entry_id}_calendar"
+        self._config_hash: str | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Write state only when the schedule changes, not on every selection."""
+        self._config_hash = self.store.config[0]
+        self.async_on_remove(self.store.async_add_listener(self._async_board_updated))
+
+    @callback
+    def _async_board_updated(self) -> None:
+        config_hash = self.store.config[0]
+        if config_hash != self._config_hash:
+            self._config_hash = config_hash
+            self.async_write_ha_state()
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """The current or next scheduled chore."""
+        today = dt_util.now().date()
+        occurrences = self.store.occurrences(today, today + LOOKAHEAD)
+        if not occurrences:
+            return None
+        return _calendar_event(self.store.entry.entry_id, occurrences[0])
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Scheduled chores between two points in time."""
+        start = dt_util.as_local(start_date).date()
+        end = dt_util.as_local(end_date).date()
+        # Include the day `end_date` falls in unless it is exactly midnight
+        if dt_util.as_local(end_date).time() != datetime.min.time():
+            end += timedelta(days=1)
+
+        with self.store.metrics.timed("calendar.events"):
+            events = [
+                _calendar_event(self.store.entry.entry_id, occurrence)
+                for occurrence in self.store.occurrences(start, max(end, start))
+            ]
+        _LOGGER.debug(
+            "📅 %d chore events for %s between %s and %s",
+            len(events),
+            self.entity_id,
+            start,
+            end,
+        )
+        return events
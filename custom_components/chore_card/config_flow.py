@@ -7,14 +7,22 @@ import time
 import voluptuous as vol
 from homeassistant import config_entries
 
-from .frontend import ChoreCardRegistration
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from . import async_unload_entry  # ✅ Import from __init__.py
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import selector
 
 VERSION = 1
 _LOGGER = logging.getLogger(__name__)
-from .const import DOMAIN
+from .board_config import POINTS_POSITIONS, color
+from .const import CONF_WRITE_WINDOW, DEFAULT_OPTIONS, DEFAULT_WRITE_WINDOW, DOMAIN
+from .reset import SHORT_DAY_NAMES
+
+COLOR_OPTIONS = [
+    "day_header_background_color",
+    "day_header_font_color",
+    "current_day_background_color",
+    "current_day_font_color",
+]
 
 
 class ChoreCardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -22,6 +30,12 @@ class ChoreCardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry):
+        """Edit a board's display options."""
+        return ChoreCardOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None):
         """Handle the initial setup step for the Chore Card integration."""
         errors = {}
@@ -44,7 +58,9 @@ class ChoreCardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if entity_id in existing_entities:
                 errors["integration_name"] = "name_exists"
             else:
-                _LOGGER.info(f"✅ Creating Chore Card config entry: {integration_name} ({entity_id})")
+                _LOGGER.info(
+                    f"✅ Creating Chore Card config entry: {integration_name} ({entity_id})"
+                )
                 return self.async_create_entry(
                     title=integration_name,  # ✅ Exact user input as friendly name
                     data={"sensor_name": entity_id},  # ✅ Entity ID (fixed format)
@@ -62,12 +78,16 @@ class ChoreCardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle complete removal of Chore Card, includin`g frontend and Lovelace."""
         _LOGGER.info(f"🛑 Removing Chore Card config entry: {entry.entry_id}")
 
+        # Imported here so showing the config flow does not load the frontend
+        from .frontend import ChoreCardRegistration
+        from .manager import async_get_manager
+
         # ✅ Step 1: Unregister frontend
         frontend_registration = ChoreCardRegistration(hass)
         await frontend_registration.async_unregister()
 
         # ✅ Step 2: Remove stored data
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        async_get_manager(hass).async_remove_board(entry.entry_id)
 
         # ✅ Step 3: Remove frontend directory
         frontend_dest = hass.config.path("www/community/chore-card")
@@ -80,3 +100,72 @@ class ChoreCardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         await hass.async_add_executor_job(remove_frontend_files)
         _LOGGER.info("✅ Successfully removed frontend files.")
+
+
+class ChoreCardOptionsFlow(config_entries.OptionsFlow):
+    """Edit a board's display options; they are validated once, here."""
+
+    def __init__(self, config_entry: ConfigEntry):
+        """Keep the entry; OptionsFlow.config_entry is only set on newer cores."""
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input=None):
+        """Show and validate the options form."""
+        errors = {}
+
+        if user_input is not None:
+            for key in COLOR_OPTIONS:
+                try:
+                    user_input[key] = color(user_input[key])
+                except vol.Invalid:
+                    errors[key] = "invalid_color"
+
+            if not errors:
+                return self.async_create_entry(data=user_input)
+
+        from .manager import async_get_manager
+
+        # ✅ Start from the board's current options, which cards may have set
+        current = {**DEFAULT_OPTIONS, CONF_WRITE_WINDOW: DEFAULT_WRITE_WINDOW}
+        current.update(self._entry.options)
+        store = async_get_manager(self.hass).async_get_board(self._entry.entry_id)
+        if store is not None:
+            current.update(
+                {key: store.board[key] for key in DEFAULT_OPTIONS if key in store.board}
+            )
+        current.update(user_input or {})
+
+        schema = {
+            vol.Required(
+                "first_day_of_week", default=current["first_day_of_week"]
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(options=SHORT_DAY_NAMES)
+            ),
+            vol.Required(
+                "show_long_day_names", default=current["show_long_day_names"]
+            ): selector.BooleanSelector(),
+            vol.Required(
+                "points_position", default=current["points_position"]
+            ): selector.SelectSelector(
+                selector.SelectSelectorConfig(options=list(POINTS_POSITIONS))
+            ),
+            **{
+                vol.Required(key, default=current[key]): selector.TextSelector()
+                for key in COLOR_OPTIONS
+            },
+            vol.Required(
+                CONF_WRITE_WINDOW, default=current[CONF_WRITE_WINDOW]
+            ): selector.NumberSelector(
+                selector.NumberSelectorConfig(
+                    min=0,
+                    max=5,
+                    step=0.05,
+                    unit_of_measurement="s",
+                    mode=selector.NumberSelectorMode.BOX,
+                )
+            ),
+        }
+
+        return self.async_show_form(
+            step_id="init", data_schema=vol.Schema(schema), errors=errors
+        )
@@ -2,15 +2,49 @@ VERSION = "1.0.4"
 DOMAIN = "chore_card"
 URL_BASE = "/chore_card"
 
-CHORE_CARDS = [
-    {
-        "name": "Chore Card",
-        "filename": "chore-card.js",
-        "version": "1.0.0",
-    },
-    {
-        "name": "Chore Card Style Sheet",
-        "filename": "chore-card.css",
-        "version": "1.0.0",
-    },
-]
\ No newline at end of file
+# Frontend assets are versioned by a hash of their content
+FRONTEND_EXTENSIONS = (".js", ".css")
+FRONTEND_VERSION_FILE = ".version"
+DATA_FRONTEND_VERSION = f"{DOMAIN}_version"
+DATA_FRONTEND_INSTALL = f"{DOMAIN}_frontend_install"
+DATA_REGISTERED = f"{DOMAIN}_registered"
+
+STORAGE_VERSION = 1
+# Boards moved to the compact encoding (see encoding.py) in version 2
+BOARD_STORAGE_VERSION = 2
+STORAGE_KEY = DOMAIN
+SAVE_DELAY = 10
+
+# Board changes within this many seconds share one sensor state write
+CONF_WRITE_WINDOW = "write_window"
+DEFAULT_WRITE_WINDOW = 0.25
+
+CHORE_SECTIONS = ["daily", "weekly", "monthly"]
+
+# Bus events fired as boards change, small enough to filter on cheaply
+EVENT_CHORE_COMPLETED = f"{DOMAIN}_chore_completed"
+EVENT_POINTS_CHANGED = f"{DOMAIN}_points_changed"
+EVENT_RESET = f"{DOMAIN}_reset"
+
+DEFAULT_OPTIONS = {
+    "first_day_of_week": "Mon",
+    "show_long_day_names": False,
+    "points_position": "top",
+    "day_header_background_color": "blue",
+    "day_header_font_color": "white",
+    "current_day_background_color": "red",
+    "current_day_font_color": "white",
+}
+
+# The card historically saved its state with camelCase keys
+CAMEL_CASE_KEYS = {
+    "userPoints": "user_points",
+    "lastReset": "last_reset",
+    "firstDayOfWeek": "first_day_of_week",
+    "showLongDayNames": "show_long_day_names",
+    "pointsPosition": "points_position",
+    "dayHeaderBackgroundColor": "day_header_background_color",
+    "dayHeaderFontColor": "day_header_font_color",
+    "currentDayBackgroundColor": "current_day_background_color",
+    "currentDayFontColor": "current_day_font_color",
+}
@@ -0,0 +1,38 @@
+"""Diagnostics support for Chore Card."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+
+from .manager import async_get_manager
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return hot-path metrics and board sizes for a config entry."""
+    manager = async_get_manager(hass)
+    store = manager.async_get_board(entry.entry_id)
+    entity = manager.async_get_entity(entry.entry_id)
+
+    diagnostics: dict[str, Any] = {
+        "entry": {"title": entry.title, "data": dict(entry.data)},
+        "entity_id": entity.entity_id if entity is not None else None,
+        "integration_metrics": manager.metrics.as_dict(),
+    }
+
+    if store is not None:
+        diagnostics["board"] = {
+            "revision": store.revision,
+            "state": store.state,
+            "bytes": len(json_bytes(store.board)),
+            "summary": store.summary,
+            "ledger_entries": len(store.ledger),
+        }
+        diagnostics["board_metrics"] = store.metrics.as_dict()
+
+    return diagnostics
@@ -0,0 +1,120 @@
+"""Compact, versioned encoding of Chore Card boards.
+
+Boards are persisted and sent to subscribed cards as::
+
+    {
+        "v": 2,
+        "users": [{"name": "Alice"}, {"name": "Bob"}],
+        "names": [],
+        "points": [12, 4],
+        "chores": {
+            "daily": [{"name": "Dishes", "points": 5, "s": [1, 0, 2, 0, 0, 0, 0]}],
+        },
+        "last_reset": "2025-01-06",
+        ...
+    }
+
+Users are stored once. ``s`` holds one small integer per weekday: 0 for an
+empty cell, otherwise the 1-based index into ``users`` followed by ``names``
+(names that appear in selections or points but are no longer board users).
+``points`` follows the same order, with null for names that have no total.
+All remaining keys are the board's canonical snake_case keys.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+BOARD_FORMAT = 2
+
+# Chore keys the card derives while rendering; never worth storing
+DERIVED_CHORE_KEYS = {"highlightColor"}
+
+
+def encode_board(board: dict[str, Any]) -> dict[str, Any]:
+    """Encode a canonical board (see ``default_board``) compactly."""
+    users = board.get("users") or []
+    user_points = board.get("user_points") or {}
+    index = {}
+    for user in users:
+        index.setdefault(user.get("name"), len(index) + 1)
+    names: list[str] = []
+
+    def user_index(name: str) -> int:
+        position = index.get(name)
+        if position is None:
+            position = index[name] = len(index) + 1
+            names.append(name)
+        return position
+
+    chores: dict[str, list[dict[str, Any]]] = {}
+    for section, section_chores in (board.get("data") or {}).items():
+        encoded = chores[section] = []
+        for chore in section_chores or []:
+            compact = {
+                key: value
+                for key, value in chore.items()
+                if key != "selections" and key not in DERIVED_CHORE_KEYS
+            }
+            compact["s"] = [
+                user_index(selection) if selection else 0
+                for selection in chore.get("selections") or [None] * 7
+            ]
+            encoded.append(compact)
+
+    for name in user_points:
+        user_index(name)
+    points: list[int | None] = [None] * len(index)
+    for name, value in user_points.items():
+        points[index[name] - 1] = value
+
+    encoded_board = {
+        key: value
+        for key, value in board.items()
+        if key not in ("data", "users", "user_points")
+    }
+    encoded_board.update(
+        {
+            "v": BOARD_FORMAT,
+            "users": users,
+            "names": names,
+            "points": points,
+            "chores": chores,
+        }
+    )
+    return encoded_board
+
+
+def decode_board(encoded: dict[str, Any]) -> dict[str, Any]:
+    """Expand a board produced by ``encode_board``."""
+    users = encoded.get("users") or []
+    names = list(dict.fromkeys(user.get("name") for user in users))
+    names.extend(encoded.get("names") or [])
+    lookup = [None, *names]
+
+    data = {
+        section: [
+            {
+                **{key: value for key, value in chore.items() if key != "s"},
+                "selections": [
+                    lookup[position] for position in chore.get("s") or [0] * 7
+                ],
+            }
+            for chore in section_chores
+        ]
+        for section, section_chores in (encoded.get("chores") or {}).items()
+    }
+
+    user_points = {
+        name: value
+        for name, value in zip(names, encoded.get("points") or [], strict=False)
+        if value is not None
+    }
+
+    board = {
+        key: value
+        for key, value in encoded.items()
+        if key not in ("v", "users", "names", "points", "chores")
+    }
+    board.update({"data": data, "users": users, "user_points": user_points})
+    return board
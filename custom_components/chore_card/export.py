@@ -0,0 +1,127 @@
+"""Streaming CSV/NDJSON export of a board's completion history."""
+
+from __future__ import annotations
+
+import csv
+from datetime import date, timedelta
+from http import HTTPStatus
+import io
+import json
+import logging
+
+from aiohttp import web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .manager import async_get_manager
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rows buffered before each write to the response
+CHUNK_ROWS = 500
+
+# ``running_total`` sums the exported rows per user, starting at 0 at ``start``;
+# totals set by full-board updates are not ledger entries and are not included
+COLUMNS = ("timestamp", "chore", "user", "points", "running_total")
+
+CONTENT_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _parse_date(value: str | None) -> date | None:
+    if value is None:
+        return None
+    return date.fromisoformat(value)
+
+
+class ChoreCardHistoryView(HomeAssistantView):
+    """Stream ledger entries, oldest first, with each user's running total.
+
+    The running total covers the exported rows only; it is not the user's
+    current points.
+
+    ``GET /api/chore_card/<entity_id>/history`` accepts ``format`` (``csv``
+    or ``ndjson``), ``start`` and ``end`` (inclusive local dates) and any
+    number of ``user`` parameters. Rows are written in chunks straight from
+    the ledger, so memory use does not grow with the length of the history.
+    """
+
+    url = f"/api/{DOMAIN}/{{entity_id}}/history"
+    name = f"api:{DOMAIN}:history"
+
+    async def get(self, request: web.Request, entity_id: str) -> web.StreamResponse:
+        """Stream the history of one board."""
+        hass = request.app[KEY_HASS]
+        store = async_get_manager(hass).async_get_store(entity_id)
+        if store is None:
+            return self.json_message(f"{entity_id} not found", HTTPStatus.NOT_FOUND)
+
+        output = request.query.get("format", "csv")
+        if output not in CONTENT_TYPES:
+            return self.json_message(
+                "format must be csv or ndjson", HTTPStatus.BAD_REQUEST
+            )
+
+        try:
+            start_date = _parse_date(request.query.get("start"))
+            end_date = _parse_date(request.query.get("end"))
+        except ValueError:
+            return self.json_message(
+                "start and end must be YYYY-MM-DD dates", HTTPStatus.BAD_REQUEST
+            )
+
+        start = end = None
+        if start_date is not None:
+            start = dt_util.start_of_local_day(start_date).timestamp()
+        if end_date is not None:
+            next_day = dt_util.start_of_local_day(end_date + timedelta(days=1))
+            end = next_day.timestamp() - 1
+        users = set(request.query.getall("user", []))
+
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": CONTENT_TYPES[output],
+                "Content-Disposition": (
+                    f'attachment; filename="{entity_id}_history.{output}"'
+                ),
+            }
+        )
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer) if output == "csv" else None
+        if writer is not None:
+            writer.writerow(COLUMNS)
+
+        totals: dict[str, int] = {}
+        rows = 0
+        with store.metrics.timed("export.history"):
+            for timestamp, chore, user, points in store.ledger.entries(start, end):
+                if users and user not in users:
+                    continue
+
+                total = totals[user] = totals.get(user, 0) + points
+                when = dt_util.as_local(dt_util.utc_from_timestamp(timestamp))
+                row = (when.isoformat(), chore, user, points, total)
+                if writer is not None:
+                    writer.writerow(row)
+                else:
+                    buffer.write(json.dumps(dict(zip(COLUMNS, row, strict=True))))
+                    buffer.write("\n")
+
+                rows += 1
+                if rows % CHUNK_ROWS == 0:
+                    await response.write(buffer.getvalue().encode())
+                    buffer.seek(0)
+                    buffer.truncate()
+
+            await response.write(buffer.getvalue().encode())
+            await response.write_eof()
+
+        _LOGGER.debug("📤 Exported %d history rows for %s", rows, entity_id)
+        return response
@@ -1,71 +1,67 @@
 """Chore-Card Frontend"""
 
+import asyncio
 import logging
 import os
-import pathlib
 import shutil
 
 from homeassistant import core
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.start import async_at_started
 from homeassistant.components.http import StaticPathConfig
 
-from ..const import URL_BASE, CHORE_CARDS, DOMAIN
+from ..const import URL_BASE, DATA_FRONTEND_VERSION, DATA_REGISTERED, DOMAIN
+from ..manager import async_get_manager
+from ..metrics import ChoreCardMetrics
 
 _LOGGER = logging.getLogger(__name__)
 
+# Served from URL_BASE, which is cached and serves the precompressed siblings;
+# HACS_CARD_PATH is where older versions registered the card
+CARD_PATH = f"{URL_BASE}/chore-card.js"
+HACS_CARD_PATH = "/hacsfiles/chore-card/chore-card.js"
+
+DATA_REGISTRATION_LOCK = f"{DOMAIN}_registration_lock"
+
 
 class ChoreCardRegistration:
     def __init__(self, hass: core.HomeAssistant):
         self.hass = hass
 
+    @property
+    def _metrics(self) -> ChoreCardMetrics:
+        return async_get_manager(self.hass).metrics
+
+    @property
+    def _lock(self) -> asyncio.Lock:
+        return self.hass.data.setdefault(DATA_REGISTRATION_LOCK, asyncio.Lock())
+
     async def async_register(self):
-        """Register Chore Card frontend in Lovelace and remove old resources."""
+        """Register Chore Card frontend once per Home Assistant instance."""
+        async with self._lock:
+            if self.hass.data.get(DATA_REGISTERED):
+                _LOGGER.debug("Chore Card frontend already registered")
+                return
+            self.hass.data[DATA_REGISTERED] = True
+
         _LOGGER.info("🛠️ Registering Chore Card frontend in Lovelace")
 
         try:
-            # ✅ Step 1: Get the version from `manifest.json`
-            manifest_version = self.hass.data["integrations"][DOMAIN].manifest[
-                "version"
-            ]
-            self.hass.data["chore_card_version"] = manifest_version
+            # ✅ Step 1: Version resources by the installed frontend's content hash
+            if not self.hass.data.get(DATA_FRONTEND_VERSION):
+                self.hass.data[DATA_FRONTEND_VERSION] = self.hass.data[
+                    "integrations"
+                ][DOMAIN].manifest["version"]
 
             await self.async_register_chore_path()
 
             # ✅ Step 2: Only proceed if Lovelace is in "storage" mode
             if self.hass.data["lovelace"].mode == "storage":
-                await self.async_wait_for_lovelace_resources()
-
-                # ✅ Step 3: Remove any outdated or incorrect resource entries
-                resources = self.hass.data["lovelace"].resources
-                correct_url = f"/hacsfiles/chore-card/chore-card.js?v={manifest_version}"  # ✅ Correct versioned URL
-                incorrect_urls = [
-                    "/chore_card/chore-card.js?v=1.0.0",  # ❌ Old incorrect entry
-                    "/chore_card/chore-card.js",  # ❌ Any unversioned legacy entries
-                ]
-
-                # ✅ Remove any outdated resource entries
-                for resource in list(resources.async_items()):
-                    if resource["url"] in incorrect_urls:
-                        _LOGGER.info(
-                            f"🔄 Removing outdated resource entry: {resource['url']}"
-                        )
-                        await resources.async_delete_item(resource["id"])
-
-                # ✅ Prevent duplicate registrations
-                existing_urls = {res.get("url") for res in resources.async_items()}
-                if correct_url in existing_urls:
-                    _LOGGER.info(
-                        f"✅ Chore Card JavaScript already registered with version: {manifest_version}"
-                    )
-                    return
-
-                # ✅ Register the JavaScript file with version
-                await resources.async_create_item(
-                    {"res_type": "module", "url": correct_url}
-                )
-                _LOGGER.info(f"🎉 Chore Card JS Registered with version: {correct_url}")
+                # ✅ Step 3: Reconcile resources once Home Assistant has started
+                async_at_started(self.hass, self.async_register_chore_cards)
 
         except Exception as e:
+            # ✅ Let the next board setup try again
+            self.hass.data.pop(DATA_REGISTERED, None)
             _LOGGER.error(f"❌ Failed to register Chore Card frontend: {e}")
 
     # install card resources
@@ -77,117 +73,78 @@ class ChoreCardRegistration:
             )  # ✅ Correct path
 
             await self.hass.http.async_register_static_paths(
-                [StaticPathConfig(URL_BASE, frontend_path, False)]
+                [StaticPathConfig(URL_BASE, frontend_path, True)]
             )
 
             _LOGGER.debug("Registered chore-card path from %s", frontend_path)
         except RuntimeError:
             _LOGGER.debug("Chore-card static path already registered")
 
-    async def async_wait_for_lovelace_resources(self):
-        """Wait for Lovelace resources to load before registering cards."""
-        retries = 10  # ✅ Max retries to prevent infinite loop
-        delay = 5  # ✅ Wait time in seconds
-
-        async def check_lovelace_resources_loaded(now):
-            nonlocal retries
-            if retries <= 0:
-                _LOGGER.error(
-                    "Lovelace resources failed to load after multiple attempts."
-                )
-                return
+    async def async_register_chore_cards(self, _hass: core.HomeAssistant = None):
+        """Reconcile Lovelace resources to the single correct card URL."""
+        async with self._lock:
+            with self._metrics.timed("frontend.reconcile"):
+                await self._async_reconcile_resources()
+
+    async def _async_reconcile_resources(self):
+        """Keep exactly one card resource, with the current version."""
+        resources = self.hass.data["lovelace"].resources
+
+        # ✅ Load resources ourselves rather than polling until someone else does
+        if not resources.loaded:
+            await resources.async_load()
+            resources.loaded = True
+
+        version = self.hass.data[DATA_FRONTEND_VERSION]
+        correct_url = f"{CARD_PATH}?v={version}"  # ✅ Correct versioned URL
+        registered = False
+
+        # ✅ One pass: keep the first correct entry, drop every other card entry
+        for resource in list(resources.async_items()):
+            url = resource["url"]
+            path = self.get_resource_path(url)
+            if path not in (CARD_PATH, HACS_CARD_PATH):
+                continue
 
-            if self.hass.data["lovelace"].resources.loaded:
-                await self.async_register_chore_cards()
-            else:
-                _LOGGER.debug(
-                    "Lovelace resources not loaded yet, retrying in %d seconds...",
-                    delay,
-                )
-                retries -= 1
-                async_call_later(self.hass, delay, check_lovelace_resources_loaded)
-
-        await check_lovelace_resources_loaded(0)
-
-    async def async_register_chore_cards(self):
-        _LOGGER.debug("Installing Lovelace resources for chore-card cards")
-
-        # Get resources already registered
-        chore_card_resources = [
-            resource
-            for resource in self.hass.data["lovelace"].resources.async_items()
-            if resource["url"].startswith(URL_BASE)
-        ]
-
-        for card in CHORE_CARDS:
-            url = f"{URL_BASE}/{card.get('filename')}"
-
-            if not url.endswith(".js"):
-                _LOGGER.debug("Skipping non-JS file: %s", url)
+            if url == correct_url and not registered:
+                registered = True
                 continue
 
-            card_registered = False
-
-            for res in chore_card_resources:
-                if self.get_resource_path(res["url"]) == url:
-                    card_registered = True
-                    # check version
-                    if self.get_resource_version(res["url"]) != card.get("version"):
-                        # Update card version
-                        _LOGGER.debug(
-                            "Updating %s to version %s",
-                            card.get("name"),
-                            card.get("version"),
-                        )
-                        await self.hass.data["lovelace"].resources.async_update_item(
-                            res.get("id"),
-                            {
-                                "res_type": "module",
-                                "url": url + "?v=" + card.get("version"),
-                            },
-                        )
-                        # Remove old gzipped files
-                        await self.async_remove_gzip_files()
-                    else:
-                        _LOGGER.debug(
-                            "%s already registered as version %s",
-                            card.get("name"),
-                            card.get("version"),
-                        )
-
-            if not card_registered:
-                _LOGGER.debug(
-                    "Registering %s as version %s",
-                    card.get("name"),
-                    card.get("version"),
-                )
-                await self.hass.data["lovelace"].resources.async_create_item(
-                    {"res_type": "module", "url": url + "?v=" + card.get("version")}
-                )
+            _LOGGER.info(f"🔄 Removing outdated resource entry: {url}")
+            await resources.async_delete_item(resource["id"])
+
+        if registered:
+            _LOGGER.info(
+                f"✅ Chore Card JavaScript already registered with version: {version}"
+            )
+            return
+
+        # ✅ Register the JavaScript file with version
+        await resources.async_create_item(
+            {"res_type": "module", "url": correct_url}
+        )
+        _LOGGER.info(f"🎉 Chore Card JS Registered with version: {correct_url}")
 
     def get_resource_path(self, url: str):
         return url.split("?")[0]
 
-    def get_resource_version(self, url: str):
-        try:
-            return url.split("?")[1].replace("v=", "")
-        except Exception:
-            return 0
-
     async def async_unregister(self):
         """Remove Lovelace resources and frontend files when integration is removed."""
         _LOGGER.info("🗑️ Unregistering Chore Card frontend resources and files")
+        self.hass.data.pop(DATA_REGISTERED, None)
 
         if (
             "lovelace" in self.hass.data
             and self.hass.data["lovelace"].mode == "storage"
         ):
             resources = self.hass.data["lovelace"].resources
-            js_url = f"/hacsfiles/chore-card/chore-card.js?v={self.hass.data.get('chore_card_version', '2.0.0')}"
 
-            # ✅ Remove Lovelace resource
+            # ✅ Remove Lovelace resource, whatever version it was registered with
             for resource in list(resources.async_items()):
-                if resource["url"] == js_url:
+                if self.get_resource_path(resource["url"]) in (
+                    CARD_PATH,
+                    HACS_CARD_PATH,
+                ):
                     _LOGGER.warning(f"🚨 Removing Lovelace resource: {resource['url']}")
                     await resources.async_delete_item(resource["id"])
 
@@ -201,33 +158,3 @@ class ChoreCardRegistration:
                 shutil.rmtree(frontend_path, ignore_errors=True)
 
         await self.hass.async_add_executor_job(remove_frontend_files)
-
-    async def async_remove_gzip_files(self):
-        await self.hass.async_add_executor_job(self.remove_gzip_files)
-
-    def remove_gzip_files(self):
-        """Remove outdated gzip-compressed files."""
-        path = self.hass.config.path("www/community/chore-card")
-
-        if not os.path.exists(path):
-            _LOGGER.warning("Frontend path does not exist: %s", path)
-            return
-
-        try:
-            gzip_files = [
-                filename
-                for filename in os.listdir(path)
-                if filename and filename.endswith(".gz")
-            ]
-
-            for file in gzip_files:
-                original_file = file.replace(".gz", "")
-                original_file_path = os.path.join(path, original_file)
-
-                if os.path.exists(original_file_path) and os.path.getmtime(
-                    original_file_path
-                ) > os.path.getmtime(os.path.join(path, file)):
-                    _LOGGER.debug(f"Removing outdated gzip file: {file}")
-                    os.remove(os.path.join(path, file))
-        except Exception as e:
-            _LOGGER.error("Failed to remove gzip file: %s", e)
@@ -1,4 +1,41 @@
-const BASE_PATH = "/hacsfiles/chore-card/";
+const BASE_PATH = "/chore_card/";
+// Content hash the integration registered this module with (see `?v=`)
+const ASSET_VERSION = new URL(import.meta.url).searchParams.get("v");
+
+// ✅ Today's date as YYYY-MM-DD in the browser's local time
+function localDateString() {
+  const now = new Date();
+  const month = String(now.getMonth() + 1).padStart(2, "0");
+  const day = String(now.getDate()).padStart(2, "0");
+  return `${now.getFullYear()}-${month}-${day}`;
+}
+
+// ✅ Expand a compact board (format 2, see encoding.py) into the card's shape
+export function decodeBoard(encoded) {
+  if (!encoded || encoded.v !== 2) {
+    return encoded;
+  }
+
+  const { v, users = [], names = [], points = [], chores = {}, ...rest } = encoded;
+  const lookup = [null, ...new Set(users.map((user) => user.name)), ...names];
+
+  const data = {};
+  Object.entries(chores).forEach(([section, sectionChores]) => {
+    data[section] = sectionChores.map(({ s, ...chore }) => ({
+      ...chore,
+      selections: (s || Array(7).fill(0)).map((position) => lookup[position]),
+    }));
+  });
+
+  const userPoints = {};
+  lookup.slice(1).forEach((name, index) => {
+    if (points[index] !== null && points[index] !== undefined) {
+      userPoints[name] = points[index];
+    }
+  });
+
+  return { ...rest, data, users, user_points: userPoints };
+}
 
 export class ChoreCard extends HTMLElement {
   constructor() {
@@ -26,13 +63,22 @@ export class ChoreCard extends HTMLElement {
       this.userPoints = {}; // Default: no points tracked
       this.lastReset = null; // Default: no reset date
       this.lastSavedState = null; // Default: no saved state loaded
+      this.lastSavedJson = null; // Default: nothing saved yet
+      this.boardRevision = null; // Default: no board revision seen yet
+      this.view = null; // Default: no server view model yet
+      this.layoutKey = null; // Default: nothing built yet
+      this.renderedKey = null; // Default: nothing rendered yet
+      this.cells = new Map(); // Dropdowns keyed by "section:row:day"
+      this.scoreBadges = []; // Score badges in `users` order
       this.initialized = false; // Initialize as false
 
       // Placeholder for Home Assistant token
       this.haToken = null; // Default to null until hass is set
 
       // Dynamically resolve paths
-      this.cssPath = `${BASE_PATH}chore-card.css`;
+      this.cssPath = ASSET_VERSION
+        ? `${BASE_PATH}chore-card.css?v=${ASSET_VERSION}`
+        : `${BASE_PATH}chore-card.css`;
 
       // Initialize the card state and render
       this.initializeCard().catch((error) =>
@@ -107,7 +153,7 @@ export class ChoreCard extends HTMLElement {
         console.warn("Home Assistant instance not available; skipping state loading.");
     }
 
-    this.checkForReset();
+    // Resets are scheduled by the Chore Card integration in Home Assistant
     this.render();
   }
 
@@ -121,16 +167,8 @@ export class ChoreCard extends HTMLElement {
     // Ensure card ID is set and saved
     this.initializeCardId(config);
 
-    // Set configuration options with defaults
-    this.firstDayOfWeek = config.first_day_of_week || "Mon";
-    this.showLongDayNames = config.show_long_day_names || false;
-    this.pointsPosition = config.points_position || "top";
-    this.dayHeaderBackgroundColor =
-      config.day_header_background_color || "blue";
-    this.dayHeaderFontColor = config.day_header_font_color || "white";
-    this.currentDayBackgroundColor =
-      config.current_day_background_color || "red";
-    this.currentDayFontColor = config.current_day_font_color || "white";
+    // Display options come from the board in Home Assistant (applyBoardState);
+    // the YAML only seeds a new board (createDefaultState)
 
     console.log("Configuration set:", this.config);
 
@@ -176,7 +214,7 @@ export class ChoreCard extends HTMLElement {
 
             // ✅ Initialize card state from HA sensor (Avoid duplicating logic)
             const yamlData = this.config || {};
-            this.loadStateFromSensor(yamlData);
+            this.loadStateFromSensor(yamlData).then(() => this.subscribeToBoard());
 
             this.initialized = true;
         } catch (error) {
@@ -192,10 +230,93 @@ export class ChoreCard extends HTMLElement {
         this.entity = hass.states[this.config.entity];
     }
 
+    // ✅ The server's view model is per day; fetch a new one after midnight
+    if (this.view && this.viewFetchedOn !== localDateString()) {
+        this.loadView();
+    }
+
+    // ✅ Board changes arrive over the subscription; ignore unrelated entity updates
+    const sensorState = hass.states[`sensor.${this.cardId}`];
+    if (this.hasRendered && sensorState === this.sensorState) {
+        return;
+    }
+    this.sensorState = sensorState;
+    this.hasRendered = true;
+
     this.render();
     this.checkAndRegisterChoreCard(); // ✅ Ensure ID is registered only when necessary
   }
 
+  connectedCallback() {
+    if (this.initialized) {
+      this.subscribeToBoard();
+    }
+  }
+
+  disconnectedCallback() {
+    this.unsubscribeFromBoard();
+  }
+
+  async subscribeToBoard() {
+    if (this.boardSubscription || !this._hass?.connection) {
+      return;
+    }
+
+    this.boardRevision = null;
+    this.boardSubscription = this._hass.connection.subscribeMessage(
+      (message) => this.handleBoardMessage(message),
+      { type: "chore_card/subscribe", entity_id: `sensor.${this.cardId}` },
+    );
+
+    try {
+      await this.boardSubscription;
+    } catch (error) {
+      console.error(`❌ Failed to subscribe to Chore Card board: ${error}`);
+      this.boardSubscription = null;
+    }
+  }
+
+  async unsubscribeFromBoard() {
+    const subscription = this.boardSubscription;
+    this.boardSubscription = null;
+    if (subscription) {
+      try {
+        (await subscription)();
+      } catch (error) {
+        console.warn("Chore Card subscription already closed:", error);
+      }
+    }
+  }
+
+  handleBoardMessage(message) {
+    if (message.board) {
+      // ✅ Full snapshot (initial message, reset or full update)
+      const board = decodeBoard(message.board);
+      if (board.data && Object.keys(board.data).length > 0) {
+        this.applyBoardState(board);
+      }
+      // ✅ Schedules may have changed with the board
+      this.loadView();
+    } else if (this.boardRevision !== null && message.revision !== this.boardRevision + 1) {
+      // ✅ Missed a diff; resubscribe to get a fresh snapshot
+      console.warn("Chore Card board out of sync, resubscribing.");
+      this.unsubscribeFromBoard().then(() => this.subscribeToBoard());
+      return;
+    } else {
+      (message.cells || []).forEach((cell) => {
+        const chore = this.data[cell.section]?.[cell.row];
+        if (chore) {
+          chore.selections = chore.selections || Array(7).fill(null);
+          chore.selections[cell.day] = cell.user;
+        }
+      });
+      Object.assign(this.userPoints, message.user_points || {});
+    }
+
+    this.boardRevision = message.revision;
+    this.render();
+  }
+
   
   get hass() {
     return this._hass;
@@ -216,10 +337,22 @@ export class ChoreCard extends HTMLElement {
       await this.registerChoreCardEntity(newChoreCardId);
   }
 
+  // ✅ Ask the integration about one board instead of fetching every entity
+  async choreCardEntityExists(entityId) {
+      try {
+          await this.hass.callWS({ type: "chore_card/get", entity_id: entityId });
+          return true;
+      } catch (error) {
+          if (error.code === "not_found") {
+              return false;
+          }
+          throw error;
+      }
+  }
+
   async registerChoreCardEntity(entityId) {
       try {
-          const states = await this.hass.callWS({ type: "get_states" });
-          const entityExists = states.some(state => state.entity_id === entityId);
+          const entityExists = await this.choreCardEntityExists(entityId);
 
           if (!entityExists) {
               await this.hass.callService("chore_card", "create", { entity_id: entityId });
@@ -232,8 +365,7 @@ export class ChoreCard extends HTMLElement {
 
   async deleteChoreCardEntity(entityId) {
       try {
-          const states = await this.hass.callWS({ type: "get_states" });
-          const entityExists = states.some(state => state.entity_id === entityId);
+          const entityExists = await this.choreCardEntityExists(entityId);
 
           if (entityExists) {
               await this.hass.callService("chore_card", "delete", { entity_id: entityId });
@@ -247,10 +379,9 @@ export class ChoreCard extends HTMLElement {
   createDefaultState(yamlData) {
     console.log("Creating default state...");
 
-    // Set constructor variables directly from YAML or fallback to defaults
-    this.firstDayOfWeek = yamlData.first_day_of_week
-      ? this.normalizeDayName(yamlData.first_day_of_week)
-      : "Mon";
+    // Set constructor variables directly from YAML or fallback to defaults;
+    // Home Assistant validates and normalizes them when the board is saved
+    this.firstDayOfWeek = yamlData.first_day_of_week || "Mon";
     this.showLongDayNames = yamlData.show_long_day_names || false;
     this.pointsPosition = yamlData.points_position || "bottom";
     this.dayHeaderBackgroundColor =
@@ -263,23 +394,6 @@ export class ChoreCard extends HTMLElement {
     this.users = yamlData.users || []; // Default to empty array
     this.data = JSON.parse(JSON.stringify(yamlData.chores || {})); // Deep copy to make mutable
 
-    // Normalize `days` for weekly chores
-    if (this.data.weekly) {
-      this.data.weekly = this.data.weekly.map((chore) => {
-        return {
-          ...chore, // Clone the chore to avoid modifying frozen objects
-          days:
-            typeof chore.days === "string"
-              ? chore.days
-                  .split(",")
-                  .map((day) => this.normalizeDayName(day.trim()))
-              : Array.isArray(chore.days)
-                ? chore.days.map((day) => this.normalizeDayName(day.trim()))
-                : [],
-        };
-      });
-    }
-
     // Construct and return the default state object
     const defaultState = {
       cardId: this.cardId,
@@ -307,30 +421,90 @@ export class ChoreCard extends HTMLElement {
     }
 
     const sensorState = this._hass.states[`sensor.${this.cardId}`];
+    const board = sensorState ? await this.fetchBoardFromHomeAssistant() : null;
 
-    if (sensorState && sensorState.attributes) {
-        console.log("✅ Loaded sensor state:", sensorState.attributes);
-
-        // ✅ If data is empty, but YAML data exists, initialize with default
-        if (!sensorState.attributes.data || Object.keys(sensorState.attributes.data).length === 0) {
-            console.warn("⚠️ Sensor data is empty. Initializing from YAML...");
-            this.lastSavedState = this.createDefaultState(yamlData);
+    if (board && board.data && Object.keys(board.data).length > 0) {
+        // ✅ Use the stored board, options included
+        console.log("✅ Loaded board from Home Assistant:", board);
+        this.applyBoardState(board);
+        return;
+    }
 
-            // ✅ Save new default state to Home Assistant
-            await this.saveStateToHomeAssistant();
-        } else {
-            // ✅ Otherwise, use existing sensor data
-            this.lastSavedState = sensorState.attributes;
-        }
+    if (board) {
+        console.warn("⚠️ Sensor data is empty. Initializing from YAML...");
     } else {
         console.warn("⚠️ No sensor found, creating default.");
-        this.lastSavedState = this.createDefaultState(yamlData);
+    }
+    this.lastSavedState = this.createDefaultState(yamlData);
 
-        // ✅ Save new default state to Home Assistant
-        await this.saveStateToHomeAssistant();
+    // ✅ Save new default state to Home Assistant
+    await this.saveStateToHomeAssistant();
+
+    // ✅ Show the board as Home Assistant normalized and stored it
+    const saved = await this.fetchBoardFromHomeAssistant();
+    if (saved) {
+        this.applyBoardState(saved);
     }
   }
 
+  async loadView() {
+    if (this.viewRequest || !this._hass) {
+        return;
+    }
+
+    this.viewFetchedOn = localDateString();
+    this.viewRequest = this._hass
+        .callWS({ type: "chore_card/view", entity_id: `sensor.${this.cardId}` })
+        .then((view) => {
+            this.view = view;
+            this.layoutKey = null; // Schedules and highlights may have changed
+            this.render();
+        })
+        .catch((error) => {
+            console.error(`❌ Failed to load Chore Card view: ${error}`);
+        })
+        .finally(() => {
+            this.viewRequest = null;
+        });
+  }
+
+  async fetchBoardFromHomeAssistant() {
+    try {
+        const result = await this._hass.callWS({
+            type: "call_service",
+            domain: "chore_card",
+            service: "get_state",
+            service_data: { entity_id: `sensor.${this.cardId}` },
+            return_response: true,
+        });
+        return result.response;
+    } catch (error) {
+        console.error(`❌ Failed to load Chore Card board: ${error}`);
+        return null;
+    }
+  }
+
+  applyBoardState(board) {
+    this.lastSavedState = board;
+    this.data = board.data || {};
+    this.users = board.users || [];
+    this.userPoints = board.user_points || {};
+    this.lastReset = board.last_reset || null;
+    this.boardRevision = board.revision ?? this.boardRevision ?? null;
+
+    // ✅ Display options come from the board; Home Assistant already validated them
+    this.firstDayOfWeek = board.first_day_of_week ?? this.firstDayOfWeek;
+    this.showLongDayNames = board.show_long_day_names ?? this.showLongDayNames;
+    this.pointsPosition = board.points_position ?? this.pointsPosition;
+    this.dayHeaderBackgroundColor =
+      board.day_header_background_color ?? this.dayHeaderBackgroundColor;
+    this.dayHeaderFontColor = board.day_header_font_color ?? this.dayHeaderFontColor;
+    this.currentDayBackgroundColor =
+      board.current_day_background_color ?? this.currentDayBackgroundColor;
+    this.currentDayFontColor = board.current_day_font_color ?? this.currentDayFontColor;
+    this.invalidateRender();
+  }
+
   async saveStateToHomeAssistant() {
     if (!this._hass) {
         console.warn("Home Assistant instance not available.");
@@ -338,389 +512,71 @@ export class ChoreCard extends HTMLElement {
     }
 
     const entityId = `sensor.${this.cardId}`;
-    const currentState = this._hass.states[entityId]?.attributes;
-    
+
     const newState = {
-        cardId: this.cardId,
         data: this.data || {}, // Chore data
-        userPoints: this.userPoints || {}, // User points
-        lastReset: this.lastReset || null, // Last reset date
-        firstDayOfWeek: this.firstDayOfWeek, // Option
-        showLongDayNames: this.showLongDayNames, // Option
-        pointsPosition: this.pointsPosition, // Option
-        dayHeaderBackgroundColor: this.dayHeaderBackgroundColor, // Option
-        dayHeaderFontColor: this.dayHeaderFontColor, // Option
-        currentDayBackgroundColor: this.currentDayBackgroundColor,
-        currentDayFontColor: this.currentDayFontColor,
+        user_points: this.userPoints || {}, // User points
+        last_reset: this.lastReset || null, // Last reset date
+        first_day_of_week: this.firstDayOfWeek, // Option
+        show_long_day_names: this.showLongDayNames, // Option
+        points_position: this.pointsPosition, // Option
+        day_header_background_color: this.dayHeaderBackgroundColor, // Option
+        day_header_font_color: this.dayHeaderFontColor, // Option
+        current_day_background_color: this.currentDayBackgroundColor,
+        current_day_font_color: this.currentDayFontColor,
         users: this.users || [], // Users
     };
 
     // ✅ Avoid unnecessary updates if state hasn't changed
-    if (JSON.stringify(currentState) === JSON.stringify(newState)) {
+    const serialized = JSON.stringify(newState);
+    if (this.lastSavedJson === serialized) {
         console.log("No changes detected, skipping state save.");
         return;
     }
 
     try {
         console.log("Saving updated Chore Card state:", newState);
-        
-        await this._hass.callService("chore_card", "update", {
-            entity_id: entityId,
-            attributes: newState,
-        });
-
-        console.log(`✅ Successfully saved state for: ${entityId}`);
-    } catch (error) {
-        console.error(`❌ Failed to save Chore Card state: ${error}`);
-    }
-}
-
-
-
-  checkAndUpdateOptions(yamlData, savedState) {
-    console.log("Checking and updating options...");
-    const stateOptions = [
-      { yamlKey: "first_day_of_week", stateKey: "firstDayOfWeek" },
-      { yamlKey: "show_long_day_names", stateKey: "showLongDayNames" },
-      { yamlKey: "points_position", stateKey: "pointsPosition" },
-      {
-        yamlKey: "day_header_background_color",
-        stateKey: "dayHeaderBackgroundColor",
-      },
-      { yamlKey: "day_header_font_color", stateKey: "dayHeaderFontColor" },
-      {
-        yamlKey: "current_day_background_color",
-        stateKey: "currentDayBackgroundColor",
-      },
-      { yamlKey: "current_day_font_color", stateKey: "currentDayFontColor" },
-    ];
-
-    let optionsChanged = false;
-
-    console.log("Saved state before update:", savedState);
-
-    // Ensure savedState is initialized and has a valid structure
-    if (!savedState || typeof savedState !== "object") {
-      savedState = {}; // Initialize it as an empty object
-    }
-
-    console.log("Saved state after update:", savedState);
-
-    stateOptions.forEach(({ yamlKey, stateKey }) => {
-        let yamlValue = yamlData[yamlKey] !== undefined ? yamlData[yamlKey] : savedState[stateKey];
-        let savedValue = savedState[stateKey];
-
-        // Normalize `first_day_of_week`
-        if (stateKey === "firstDayOfWeek") {
-            yamlValue = yamlValue ? this.normalizeDayName(yamlValue) : "Mon";
-            savedValue = savedValue ? this.normalizeDayName(savedValue) : "Mon";
-        }
-
-        // Validate CSS colors for day header and font
-        if (
-            (stateKey === "dayHeaderBackgroundColor" || stateKey === "dayHeaderFontColor") &&
-            yamlValue !== undefined &&
-            !this.isValidCssColor(yamlValue)
-        ) {
-            console.warn(`Invalid CSS color for ${stateKey}: ${yamlValue}. Falling back to default.`);
-            yamlValue = stateKey === "dayHeaderBackgroundColor" ? "blue" : "white"; // Defaults
-        }
 
-        // Validate CSS colors for current day
-        if (
-            (stateKey === "currentDayBackgroundColor" || stateKey === "currentDayFontColor") &&
-            yamlValue !== undefined &&
-            !this.isValidCssColor(yamlValue)
-        ) {
-            console.warn(`Invalid CSS color for ${stateKey}: ${yamlValue}. Falling back to default.`);
-            yamlValue = stateKey === "currentDayBackgroundColor" ? "red" : "white"; // Defaults
+        const serviceData = { entity_id: entityId, attributes: newState };
+        // ✅ Name the revision we edited so the server can reject stale writes
+        if (this.boardRevision !== null && this.boardRevision !== undefined) {
+            serviceData.base_revision = this.boardRevision;
         }
 
-        // Only update if YAML provided a value different from the saved state
-        if (yamlValue !== undefined && yamlValue !== savedValue) {
-            console.log(`Option changed: ${stateKey} from ${savedValue} to ${yamlValue}`);
-            savedState[stateKey] = yamlValue; // Update the saved state with the YAML value
-            optionsChanged = true;
-        }
-
-        // Always update the constructor variables, but only if YAML provides a value
-        if (yamlValue !== undefined) {
-            this[stateKey] = yamlValue;
-        }
-    });
-
-
-    console.log(
-      "Options updated:",
-      this.firstDayOfWeek,
-      this.showLongDayNames,
-      this.pointsPosition,
-      this.dayHeaderBackgroundColor,
-      this.dayHeaderFontColor,
-      this.currentDayBackgroundColor,
-      this.currentDayFontColor,
-    );
-
-    return optionsChanged;
-  }
-
-  checkAndUpdateUsers(yamlData, savedState) {
-    console.log("Checking and updating users...");
-
-    const yamlUsers = yamlData.users || [];
-    const savedUsers = savedState.users || [];
-    const yamlUserMap = new Map(yamlUsers.map((user) => [user.name, user]));
-    const savedUserMap = new Map(savedUsers.map((user) => [user.name, user]));
-
-    let usersChanged = false;
-
-    // Handle removed users
-    for (let i = savedUsers.length - 1; i >= 0; i--) {
-      const savedUser = savedUsers[i];
-      if (!yamlUserMap.has(savedUser.name)) {
-        console.log(`User removed: ${savedUser.name}`);
-        savedUsers.splice(i, 1); // Remove user from savedUsers
-        delete savedState.userPoints[savedUser.name]; // Remove points for this user
-
-        // Clear associations in the chore grid
-        Object.values(savedState.data).forEach((choreList) => {
-          choreList.forEach((chore) => {
-            if (chore.selections) {
-              chore.selections = chore.selections.map((selection) =>
-                selection === savedUser.name ? null : selection,
-              );
-            }
-          });
-        });
-
-        usersChanged = true;
-      }
-    }
-
-    // Handle added or updated users
-    yamlUsers.forEach((yamlUser) => {
-      const savedUser = savedUserMap.get(yamlUser.name);
-
-      const validatedColor = this.isValidCssColor(yamlUser.background_color)
-        ? yamlUser.background_color
-        : "transparent";
-
-      const validatedFont = this.isValidCssColor(yamlUser.font_color)
-        ? yamlUser.font_color
-        : "white";
-
-      if (!savedUser) {
-        console.log(`Adding new user: ${yamlUser.name}`);
-        savedUsers.push({
-          name: yamlUser.name,
-          background_color: validatedColor,
-          font_color: validatedFont,
+        const result = await this._hass.callWS({
+            type: "call_service",
+            domain: "chore_card",
+            service: "update",
+            service_data: serviceData,
+            return_response: true,
         });
-        savedState.userPoints[yamlUser.name] = 0; // Initialize points for new user
-        usersChanged = true;
-      } else if (
-        savedUser.background_color !== validatedColor ||
-        savedUser.font_color != validatedFont
-      ) {
-        console.log(`Updating color for user: ${yamlUser.name}`);
-        const updatedUser = {
-          ...savedUser, // Clone existing user properties
-          background_color: validatedColor,
-          font_color: validatedFont
-        };
-
-        // Find and replace the user in savedUsers
-        const userIndex = savedUsers.findIndex(user => user.name === yamlUser.name);
-        if (userIndex !== -1) {
-          savedUsers[userIndex] = updatedUser; // Replace the frozen object
+        const { status } = result.response || {};
+
+        if (status === "conflict") {
+            // ✅ Another card changed the board first; take its version
+            console.warn("⚠️ Chore Card board changed elsewhere, reloading.");
+            const board = await this.fetchBoardFromHomeAssistant();
+            if (board) {
+                this.applyBoardState(board);
+                this.render();
+            }
+            return;
         }
-        usersChanged = true;
-      }
-    });
-
-    // Ensure the saved state and constructor values are synchronized
-    if (usersChanged || !this.users.length) {
-      console.log("Applying updated users to constructor...");
-      this.users = [...savedUsers]; // Update the constructor's users
-      savedState.users = [...savedUsers]; // Sync savedState users
-      this.userPoints = { ...savedState.userPoints }; // Sync points
-    }
 
-    console.log("Users updated:", this.users);
-    return usersChanged;
-  }
-
-  checkAndUpdateChores(yamlData, savedState) {
-    console.log("Checking and updating chores...");
-    
-    // If this.data is frozen, create a mutable copy
-    if (Object.isFrozen(this.data)) {
-        this.data = JSON.parse(JSON.stringify(this.data));
-        console.log("Created a mutable copy of this.data:", this.data);
+        this.lastSavedJson = serialized;
+        console.log(`✅ Saved state for ${entityId}: ${status}`);
+    } catch (error) {
+        console.error(`❌ Failed to save Chore Card state: ${error}`);
     }
+}
 
-    const choreSections = ["daily", "weekly", "monthly"];
-    let choresChanged = false;
-
-    // Ensure savedState.data exists and is mutable
-    savedState.data = savedState.data ? JSON.parse(JSON.stringify(savedState.data)) : {};
-
-    choreSections.forEach((section) => {
-        const yamlChores = yamlData.chores?.[section] || [];
-        savedState.data[section] = savedState.data[section] || []; // Ensure section exists
-        const savedChores = [...savedState.data[section]];
-
-        const yamlChoreMap = new Map(
-            yamlChores.map((chore) => [chore.name, chore]),
-        );
-        const savedChoreMap = new Map(
-            savedChores.map((chore) => [chore.name, chore]),
-        );
-
-        const updatedChores = [];
-
-        yamlChores.forEach((yamlChore) => {
-            const savedChore = savedChoreMap.get(yamlChore.name);
-
-            if (!savedChore) {
-                updatedChores.push({ ...yamlChore, selections: Array(7).fill(null) });
-                choresChanged = true;
-            } else {
-                let choreUpdated = false;
-
-                // Check and update points
-                if (yamlChore.points !== savedChore.points) {
-                    console.log(`Updating points for chore: ${yamlChore.name}`);
-                    savedChore.selections?.forEach((user) => {
-                        if (user) {
-                            savedState.userPoints[user] +=
-                                (yamlChore.points || 0) - (savedChore.points || 0);
-                        }
-                    });
-                    savedChore.points = yamlChore.points;
-                    choreUpdated = true;
-                }
-
-                // Normalize and check `days` for weekly chores
-                if (section === "weekly") {
-                    const normalizedDays =
-                        typeof yamlChore.days === "string"
-                            ? yamlChore.days
-                                  .split(",")
-                                  .map((day) => this.normalizeDayName(day.trim()))
-                            : Array.isArray(yamlChore.days)
-                            ? yamlChore.days.map((day) =>
-                                  this.normalizeDayName(day.trim()),
-                              )
-                            : [];
-                    if (
-                        JSON.stringify(normalizedDays) !== JSON.stringify(savedChore.days)
-                    ) {
-                        console.log(
-                            `Updating days for weekly chore: ${yamlChore.name} to ${normalizedDays}`,
-                        );
-                        savedChore.days = normalizedDays;
-                        savedChore.selections = Array(7).fill(null); // Reset selections
-                        choreUpdated = true;
-                    }
-                }
-
-                // Monthly-specific updates
-                if (section === "monthly") {
-                    if (
-                        yamlChore.week_of_month?.week !== savedChore.week_of_month?.week
-                    ) {
-                        console.log(
-                            `Week of month changed for monthly chore: ${yamlChore.name}`,
-                        );
-                        savedChore.selections = Array(7).fill(null);
-                        savedChore.week_of_month = { ...yamlChore.week_of_month };
-                        choreUpdated = true;
-                    }
-                    if (yamlChore.max_days !== savedChore.max_days) {
-                        console.log(
-                            `Max days changed for monthly chore: ${yamlChore.name}`,
-                        );
-                        if ((yamlChore.max_days || 0) < (savedChore.max_days || 0)) {
-                            savedChore.selections = Array(7).fill(null);
-                        }
-                        savedChore.max_days = yamlChore.max_days;
-                        choreUpdated = true;
-                    }
-                    if (
-                        yamlChore.week_of_month?.highlight_color !==
-                        savedChore.week_of_month?.highlight_color
-                    ) {
-                        const validatedHighlightColor = this.isValidCssColor(
-                            yamlChore.week_of_month.highlight_color,
-                        )
-                            ? yamlChore.week_of_month.highlight_color
-                            : "transparent";
-                        console.log(
-                            `Highlight color changed for monthly chore: ${yamlChore.name} to ${validatedHighlightColor}`,
-                        );
-                        savedChore.week_of_month.highlight_color =
-                            validatedHighlightColor;
-                        choreUpdated = true;
-                    }
-                }
-
-                if (choreUpdated) {
-                    choresChanged = true;
-                }
-                updatedChores.push(savedChore);
-            }
-        });
-
-        savedState.data[section] = updatedChores;
-
-        // Safely update `this.data`
-        this.data[section] = updatedChores;
-    });
-
-    console.log("Chores updated:", this.data);
-    return choresChanged;
-  }
-
-  normalizeDayName(dayName) {
-    if (!dayName || typeof dayName !== "string") {
-        console.warn("Invalid day name:", dayName);
-        return undefined;
-    }
 
-    const dayMap = {
-        sun: "Sun",
-        mon: "Mon",
-        tue: "Tue",
-        wed: "Wed",
-        thu: "Thu",
-        fri: "Fri",
-        sat: "Sat",
-        sunday: "Sun",
-        monday: "Mon",
-        tuesday: "Tue",
-        wednesday: "Wed",
-        thursday: "Thu",
-        friday: "Fri",
-        saturday: "Sat",
-    };
 
-    const normalizedDay = dayMap[dayName.toLowerCase()];
-    if (!normalizedDay) {
-        console.warn(`Invalid day name: ${dayName}`);
-        return undefined;
+  getOrderedDayIndexes() {
+    if (this.view) {
+      return this.view.days.map((day) => day.index);
     }
 
-    return normalizedDay;
-}
-
-  isValidCssColor(color) {
-    const s = new Option().style;
-    s.color = color;
-    return s.color !== "";
-  }
-
-  getOrderedDayIndexes() {
     const shortDays = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"];
     const longDays = [
       "Sunday",
@@ -778,79 +634,57 @@ export class ChoreCard extends HTMLElement {
     return -1; // Return -1 if day name is invalid
   }
 
-  async checkForReset() {
-    const today = new Date();
-    const todayDateString = today.toISOString().split("T")[0]; // Current date as a string
-    const firstDayOfWeekIndex = this.getDayIndex(this.firstDayOfWeek);
-    const todayIndex = today.getDay();
-
-    // Only reset on the first day of the week
-    if (todayIndex === firstDayOfWeekIndex) {
-      if (!this.lastReset || this.lastReset !== todayDateString) {
-        console.log(`Resetting chores for card: ${this.cardId}`);
-        await this.resetWeeklyChores(); // Reset weekly chores
-        this.lastReset = todayDateString; // Update last reset date
-      } else {
-        console.log("Already reset for today. No action taken.");
-      }
-    } else {
-      console.log(
-        `Not the first day of the week (${this.firstDayOfWeek}). No reset needed.`,
-      );
-    }
+  // ✅ Force the next render to patch the grid even if the revision is unchanged
+  invalidateRender() {
+    this.renderedKey = null;
   }
 
-  async resetWeeklyChores() {
-    console.log("Requesting manual chore reset...");
-
-    if (!this._hass) {
-        console.warn("Home Assistant instance not available.");
-        return;
-    }
-
-    try {
-        // Step 1: Call Home Assistant service to reset the sensor
-        await this._hass.callService("chore_card", "reset_weekly_chores", {
-            entity_id: `sensor.${this.cardId}`
-        });
-
-        console.log("Chore reset request sent to Home Assistant.");
-
-        // Step 2: Clear selections in the frontend as well (optional but recommended)
-        ["daily", "weekly", "monthly"].forEach((section) => {
-            if (this.data[section]) {
-                this.data[section].forEach((chore) => {
-                    chore.selections = Array(7).fill(null); // Reset selections
-                });
-            }
-        });
-
-        // Step 3: Reset user points locally
-        Object.keys(this.userPoints).forEach((user) => {
-            this.userPoints[user] = 0;
-        });
-
-        // Step 4: Update last reset timestamp
-        this.lastReset = new Date().toISOString();
+  // ✅ Everything that changes the grid's structure (not its selections or points)
+  getLayoutKey() {
+    return JSON.stringify([
+      this.firstDayOfWeek,
+      this.showLongDayNames,
+      this.pointsPosition,
+      this.dayHeaderBackgroundColor,
+      this.dayHeaderFontColor,
+      this.currentDayBackgroundColor,
+      this.currentDayFontColor,
+      this.view ? this.view.date : localDateString(),
+      this.users,
+      ["daily", "weekly", "monthly"].map((section) =>
+        this.data[section]
+          ? this.data[section].map((chore) => [chore.name, chore.week_of_month])
+          : null,
+      ),
+    ]);
+  }
 
-        // Step 5: Save updated state to Home Assistant
-        await this.saveStateToHomeAssistant();
+  render() {
+    const layoutKey = this.getLayoutKey();
+    const renderKey = `${layoutKey}|${this.boardRevision}`;
 
-        // Step 6: Re-render UI
-        console.log("Re-rendering card after reset.");
-        this.render();
-    } catch (error) {
-        console.error("Error resetting weekly chores:", error);
+    // ✅ Nothing changed since the last render
+    if (this.boardRevision !== null && renderKey === this.renderedKey) {
+      return;
     }
-  }
 
+    if (layoutKey !== this.layoutKey || !this.container) {
+      this.buildLayout();
+      this.layoutKey = layoutKey;
+    } else {
+      this.patchCells();
+      this.patchScores();
+    }
 
-  render() {
-    // Clear the existing content
-    this.shadowRoot.innerHTML = "";
+    this.renderedKey = renderKey;
+  }
 
-    // Attach styles dynamically
-    this.attachStyles();
+  // ✅ Build the whole grid; only needed when its structure changes
+  buildLayout() {
+    if (!this.stylesAttached) {
+      this.attachStyles();
+      this.stylesAttached = true;
+    }
 
     // Prepare the grid content
     const scorecard = this.renderScorecard();
@@ -889,8 +723,79 @@ export class ChoreCard extends HTMLElement {
     container.classList.add("container");
     container.innerHTML = gridContent;
 
-    // Append the container to the shadow DOM
-    this.shadowRoot.appendChild(container);
+    // Replace the previous grid, keeping the stylesheet
+    if (this.container) {
+      this.container.replaceWith(container);
+    } else {
+      this.shadowRoot.appendChild(container);
+    }
+    this.container = container;
+
+    // ✅ Index dropdowns and score badges so later renders can patch them
+    this.cells = new Map();
+    container.querySelectorAll("select.user-dropdown").forEach((element) => {
+      const { section, row, day } = element.dataset;
+      this.cells.set(`${section}:${row}:${day}`, {
+        element,
+        value: element.value,
+        disabled: element.disabled,
+      });
+    });
+
+    this.scoreBadges = [...container.querySelectorAll(".user-score strong")].map(
+      (element, index) => ({
+        element,
+        points: this.userPoints[this.users[index]?.name] || 0,
+      }),
+    );
+  }
+
+  // ✅ Update only the dropdowns whose selection or disabled state changed
+  patchCells() {
+    const orderedIndexes = this.getOrderedDayIndexes();
+    if (!orderedIndexes) return;
+
+    const currentWeekOfMonth = this.getCurrentWeekOfMonth();
+
+    ["daily", "weekly", "monthly"].forEach((section) => {
+      (this.data[section] || []).forEach((chore, rowIndex) => {
+        const isDisabled = this.getDisabledCallback(
+          section,
+          chore,
+          rowIndex,
+          currentWeekOfMonth,
+        );
+
+        orderedIndexes.forEach((dayIndex) => {
+          const cell = this.cells.get(`${section}:${rowIndex}:${dayIndex}`);
+          if (!cell) return;
+
+          const value = chore.selections?.[dayIndex] || "";
+          const disabled = isDisabled(dayIndex, value !== "");
+
+          if (cell.value !== value) {
+            cell.element.value = value;
+            cell.value = value;
+          }
+          if (cell.disabled !== disabled) {
+            cell.element.disabled = disabled;
+            cell.disabled = disabled;
+          }
+        });
+      });
+    });
+  }
+
+  // ✅ Update only the score badges whose points changed
+  patchScores() {
+    this.scoreBadges.forEach((badge, index) => {
+      const user = this.users[index];
+      const points = this.userPoints[user.name] || 0;
+      if (badge.points !== points) {
+        badge.element.textContent = `${user.name}: ${points}`;
+        badge.points = points;
+      }
+    });
   }
 
   renderWeekDays() {
@@ -911,7 +816,9 @@ export class ChoreCard extends HTMLElement {
           ]
         : ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"];
 
-    const currentDayIndex = new Date().getDay(); // Get current day index (0 = Sunday, 1 = Monday, etc.)
+    const currentDayIndex = this.view
+        ? this.view.days.find((day) => day.today)?.index
+        : new Date().getDay(); // Get current day index (0 = Sunday, 1 = Monday, etc.)
 
     const dayHeaders = orderedIndexes.map((index) => {
         const isCurrentDay = index === currentDayIndex;
@@ -990,20 +897,7 @@ export class ChoreCard extends HTMLElement {
 
     html += chores
       .map((chore, rowIndex) => {
-        console.log(`Processing chore: ${chore.name}`);        
-
-        // Use `days` instead of `day`
-        const specificDayIndexes =
-          Array.isArray(chore.days) && chore.days.length > 0
-            ? chore.days
-                .map((day) => {
-                  const dayIndex = this.getDayIndex(day.trim());                  
-                  return dayIndex;
-                })
-                .filter((index) => index !== -1) // Only valid indexes
-            : null;
-
-        console.log("Specific day indexes:", specificDayIndexes);
+        const specificDayIndexes = this.getWeeklyDayIndexes(chore, rowIndex);
 
         if (specificDayIndexes && specificDayIndexes.length === 0) {
           console.error(
@@ -1016,25 +910,7 @@ export class ChoreCard extends HTMLElement {
           rowIndex,
           "weekly",
           orderedIndexes,
-          (dayIndex, hasValue) => {    
-            // Disable all days except the specific ones if days are set
-            if (specificDayIndexes !== null) {
-              const isEnabled =
-                specificDayIndexes.includes(dayIndex) || hasValue;              
-              return !isEnabled;
-            }
-
-            // If no specific days are set, disable the row if a selection exists
-            const isRowDisabled =
-              chore.selections && chore.selections.some((sel) => sel);
-
-            console.log(
-              `Row for chore "${chore.name}" ${
-                isRowDisabled ? "disabled" : "enabled"
-              }`,
-            );
-            return isRowDisabled && !hasValue;
-          },
+          this.getDisabledCallback("weekly", chore, rowIndex),
         );
       })
       .join("");
@@ -1052,7 +928,6 @@ export class ChoreCard extends HTMLElement {
 
     html += chores
       .map((chore, rowIndex) => {
-        const maxDays = chore.max_days || 1;
         const isInCorrectWeek =
           chore.week_of_month &&
           chore.week_of_month.week === currentWeekOfMonth;
@@ -1067,15 +942,7 @@ export class ChoreCard extends HTMLElement {
           rowIndex,
           "monthly",
           orderedIndexes,
-          (dayIndex, hasValue) => {
-            const isMaxDaysReached =
-              chore.selections?.filter((sel) => sel).length >= maxDays;
-
-            return (
-              (isMaxDaysReached || (chore.week_of_month && !isInCorrectWeek)) &&
-              !hasValue
-            );
-          },
+          this.getDisabledCallback("monthly", chore, rowIndex, currentWeekOfMonth),
         );
       })
       .join("");
@@ -1083,6 +950,58 @@ export class ChoreCard extends HTMLElement {
     return html;
   }
 
+  // Weekly schedule: the server's when available, else from `days`
+  getWeeklyDayIndexes(chore, rowIndex) {
+    const rowView = this.view?.sections?.weekly?.[rowIndex];
+    if (rowView) {
+      return rowView.days;
+    }
+
+    return Array.isArray(chore.days) && chore.days.length > 0
+      ? chore.days
+          .map((day) => this.getDayIndex(day.trim()))
+          .filter((index) => index !== -1) // Only valid indexes
+      : null;
+  }
+
+  // Returns `(dayIndex, hasValue) => disabled` for one chore row
+  getDisabledCallback(section, chore, rowIndex, currentWeekOfMonth) {
+    if (section === "weekly") {
+      const specificDayIndexes = this.getWeeklyDayIndexes(chore, rowIndex);
+
+      return (dayIndex, hasValue) => {
+        // Disable all days except the specific ones if days are set
+        if (specificDayIndexes !== null) {
+          const isEnabled = specificDayIndexes.includes(dayIndex) || hasValue;
+          return !isEnabled;
+        }
+
+        // If no specific days are set, disable the row if a selection exists
+        const isRowDisabled =
+          chore.selections && chore.selections.some((sel) => sel);
+        return isRowDisabled && !hasValue;
+      };
+    }
+
+    if (section === "monthly") {
+      const maxDays = chore.max_days || 1;
+      const isInCorrectWeek =
+        chore.week_of_month && chore.week_of_month.week === currentWeekOfMonth;
+
+      return (dayIndex, hasValue) => {
+        const isMaxDaysReached =
+          chore.selections?.filter((sel) => sel).length >= maxDays;
+
+        return (
+          (isMaxDaysReached || (chore.week_of_month && !isInCorrectWeek)) &&
+          !hasValue
+        );
+      };
+    }
+
+    return () => false; // Daily chores have no disabling logic
+  }
+
   renderChoreRow(chore, rowIndex, section, orderedIndexes, isDisabledCallback) {
     return `
         <div class="chore-row">
@@ -1126,8 +1045,12 @@ export class ChoreCard extends HTMLElement {
   }
 
   getCurrentWeekOfMonth() {
+    if (this.view) {
+      return this.view.week_of_month;
+    }
+
     const now = new Date();
-    const firstDayOfWeek = this.normalizeDayName(this.firstDayOfWeek || "Monday"); // Default to Monday if not set
+    const firstDayOfWeek = this.firstDayOfWeek || "Mon"; // Default to Monday if not set
     const shortDays = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"];
     const firstDayIndex = shortDays.indexOf(firstDayOfWeek);
 
@@ -1192,6 +1115,36 @@ export class ChoreCard extends HTMLElement {
             `;
   }
 
+  async saveSelectionToHomeAssistant(section, rowIndex, dayIndex, user) {
+    if (!this._hass) {
+      console.warn("Home Assistant instance not available.");
+      return;
+    }
+
+    try {
+      const result = await this._hass.callWS({
+        type: "call_service",
+        domain: "chore_card",
+        service: "set_selection",
+        service_data: {
+          entity_id: `sensor.${this.cardId}`,
+          section: section,
+          row: rowIndex,
+          day: dayIndex,
+          user: user || null,
+        },
+        return_response: true,
+      });
+
+      // ✅ Use the server's point totals
+      this.userPoints = result.response.user_points;
+      this.invalidateRender();
+      this.render();
+    } catch (error) {
+      console.error(`❌ Failed to save chore selection: ${error}`);
+    }
+  }
+
   handleDropdownChange(event) {
     const dropdown = event.target;
     const section = dropdown.dataset.section;
@@ -1215,7 +1168,7 @@ export class ChoreCard extends HTMLElement {
     const previousValue = chore.selections[dayIndex];
 
     // No changes, exit early
-    if (previousValue === selectedValue) {
+    if ((previousValue || "") === selectedValue) {
       console.log(
         `No change detected for dayIndex: ${dayIndex}, section: ${section}, rowIndex: ${rowIndex}`,
       );
@@ -1223,28 +1176,22 @@ export class ChoreCard extends HTMLElement {
     }
 
     // Update the selection
-    chore.selections[dayIndex] = selectedValue;
+    chore.selections[dayIndex] = selectedValue || null;
 
-    // Adjust points for the previous user (if any)
+    // Optimistically adjust points; the server response is authoritative
     if (previousValue && this.userPoints[previousValue] !== undefined) {
       this.userPoints[previousValue] -= points;
-      if (this.userPoints[previousValue] < 0) {
-        this.userPoints[previousValue] = 0; // Prevent negative points
-      }
     }
-
-    // Adjust points for the new user (if any)
     if (selectedValue) {
       this.userPoints[selectedValue] =
         (this.userPoints[selectedValue] || 0) + points;
     }
 
-    console.log(`Updated Points:`, this.userPoints);
-
-    // Save the updated state to Home Assistant
-    this.saveStateToHomeAssistant();
+    // Send only this cell to Home Assistant
+    this.saveSelectionToHomeAssistant(section, rowIndex, dayIndex, selectedValue);
 
-    // Re-render the card to reflect updated scores
+    // Patch the row's dropdowns and the scores
+    this.invalidateRender();
     this.render();
   }
 }
@@ -0,0 +1,151 @@
+"""Install the Chore Card frontend files into ``www/community``."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import shutil
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DATA_FRONTEND_INSTALL,
+    DATA_FRONTEND_VERSION,
+    DATA_REGISTERED,
+    DOMAIN,
+    FRONTEND_EXTENSIONS,
+    FRONTEND_VERSION_FILE,
+)
+from .manager import async_get_manager
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip siblings are always written
+    brotli = None
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def ensure_directory(hass: HomeAssistant):
+    """Ensure the frontend destination directory exists (blocking)."""
+    frontend_dest = hass.config.path("www/community/chore-card")
+
+    if not os.path.exists(frontend_dest):
+        os.makedirs(frontend_dest, exist_ok=True)
+        _LOGGER.info(f"✅ Created frontend destination folder: {frontend_dest}")
+
+
+def hash_frontend_files(frontend_source: str) -> tuple[str, list[str]]:
+    """Return one content hash for all frontend assets and their file names."""
+    digest = hashlib.sha256()
+    filenames = sorted(
+        filename
+        for filename in os.listdir(frontend_source)
+        if filename.endswith(FRONTEND_EXTENSIONS)
+    )
+    for filename in filenames:
+        digest.update(filename.encode())
+        with open(os.path.join(frontend_source, filename), "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()[:12], filenames
+
+
+def installed_paths(frontend_dest: str, filenames: list[str]) -> list[str]:
+    """Every file an install writes: each asset and its precompressed siblings."""
+    suffixes = ("", ".gz", ".br") if brotli is not None else ("", ".gz")
+    return [
+        os.path.join(frontend_dest, f"{filename}{suffix}")
+        for filename in filenames
+        for suffix in suffixes
+    ]
+
+
+def copy_frontend_files(hass: HomeAssistant) -> str | None:
+    """Install the frontend files with precompressed siblings; return their hash.
+
+    Nothing is copied when the destination already holds the same content hash
+    and every file it needs, so deleted files are restored on the next start.
+    """
+    frontend_source = hass.config.path("custom_components/chore_card/frontend")
+    frontend_dest = hass.config.path("www/community/chore-card")
+    version_path = os.path.join(frontend_dest, FRONTEND_VERSION_FILE)
+
+    try:
+        if not os.path.exists(frontend_source):
+            _LOGGER.error(f"❌ Frontend source folder not found: {frontend_source}")
+            return None  # Prevent further execution if files are missing
+
+        content_hash, filenames = hash_frontend_files(frontend_source)
+
+        if os.path.exists(version_path) and all(
+            map(os.path.exists, installed_paths(frontend_dest, filenames))
+        ):
+            with open(version_path, encoding="utf-8") as file:
+                if file.read().strip() == content_hash:
+                    _LOGGER.debug(
+                        "Chore Card frontend %s already installed", content_hash
+                    )
+                    return content_hash
+
+        for filename in filenames:
+            src_path = os.path.join(frontend_source, filename)
+            dest_path = os.path.join(frontend_dest, filename)
+            shutil.copy(src_path, dest_path)
+
+            with open(src_path, "rb") as file:
+                content = file.read()
+            with open(f"{dest_path}.gz", "wb") as file:
+                file.write(gzip.compress(content, compresslevel=9, mtime=0))
+            if brotli is not None:
+                with open(f"{dest_path}.br", "wb") as file:
+                    file.write(brotli.compress(content))
+            _LOGGER.info(f"✅ Copied {filename} to {frontend_dest}")
+
+        with open(version_path, "w", encoding="utf-8") as file:
+            file.write(content_hash)
+
+        _LOGGER.info(f"🎉 Chore Card frontend {content_hash} installed successfully!")
+        return content_hash
+    except Exception as e:
+        _LOGGER.error(f"❌ Failed to copy Chore Card frontend files: {e}")
+        return None
+
+
+def install_frontend(hass: HomeAssistant) -> str | None:
+    """Create the destination folder and install the files (blocking)."""
+    ensure_directory(hass)
+    return copy_frontend_files(hass)
+
+
+async def async_install_frontend(hass: HomeAssistant) -> None:
+    """Install and register the frontend; runs once per boot in the background."""
+    # Imported here so config flows and platforms never load the http component
+    from .frontend import ChoreCardRegistration
+
+    metrics = async_get_manager(hass).metrics
+
+    with metrics.timed("frontend.install"):
+        hass.data[DATA_FRONTEND_VERSION] = await hass.async_add_executor_job(
+            install_frontend, hass
+        )
+
+    with metrics.timed("frontend.register"):
+        await ChoreCardRegistration(hass).async_register()
+
+
+@callback
+def async_ensure_frontend(hass: HomeAssistant) -> None:
+    """Start the background install unless it ran and is still registered.
+
+    Removing the last board unregisters the frontend, so a board added
+    afterwards (without a restart) installs it again.
+    """
+    task = hass.data.get(DATA_FRONTEND_INSTALL)
+    if task is not None and (not task.done() or hass.data.get(DATA_REGISTERED)):
+        return
+
+    hass.data[DATA_FRONTEND_INSTALL] = hass.async_create_background_task(
+        async_install_frontend(hass), f"{DOMAIN} frontend install"
+    )
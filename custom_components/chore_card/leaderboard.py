@@ -0,0 +1,147 @@
+"""Household leaderboard across all Chore Card boards."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+
+from .const import DEFAULT_WRITE_WINDOW
+
+if TYPE_CHECKING:
+    from .store import ChoreCardStore
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ChoreCardLeaderboard:
+    """Points per user name, summed over every loaded board.
+
+    Each board's contribution is remembered, so a board change is applied as
+    the difference for the users its diff names, O(changed users), instead of
+    summing every board again. Full snapshots (resets, structural changes)
+    are diffed against that board's contribution only.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self.totals: dict[str, int] = {}
+        self._contributions: dict[str, dict[str, int]] = {}
+        self._stores: dict[str, ChoreCardStore] = {}
+        self._unsubs: dict[str, Callable[[], None]] = {}
+        self._listeners: list[Callable[[], None]] = []
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=DEFAULT_WRITE_WINDOW,
+            immediate=False,
+            function=self._async_call_listeners,
+        )
+
+    @callback
+    def async_add_board(self, entry_id: str, store: ChoreCardStore) -> None:
+        """Start counting a board's points."""
+        self._stores[entry_id] = store
+        self._unsubs[entry_id] = store.async_subscribe(
+            partial(self._async_board_changed, entry_id)
+        )
+        self._async_apply(entry_id, store.board["user_points"], full=True)
+
+    @callback
+    def async_remove_board(self, entry_id: str) -> None:
+        """Stop counting a board's points and drop its contribution."""
+        unsub = self._unsubs.pop(entry_id, None)
+        if unsub is not None:
+            unsub()
+        self._stores.pop(entry_id, None)
+        self._async_apply(entry_id, {}, full=True)
+        self._contributions.pop(entry_id, None)
+
+    @callback
+    def _async_board_changed(self, entry_id: str, message: dict[str, Any]) -> None:
+        if "board" in message:
+            self._async_apply(
+                entry_id, self._stores[entry_id].board["user_points"], full=True
+            )
+        else:
+            self._async_apply(entry_id, message.get("user_points") or {}, full=False)
+
+    @callback
+    def _async_apply(
+        self, entry_id: str, user_points: dict[str, int], full: bool
+    ) -> None:
+        """Set a board's points for the given users (all of them when ``full``)."""
+        contribution = self._contributions.setdefault(entry_id, {})
+        changed = False
+
+        if full:
+            for user in contribution.keys() - user_points.keys():
+                self._async_add(user, -contribution.pop(user))
+                self._async_forget(user)
+                changed = True
+
+        for user, points in user_points.items():
+            delta = points - contribution.get(user, 0)
+            contribution[user] = points
+            if delta or user not in self.totals:
+                self._async_add(user, delta)
+                changed = True
+
+        if changed:
+            self._debouncer.async_schedule_call()
+
+    @callback
+    def _async_add(self, user: str, delta: int) -> None:
+        self.totals[user] = self.totals.get(user, 0) + delta
+
+    @callback
+    def _async_forget(self, user: str) -> None:
+        """Drop a user that no board counts any more."""
+        if not any(user in points for points in self._contributions.values()):
+            self.totals.pop(user, None)
+
+    @property
+    def ranking(self) -> list[dict[str, Any]]:
+        """Users by points, highest first."""
+        return [
+            {"user": user, "points": points}
+            for user, points in sorted(
+                self.totals.items(), key=lambda item: (-item[1], item[0])
+            )
+        ]
+
+    def as_dict(self) -> dict[str, Any]:
+        """The ranking plus each board's points, keyed by board sensor."""
+        boards = {}
+        for entry_id, points in self._contributions.items():
+            store = self._stores.get(entry_id)
+            if store is not None:
+                boards[store.entry.data.get("sensor_name", entry_id)] = dict(points)
+        return {"ranking": self.ranking, "boards": boards}
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Listen for changes of the totals. Returns a function to remove it."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_call_listeners(self) -> None:
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel a pending listener call; later changes are not announced."""
+        self._debouncer.async_shutdown()
@@ -0,0 +1,233 @@
+"""Append-only completion ledger for a Chore Card board."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date
+import heapq
+import logging
+from typing import Any, Iterator
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import SAVE_DELAY, STORAGE_KEY, STORAGE_VERSION
+from .metrics import ChoreCardMetrics
+from .reset import normalize_day_name, week_start
+
+_LOGGER = logging.getLogger(__name__)
+
+PERIODS = ("week", "month", "year")
+
+
+def period_keys(day: date, first_day_of_week: str | None) -> dict[str, str]:
+    """Return the week, month and year a day belongs to."""
+    return {
+        "week": week_start(day, first_day_of_week).isoformat(),
+        "month": day.strftime("%Y-%m"),
+        "year": str(day.year),
+    }
+
+
+class ChoreCardLedger:
+    """Completions stored as compact columns with running per-period totals.
+
+    Every assignment appends ``+points`` for the new user and every cleared or
+    reassigned cell appends ``-points`` for the previous one, so entries are
+    never rewritten and totals can always be rebuilt from the ledger. Weekly
+    totals are rebuilt that way when the board's first day of the week changes.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, metrics: ChoreCardMetrics
+    ):
+        self.hass = hass
+        self.metrics = metrics
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}.ledger"
+        )
+        self._strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+        self._timestamps = array("q")
+        self._chores = array("I")
+        self._users = array("I")
+        self._points = array("i")
+        self._totals: dict[tuple[str, str], dict[str, int]] = defaultdict(
+            lambda: defaultdict(int)
+        )
+        self._chore_points: dict[str, int] = defaultdict(int)
+        self._chore_completions: dict[str, int] = defaultdict(int)
+        # The week start the weekly totals are keyed by
+        self._first_day_of_week = "Mon"
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    async def async_load(self, first_day_of_week: str | None) -> None:
+        """Load the ledger from disk and rebuild its indexes."""
+        self._first_day_of_week = normalize_day_name(first_day_of_week) or "Mon"
+        stored = await self._store.async_load()
+        if not stored:
+            return
+
+        self._strings = stored["strings"]
+        self._string_ids = {value: index for index, value in enumerate(self._strings)}
+        self._timestamps = array("q", stored["timestamps"])
+        self._chores = array("I", stored["chores"])
+        self._users = array("I", stored["users"])
+        self._points = array("i", stored["points"])
+
+        for index in range(len(self._timestamps)):
+            self._index(index)
+        _LOGGER.debug("📒 Loaded %d ledger entries", len(self))
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        self.metrics.increment("ledger.flushes")
+        return {
+            "strings": self._strings,
+            "timestamps": self._timestamps.tolist(),
+            "chores": self._chores.tolist(),
+            "users": self._users.tolist(),
+            "points": self._points.tolist(),
+        }
+
+    async def async_flush(self) -> None:
+        """Write the ledger to disk immediately."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the persisted ledger."""
+        await self._store.async_remove()
+
+    def _intern(self, value: str) -> int:
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._string_ids[value] = len(self._strings)
+            self._strings.append(value)
+        return string_id
+
+    def _day(self, index: int) -> date:
+        return dt_util.as_local(
+            dt_util.utc_from_timestamp(self._timestamps[index])
+        ).date()
+
+    def _index(self, index: int) -> None:
+        chore = self._strings[self._chores[index]]
+        user = self._strings[self._users[index]]
+        points = self._points[index]
+
+        for period, key in period_keys(
+            self._day(index), self._first_day_of_week
+        ).items():
+            self._totals[(period, key)][user] += points
+        self._chore_points[chore] += points
+        self._chore_completions[chore] += 1 if points >= 0 else -1
+
+    def _use_first_day_of_week(self, first_day_of_week: str | None) -> None:
+        """Re-key the weekly totals when the board's week start changed."""
+        first_day = normalize_day_name(first_day_of_week) or "Mon"
+        if first_day == self._first_day_of_week:
+            return
+
+        self._first_day_of_week = first_day
+        for period_key in [key for key in self._totals if key[0] == "week"]:
+            del self._totals[period_key]
+        for index in range(len(self)):
+            key = week_start(self._day(index), first_day).isoformat()
+            self._totals[("week", key)][
+                self._strings[self._users[index]]
+            ] += self._points[index]
+        self.metrics.increment("ledger.week_rebuilds")
+        _LOGGER.debug("📒 Re-keyed weekly totals to weeks starting %s", first_day)
+
+    @callback
+    def async_append(
+        self,
+        chore: str,
+        user: str,
+        points: int,
+        first_day_of_week: str | None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Record a completion (or, with negative points, its reversal)."""
+        self.async_append_many([(chore, user, points)], first_day_of_week, timestamp)
+
+    @callback
+    def async_append_many(
+        self,
+        entries: list[tuple[str, str, int]],
+        first_day_of_week: str | None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Record ``(chore, user, points)`` entries; all of them or none."""
+        if not entries:
+            return
+        try:
+            points = array("i", [entry[2] for entry in entries])
+        except OverflowError as err:
+            raise HomeAssistantError(f"Points out of range: {err}") from err
+
+        if timestamp is None:
+            timestamp = dt_util.utcnow().timestamp()
+        # Keep timestamps ordered so date ranges can be bisected
+        if self._timestamps and timestamp < self._timestamps[-1]:
+            timestamp = self._timestamps[-1]
+
+        self._use_first_day_of_week(first_day_of_week)
+        first = len(self)
+        for chore, user, _ in entries:
+            self._timestamps.append(int(timestamp))
+            self._chores.append(self._intern(chore))
+            self._users.append(self._intern(user))
+        self._points.extend(points)
+        for index in range(first, len(self)):
+            self._index(index)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def points(
+        self, user: str, period: str, day: date, first_day_of_week: str | None
+    ) -> int:
+        """Points a user earned in the week, month or year containing ``day``."""
+        self._use_first_day_of_week(first_day_of_week)
+        key = period_keys(day, first_day_of_week)[period]
+        return self._totals.get((period, key), {}).get(user, 0)
+
+    def totals(
+        self, period: str, day: date, first_day_of_week: str | None
+    ) -> dict[str, int]:
+        """Points per user in the week, month or year containing ``day``."""
+        self._use_first_day_of_week(first_day_of_week)
+        key = period_keys(day, first_day_of_week)[period]
+        return dict(self._totals.get((period, key), {}))
+
+    def top_chores(self, limit: int = 5) -> list[dict[str, Any]]:
+        """The chores that earned the most points overall."""
+        return [
+            {
+                "chore": chore,
+                "points": points,
+                "completions": self._chore_completions[chore],
+            }
+            for chore, points in heapq.nlargest(
+                limit, self._chore_points.items(), key=lambda item: item[1]
+            )
+        ]
+
+    def entries(
+        self, start: float | None = None, end: float | None = None
+    ) -> Iterator[tuple[int, str, str, int]]:
+        """Yield ``(timestamp, chore, user, points)`` between two timestamps."""
+        first = 0 if start is None else bisect_left(self._timestamps, int(start))
+        last = len(self) if end is None else bisect_right(self._timestamps, int(end))
+        for index in range(first, last):
+            yield (
+                self._timestamps[index],
+                self._strings[self._chores[index]],
+                self._strings[self._users[index]],
+                self._points[index],
+            )
@@ -0,0 +1,159 @@
+"""Central index of Chore Card boards, config entries and entities."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+from .leaderboard import ChoreCardLeaderboard
+from .metrics import ChoreCardMetrics
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.entity import Entity
+
+    from .store import ChoreCardStore
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_manager(hass: HomeAssistant) -> ChoreCardManager:
+    """Return the Chore Card manager, creating it on first use."""
+    manager = hass.data.get(DOMAIN)
+    if manager is None:
+        manager = hass.data[DOMAIN] = ChoreCardManager(hass)
+    return manager
+
+
+class ChoreCardManager:
+    """Resolves boards by config entry or entity ID in O(1)."""
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self.metrics = ChoreCardMetrics()
+        self.leaderboard = ChoreCardLeaderboard(hass)
+        self._entries: dict[str, ConfigEntry] = {}
+        self._boards: dict[str, ChoreCardStore] = {}
+        self._entities: dict[str, Entity] = {}
+        self._entity_ids: dict[str, str] = {}
+        # Diff subscribers per board, with their unsubscribe from its store
+        self._subscribers: dict[
+            str, dict[Callable[[dict[str, Any]], None], Callable[[], None]]
+        ] = {}
+
+    @property
+    def stores(self) -> list[ChoreCardStore]:
+        """All loaded boards."""
+        return list(self._boards.values())
+
+    @callback
+    def async_add_board(self, entry: ConfigEntry, store: ChoreCardStore) -> None:
+        """Index a loaded board by its config entry."""
+        self._entries[entry.entry_id] = entry
+        self._boards[entry.entry_id] = store
+        self.leaderboard.async_add_board(entry.entry_id, store)
+
+        # ✅ Move subscribers over to a reloaded board, starting with a snapshot
+        subscribers = self._subscribers.get(entry.entry_id, {})
+        for diff_callback in subscribers:
+            subscribers[diff_callback] = store.async_subscribe(diff_callback)
+            diff_callback({"revision": store.revision, **store.snapshot})
+
+    @callback
+    def async_remove_board(self, entry_id: str) -> ChoreCardStore | None:
+        """Drop a board and its entity from every index."""
+        self._entries.pop(entry_id, None)
+        self.leaderboard.async_remove_board(entry_id)
+        entity = self._entities.pop(entry_id, None)
+        if entity is not None:
+            self._entity_ids.pop(entity.entity_id, None)
+        return self._boards.pop(entry_id, None)
+
+    @callback
+    def async_subscribe(
+        self, entry_id: str, diff_callback: Callable[[dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        """Receive a board's diffs, across reloads, until unsubscribed."""
+        subscribers = self._subscribers.setdefault(entry_id, {})
+        subscribers[diff_callback] = self._boards[entry_id].async_subscribe(
+            diff_callback
+        )
+
+        @callback
+        def unsubscribe() -> None:
+            subscribers.pop(diff_callback)()
+            if not subscribers:
+                self._subscribers.pop(entry_id, None)
+
+        return unsubscribe
+
+    @callback
+    def async_register_entity(self, entry_id: str, entity: Entity) -> None:
+        """Index a board's sensor, replacing any previous entity ID in place."""
+        previous = self._entities.get(entry_id)
+        if previous is not None and previous.entity_id != entity.entity_id:
+            self._entity_ids.pop(previous.entity_id, None)
+            _LOGGER.debug(
+                "🔄 Board %s renamed %s → %s",
+                entry_id,
+                previous.entity_id,
+                entity.entity_id,
+            )
+        self._entities[entry_id] = entity
+        self._entity_ids[entity.entity_id] = entry_id
+
+    @callback
+    def async_unregister_entity(self, entry_id: str, entity: Entity) -> None:
+        """Forget a board's sensor if it is still the indexed one."""
+        if self._entities.get(entry_id) is entity:
+            del self._entities[entry_id]
+            self._entity_ids.pop(entity.entity_id, None)
+
+    @callback
+    def async_get_entry(self, entry_id: str) -> ConfigEntry | None:
+        """Return the config entry of a loaded board."""
+        return self._entries.get(entry_id)
+
+    @callback
+    def async_get_board(self, entry_id: str) -> ChoreCardStore | None:
+        """Return the board of a config entry."""
+        return self._boards.get(entry_id)
+
+    @callback
+    def async_get_entry_id(self, entity_id: str) -> str | None:
+        """Return the config entry ID of the board behind a sensor."""
+        return self._entity_ids.get(entity_id)
+
+    @callback
+    def async_get_entity(self, entry_id: str) -> Entity | None:
+        """Return the sensor of a board."""
+        return self._entities.get(entry_id)
+
+    @callback
+    def async_get_store(self, entity_id: str) -> ChoreCardStore | None:
+        """Return the board behind a sensor, or None."""
+        entry_id = self._entity_ids.get(entity_id)
+        return None if entry_id is None else self._boards.get(entry_id)
+
+    @callback
+    def async_list_boards(self) -> list[tuple[ConfigEntry, Entity, ChoreCardStore]]:
+        """Return every loaded board that has a sensor, in setup order."""
+        return [
+            (self._entries[entry_id], entity, self._boards[entry_id])
+            for entry_id, entity in self._entities.items()
+            if entry_id in self._boards
+        ]
+
+    @callback
+    def async_require_store(self, entity_id: str) -> ChoreCardStore:
+        """Return the board behind a sensor, raising if there is none."""
+        store = self.async_get_store(entity_id)
+        if store is None:
+            raise HomeAssistantError(f"Chore Card {entity_id} not found")
+        return store
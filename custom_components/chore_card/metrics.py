@@ -0,0 +1,93 @@
+"""Lightweight counters and timing histograms for Chore Card hot paths."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+import time
+from typing import Any, Iterator
+
+# Upper bounds in milliseconds; the last bucket catches everything slower
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000)
+
+
+class Histogram:
+    """Fixed-bucket histogram; recording is O(log buckets) and allocation free."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        self.counts[bisect_left(BUCKETS_MS, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction: float) -> float | None:
+        """Upper bound of the bucket holding the given percentile."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return BUCKETS_MS[index] if index < len(BUCKETS_MS) else self.max
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Summary suitable for diagnostics."""
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else None,
+            "p50": self.percentile(0.5),
+            "p99": self.percentile(0.99),
+            "max": round(self.max, 3),
+            "buckets": dict(
+                zip([*map(str, BUCKETS_MS), "inf"], self.counts, strict=True)
+            ),
+        }
+
+
+class ChoreCardMetrics:
+    """Counters and histograms keyed by name (e.g. ``service.set_selection``)."""
+
+    def __init__(self) -> None:
+        self.counters: dict[str, int] = defaultdict(int)
+        self.histograms: dict[str, Histogram] = defaultdict(Histogram)
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Add to a counter."""
+        self.counters[name] += value
+
+    def observe(self, name: str, value: float) -> None:
+        """Record a value (milliseconds or bytes) in a histogram."""
+        self.histograms[name].observe(value)
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        """Count a call and record how long it took in milliseconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.counters[name] += 1
+            self.histograms[name].observe((time.perf_counter() - start) * 1000)
+
+    def as_dict(self) -> dict[str, Any]:
+        """All counters and histogram summaries."""
+        return {
+            "counters": dict(self.counters),
+            "histograms": {
+                name: histogram.as_dict()
+                for name, histogram in self.histograms.items()
+            },
+        }
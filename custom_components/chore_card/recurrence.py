@@ -0,0 +1,153 @@
+"""Recurrence index of a Chore Card board's schedule.
+
+Chores repeat on fixed rules: daily chores every day, weekly chores on their
+``days`` (or once at any time in the week), monthly chores in their
+``week_of_month`` (or at any time in the month). The index expands those
+rules one month at a time into occurrences sorted by start date, and keeps
+the expanded months until the board's configuration changes. Range queries
+then bisect the cached months instead of expanding every chore again.
+
+Occurrences are all-day ranges: ``start`` is inclusive and ``end`` exclusive.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Any
+
+from .const import CHORE_SECTIONS
+from .metrics import ChoreCardMetrics
+from .reset import week_start
+from .view import day_indexes
+
+# Months kept per board: three years of agenda views
+MONTH_CACHE_SIZE = 36
+
+# Longest occurrence that can start before the month it overlaps: a week
+MAX_LEAD = timedelta(days=6)
+
+
+def _next_month(first: date) -> date:
+    return (first + timedelta(days=32)).replace(day=1)
+
+
+def _occurrence(
+    start: date, days: int, section: str, row: int, chore: dict[str, Any]
+) -> dict[str, Any]:
+    return {
+        "start": start,
+        "end": start + timedelta(days=days),
+        "section": section,
+        "row": row,
+        "chore": chore.get("name"),
+        "points": chore.get("points") or 0,
+        "max_days": (chore.get("max_days") or 1) if section == "monthly" else None,
+    }
+
+
+def expand_month(config: dict[str, Any], first: date) -> list[dict[str, Any]]:
+    """Occurrences that start in the month beginning on ``first``."""
+    next_first = _next_month(first)
+    first_day_of_week = config.get("first_day_of_week")
+    month_days = [
+        first + timedelta(days=offset) for offset in range((next_first - first).days)
+    ]
+
+    # Weeks that belong to this month start on its first `first_day_of_week`
+    first_week = week_start(first + MAX_LEAD, first_day_of_week)
+    week_starts = [
+        start
+        for start in (first_week + timedelta(weeks=week) for week in range(5))
+        if start < next_first
+    ]
+
+    occurrences = []
+    chores = config.get("chores") or {}
+    for section in CHORE_SECTIONS:
+        for row, chore in enumerate(chores.get(section) or []):
+            if section == "daily":
+                occurrences.extend(
+                    _occurrence(day, 1, section, row, chore) for day in month_days
+                )
+
+            elif section == "weekly":
+                indexes = day_indexes(chore.get("days"))
+                if indexes:
+                    occurrences.extend(
+                        _occurrence(day, 1, section, row, chore)
+                        for day in month_days
+                        if (day.weekday() + 1) % 7 in indexes
+                    )
+                else:
+                    occurrences.extend(
+                        _occurrence(start, 7, section, row, chore)
+                        for start in week_starts
+                    )
+
+            elif section == "monthly":
+                schedule = chore.get("week_of_month")
+                if not schedule:
+                    occurrences.append(
+                        _occurrence(first, len(month_days), section, row, chore)
+                    )
+                elif 1 <= schedule.get("week", 0) <= len(week_starts):
+                    occurrences.append(
+                        _occurrence(
+                            week_starts[schedule["week"] - 1], 7, section, row, chore
+                        )
+                    )
+
+    occurrences.sort(key=lambda occurrence: occurrence["start"])
+    return occurrences
+
+
+class ChoreCardRecurrence:
+    """Per-month cache of a board's occurrences, keyed by its config hash."""
+
+    def __init__(self, metrics: ChoreCardMetrics):
+        self.metrics = metrics
+        self._hash: str | None = None
+        # first of month -> (start ordinals, occurrences), both sorted
+        self._months: OrderedDict[date, tuple[list[int], list[dict[str, Any]]]] = (
+            OrderedDict()
+        )
+
+    def _month(
+        self, config: dict[str, Any], first: date
+    ) -> tuple[list[int], list[dict[str, Any]]]:
+        month = self._months.get(first)
+        if month is None:
+            self.metrics.increment("recurrence.months")
+            occurrences = expand_month(config, first)
+            month = self._months[first] = (
+                [occurrence["start"].toordinal() for occurrence in occurrences],
+                occurrences,
+            )
+            if len(self._months) > MONTH_CACHE_SIZE:
+                self._months.popitem(last=False)
+        else:
+            self._months.move_to_end(first)
+        return month
+
+    def occurrences(
+        self, config_hash: str, config: dict[str, Any], start: date, end: date
+    ) -> list[dict[str, Any]]:
+        """Occurrences overlapping ``[start, end)``, ordered by start."""
+        if config_hash != self._hash:
+            self._hash = config_hash
+            self._months.clear()
+
+        result = []
+        first = (start - MAX_LEAD).replace(day=1)
+        while first < end:
+            starts, occurrences = self._month(config, first)
+            stop = bisect_left(starts, end.toordinal())
+            result.extend(
+                occurrence
+                for occurrence in occurrences[:stop]
+                if occurrence["end"] > start
+            )
+            first = _next_month(first)
+        return result
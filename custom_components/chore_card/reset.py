@@ -0,0 +1,94 @@
+"""Scheduled weekly and monthly resets for Chore Card boards."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+SHORT_DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+LONG_DAY_NAMES = [
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+]
+
+
+def normalize_day_name(day_name: str | None) -> str | None:
+    """Normalize a short or long day name to its short form (e.g. ``Mon``)."""
+    if not isinstance(day_name, str):
+        return None
+    lowered = day_name.strip().lower()
+    for index, long_name in enumerate(LONG_DAY_NAMES):
+        if lowered in (long_name, long_name[:3]):
+            return SHORT_DAY_NAMES[index]
+    return None
+
+
+def split_day_names(days: Any) -> list[Any]:
+    """A weekly chore's ``days`` as a list; strings may be comma-separated."""
+    if isinstance(days, str):
+        return [day for day in days.split(",") if day.strip()]
+    return list(days or [])
+
+
+def week_start(today: date, first_day_of_week: str | None) -> date:
+    """Return the most recent first day of the week on or before ``today``."""
+    first_day = normalize_day_name(first_day_of_week) or "Mon"
+    offset = (today.weekday() - SHORT_DAY_NAMES.index(first_day)) % 7
+    return today - timedelta(days=offset)
+
+
+def parse_reset_date(value: str | None) -> date | None:
+    """Parse a stored reset marker, accepting both dates and ISO timestamps."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+class ChoreCardResetScheduler:
+    """Resets every board from a single midnight listener."""
+
+    def __init__(self, hass: HomeAssistant, get_stores: Callable[[], Iterable]):
+        self.hass = hass
+        self._get_stores = get_stores
+        self._unsub: Callable[[], None] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start the midnight listener (once per Home Assistant instance)."""
+        if self._unsub is None:
+            self._unsub = async_track_time_change(
+                self.hass, self._async_handle_midnight, hour=0, minute=0, second=0
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the midnight listener."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_handle_midnight(self, now: datetime) -> None:
+        """Reset all boards whose week or month rolled over."""
+        today = dt_util.as_local(now).date()
+        reset = [
+            store for store in self._get_stores() if store.async_reset_if_due(today)
+        ]
+        if reset:
+            _LOGGER.info("🔄 Reset %d Chore Card board(s) for %s", len(reset), today)
@@ -1,14 +1,203 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import timedelta
 import logging
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
 
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .board_config import points
+from .const import CHORE_SECTIONS, DOMAIN
+from .manager import ChoreCardManager, async_get_manager
+from .reset import parse_reset_date
+
+if TYPE_CHECKING:
+    from .store import ChoreCardStore
 
 LOGGER = logging.getLogger(__name__)
 
+# Only the optional diagnostic sensor polls
+SCAN_INTERVAL = timedelta(minutes=1)
+
+UPDATE_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("state", default="active"): cv.string,
+        vol.Optional("attributes", default=dict): dict,
+        vol.Optional("base_revision"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    }
+)
+
+SET_SELECTION_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("section"): vol.In(CHORE_SECTIONS),
+        vol.Required("row"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Required("day"): vol.All(vol.Coerce(int), vol.Range(min=0, max=6)),
+        vol.Optional("user"): vol.Any(None, cv.string),
+    }
+)
+
+_CELL = {
+    vol.Required("section"): vol.In(CHORE_SECTIONS),
+    vol.Required("row"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Required("day"): vol.All(vol.Coerce(int), vol.Range(min=0, max=6)),
+}
+
+BATCH_OPERATION_SCHEMAS = {
+    "assign": vol.Schema(
+        {vol.Required("op"): "assign", **_CELL, vol.Required("user"): cv.string}
+    ),
+    "clear": vol.Schema({vol.Required("op"): "clear", **_CELL}),
+    "add_points": vol.Schema(
+        {
+            vol.Required("op"): "add_points",
+            vol.Required("user"): cv.string,
+            vol.Required("points"): points,
+            vol.Optional("reason"): cv.string,
+        }
+    ),
+    "add_chore": vol.Schema(
+        {
+            vol.Required("op"): "add_chore",
+            vol.Required("section"): vol.In(CHORE_SECTIONS),
+            vol.Required("chore"): vol.Schema(
+                {
+                    vol.Required("name"): cv.string,
+                    vol.Optional("points", default=0): points,
+                },
+                extra=vol.ALLOW_EXTRA,
+            ),
+        }
+    ),
+    "remove_chore": vol.Schema(
+        {
+            vol.Required("op"): "remove_chore",
+            vol.Required("section"): vol.In(CHORE_SECTIONS),
+            vol.Required("row"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        }
+    ),
+    "add_user": vol.Schema(
+        {
+            vol.Required("op"): "add_user",
+            vol.Required("user"): vol.Schema(
+                {vol.Required("name"): cv.string}, extra=vol.ALLOW_EXTRA
+            ),
+        }
+    ),
+    "remove_user": vol.Schema(
+        {vol.Required("op"): "remove_user", vol.Required("user"): cv.string}
+    ),
+}
+
+
+def _batch_operation(value):
+    """Validate one apply_batch operation against the schema for its op."""
+    if not isinstance(value, dict) or value.get("op") not in BATCH_OPERATION_SCHEMAS:
+        raise vol.Invalid(f"op must be one of {', '.join(BATCH_OPERATION_SCHEMAS)}")
+    return BATCH_OPERATION_SCHEMAS[value["op"]](value)
+
+
+APPLY_BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Required("operations"): vol.All(cv.ensure_list, [_batch_operation]),
+    }
+)
+
+
+def _instrumented(
+    manager: ChoreCardManager,
+    service: str,
+    handler: Callable[[ServiceCall], ServiceResponse],
+) -> Callable[[ServiceCall], ServiceResponse]:
+    """Count, time and size calls to a service, per board when one is named."""
+
+    @callback
+    def instrumented_handler(call: ServiceCall) -> ServiceResponse:
+        store = manager.async_get_store(call.data.get("entity_id"))
+        metrics = store.metrics if store is not None else manager.metrics
+        metrics.observe(f"payload_bytes.{service}", len(json_bytes(call.data)))
+        with metrics.timed(f"service.{service}"):
+            return handler(call)
+
+    return instrumented_handler
+
+
+@callback
+def _async_track_user_sensors(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    store: ChoreCardStore,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Keep one points sensor per board user as users come and go."""
+    registry = er.async_get(hass)
+    prefix = f"{config_entry.entry_id}_points_"
+    sensors: dict[str, ChoreCardUserPointsSensor] = {}
+
+    @callback
+    def async_sync_users() -> None:
+        users = {user.get("name") for user in store.board["users"]} - {None}
+
+        added = [
+            ChoreCardUserPointsSensor(config_entry, store, name)
+            for name in users - sensors.keys()
+        ]
+        for sensor in added:
+            sensors[sensor.user] = sensor
+        if added:
+            async_add_entities(added)
+
+        for name in sensors.keys() - users:
+            sensor = sensors.pop(name)
+            if sensor.registry_entry is not None:
+                registry.async_remove(sensor.entity_id)
+            else:
+                hass.async_create_task(sensor.async_remove())
+
+    # Drop sensors of users removed while Home Assistant was not running
+    users = {user.get("name") for user in store.board["users"]}
+    for entry in er.async_entries_for_config_entry(registry, config_entry.entry_id):
+        if entry.unique_id.startswith(prefix) and (
+            entry.unique_id.removeprefix(prefix) not in users
+        ):
+            registry.async_remove(entry.entity_id)
+
+    async_sync_users()
+    config_entry.async_on_unload(store.async_add_listener(async_sync_users))
+
+
+async def async_setup_platform(
+    hass: HomeAssistant,
+    config: ConfigType,
+    async_add_entities: AddEntitiesCallback,
+    discovery_info: DiscoveryInfoType | None = None,
+) -> None:
+    """Set up the household leaderboard, which belongs to no single board."""
+    if discovery_info is None:
+        return
+    async_add_entities([ChoreCardLeaderboardSensor(async_get_manager(hass))])
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -19,96 +208,182 @@ async def async_setup_entry(
     entity_id = config_entry.data["sensor_name"]  # ✅ Ensure entity ID comes from config entry
     LOGGER.info(f"Setting up Chore Card sensor: {entity_id}")
 
-    # Check if this is a rename operation by looking for an existing entity with the same ID
-    existing_entity = next(
-        (
-            entity
-            for entity in hass.data[DOMAIN].values()
-            if entity.entity_id == f"sensor.{config_entry.data['previous_sensor_name']}"
-        ),
-        None,
-    )
+    manager = async_get_manager(hass)
+    store = manager.async_get_board(config_entry.entry_id)
 
     # Create a new sensor with the new entity ID
-    sensor = ChoreCardSensor(hass, config_entry)
-
-    # If renaming, copy over attributes and remove the old entity
-    if existing_entity:
-        sensor._attr_state = existing_entity.state
-        sensor._attr_extra_state_attributes = existing_entity.extra_state_attributes
+    sensor = ChoreCardSensor(hass, config_entry, store)
 
+    # If renaming, the board lives in the store so only the old entity needs removing
+    previous_sensor_name = config_entry.data.get("previous_sensor_name")
+    if previous_sensor_name and hass.states.get(f"sensor.{previous_sensor_name}"):
         LOGGER.info(
-            f"🔄 Renaming Chore Card sensor from {existing_entity.entity_id} → {sensor.entity_id}"
+            f"🔄 Renaming Chore Card sensor from sensor.{previous_sensor_name} → {sensor.entity_id}"
         )
 
         # Remove old entity
-        hass.states.async_remove(existing_entity.entity_id)
-        del hass.data[DOMAIN][existing_entity.entity_id]
-
-    # Add the new sensor
-    async_add_entities([sensor], True)
+        hass.states.async_remove(f"sensor.{previous_sensor_name}")
 
-    # ✅ Ensure DOMAIN exists in hass.data
-    hass.data.setdefault(DOMAIN, {})[entity_id] = sensor
-    LOGGER.info(f"✅ Stored sensor in hass.data: {entity_id}")
+    # Add the new sensor; it indexes itself in the manager once added
+    async_add_entities([sensor, ChoreCardDiagnosticSensor(config_entry, store)], True)
 
-    LOGGER.info(f"✅ Storing sensor {entity_id} in hass.data[DOMAIN]")
-    hass.data[DOMAIN][entity_id] = sensor  # ✅ Store sensor properly
-    LOGGER.info(f"📌 Stored sensors in hass.data[DOMAIN]: {list(hass.data[DOMAIN].keys())}")
+    # ✅ Numeric per-user sensors feed long-term statistics
+    _async_track_user_sensors(hass, config_entry, store, async_add_entities)
 
     # ✅ Register service only if it doesn't exist
     if not hass.services.has_service(DOMAIN, "update"):
 
         @callback
-        def handle_update_state(call):
+        def handle_update_state(call: ServiceCall) -> ServiceResponse:
             """Handle updates from the frontend."""
-            entity_id = call.data.get("entity_id")
-            new_state = call.data.get("state", "active")
-            new_attributes = call.data.get("attributes", {})
-
-            LOGGER.info(f"🛠️ Received service call for {entity_id}")
+            entity_id = call.data["entity_id"]
+            store = manager.async_get_store(entity_id)
 
-            stored_sensors = hass.data.get(DOMAIN, {})
-            LOGGER.info(f"📌 Currently stored sensors: {list(stored_sensors.keys())}")
+            if store is None:
+                LOGGER.warning("⚠️ Chore Card %s not found. Cannot update.", entity_id)
+                return {"status": "not_found", "revision": None}
 
-            sensor = stored_sensors.get(entity_id)
-
-            if sensor:
-                if sensor.state != new_state or sensor.extra_state_attributes != new_attributes:
-                    LOGGER.info(
-                        f"🔄 Updating {entity_id} - State: {new_state}, Attributes: {new_attributes}"
-                    )
-                    sensor.async_set_state(new_state, new_attributes)
-                else:
-                    LOGGER.info(f"✅ No change detected for {entity_id}, skipping update.")
+            result = store.async_update(
+                call.data["state"],
+                call.data["attributes"],
+                call.data.get("base_revision"),
+            )
+            if result["status"] == "conflict":
+                LOGGER.debug(
+                    "⚠️ Rejected stale update for %s (base %s, current %s)",
+                    entity_id,
+                    call.data.get("base_revision"),
+                    result["revision"],
+                )
             else:
-                LOGGER.warning(f"⚠️ Entity {entity_id} not found in hass.data. Cannot update.")
+                LOGGER.debug("✅ Update for %s: %s", entity_id, result["status"])
+            return result
 
-        hass.services.async_register(DOMAIN, "update", handle_update_state)
+        hass.services.async_register(
+            DOMAIN,
+            "update",
+            _instrumented(manager, "update", handle_update_state),
+            schema=UPDATE_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
         LOGGER.info("✅ Registered service: chore_card.update")
 
+    # ✅ Let the card read the full board without it living in the state machine
+    if not hass.services.has_service(DOMAIN, "get_state"):
+
+        @callback
+        def handle_get_state(call: ServiceCall) -> ServiceResponse:
+            """Return the full board for a Chore Card sensor."""
+            return manager.async_require_store(call.data.get("entity_id")).as_dict()
+
+        hass.services.async_register(
+            DOMAIN,
+            "get_state",
+            _instrumented(manager, "get_state", handle_get_state),
+            supports_response=SupportsResponse.ONLY,
+        )
+        LOGGER.info("✅ Registered service: chore_card.get_state")
+
+    # ✅ Per-cell updates so the card never has to send the whole board
+    if not hass.services.has_service(DOMAIN, "set_selection"):
+
+        @callback
+        def handle_set_selection(call: ServiceCall) -> ServiceResponse:
+            """Assign or clear one chore cell and return the new point totals."""
+            store = manager.async_require_store(call.data["entity_id"])
+
+            return store.async_set_selection(
+                call.data["section"],
+                call.data["row"],
+                call.data["day"],
+                call.data.get("user"),
+            )
+
+        hass.services.async_register(
+            DOMAIN,
+            "set_selection",
+            _instrumented(manager, "set_selection", handle_set_selection),
+            schema=SET_SELECTION_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+        LOGGER.info("✅ Registered service: chore_card.set_selection")
+
+    # ✅ Many changes, one state write and one save
+    if not hass.services.has_service(DOMAIN, "apply_batch"):
+
+        @callback
+        def handle_apply_batch(call: ServiceCall) -> ServiceResponse:
+            """Apply a list of operations to one board atomically."""
+            store = manager.async_require_store(call.data["entity_id"])
+            return store.async_apply_batch(call.data["operations"])
+
+        hass.services.async_register(
+            DOMAIN,
+            "apply_batch",
+            _instrumented(manager, "apply_batch", handle_apply_batch),
+            schema=APPLY_BATCH_SCHEMA,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+        LOGGER.info("✅ Registered service: chore_card.apply_batch")
+
+    # ✅ Manual resets; scheduled resets run from the integration's midnight listener
+    if not hass.services.has_service(DOMAIN, "reset_weekly_chores"):
+
+        @callback
+        def handle_reset_weekly_chores(call: ServiceCall) -> None:
+            """Reset one board, or every board when no entity is given."""
+            entity_id = call.data.get("entity_id")
+            stores = (
+                manager.stores
+                if entity_id is None
+                else [manager.async_require_store(entity_id)]
+            )
+
+            today = dt_util.now().date()
+            for store in stores:
+                store.async_reset(today)
+            LOGGER.info(f"🔄 Reset {len(stores)} Chore Card board(s)")
+
+        hass.services.async_register(
+            DOMAIN,
+            "reset_weekly_chores",
+            _instrumented(manager, "reset_weekly_chores", handle_reset_weekly_chores),
+            schema=vol.Schema({vol.Optional("entity_id"): cv.entity_id}),
+        )
+        LOGGER.info("✅ Registered service: chore_card.reset_weekly_chores")
+
+
 class ChoreCardSensor(Entity):
     """Representation of a Chore Card Sensor."""
 
-    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry):
-        """Initialize the sensor with stored chore data."""
+    _attr_should_poll = False
+    # Only the compact last_change/last_reset attributes go to the recorder
+    _unrecorded_attributes = frozenset({"user_points", "users", "chores"})
+
+    def __init__(
+        self, hass: HomeAssistant, config_entry: ConfigEntry, store: ChoreCardStore
+    ):
+        """Initialize the sensor backed by the board's store."""
         self.hass = hass
+        self.store = store
+        self.entry_id = config_entry.entry_id
         self.entity_id = config_entry.data["sensor_name"]  # ✅ Set entity_id from user input
         self._attr_name = config_entry.title  # ✅ Use user input for friendly name
-        self._attr_state = "unknown"
-        self._attr_extra_state_attributes = {
-            "data": config_entry.data.get("data", {}),
-            "user_points": config_entry.data.get("user_points", {}),
-            "last_reset": config_entry.data.get("last_reset", None),
-            "first_day_of_week": config_entry.data.get("first_day_of_week", "Mon"),
-            "show_long_day_names": config_entry.data.get("show_long_day_names", False),
-            "points_position": config_entry.data.get("points_position", "top"),
-            "day_header_background_color": config_entry.data.get("day_header_background_color", "blue"),
-            "day_header_font_color": config_entry.data.get("day_header_font_color", "white"),
-            "current_day_background_color": config_entry.data.get("current_day_background_color", "red"),
-            "current_day_font_color": config_entry.data.get("current_day_font_color", "white"),
-            "users": config_entry.data.get("users", []),
-        }
+
+    async def async_added_to_hass(self) -> None:
+        """Index the sensor and write state whenever the board changes."""
+        async_get_manager(self.hass).async_register_entity(self.entry_id, self)
+        self.async_on_remove(self.store.async_add_listener(self._async_board_updated))
+
+    @callback
+    def _async_board_updated(self) -> None:
+        """Write the new summary to the state machine."""
+        with self.store.metrics.timed("state_writes"):
+            self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop the sensor from the index (it is re-added after a rename)."""
+        async_get_manager(self.hass).async_unregister_entity(self.entry_id, self)
 
     @property
     def name(self):
@@ -118,28 +393,115 @@ class ChoreCardSensor(Entity):
     @property
     def state(self):
         """Return the state of the sensor."""
-        return self._attr_state
+        return self.store.state
 
     @property
     def extra_state_attributes(self):
-        """Return the state attributes."""
-        return self._attr_extra_state_attributes
+        """Return a small summary of the board; the board itself lives in the store."""
+        return self.store.summary
 
     @property
     def unique_id(self):
         """Return a unique ID for the sensor."""
         return self.entity_id  # ✅ Ensure unique_id is valid
 
+
+class ChoreCardUserPointsSensor(SensorEntity):
+    """Points of one board user, recorded as long-term statistics."""
+
+    _attr_should_poll = False
+    _attr_icon = "mdi:star-circle"
+    _attr_native_unit_of_measurement = "points"
+    # Points drop back to zero at every weekly reset and may go down when a
+    # selection is cleared, so this is a TOTAL that resets, not an increasing one
+    _attr_state_class = SensorStateClass.TOTAL
+
+    def __init__(self, config_entry: ConfigEntry, store: ChoreCardStore, user: str):
+        """Initialize the points sensor of one user."""
+        self.store = store
+        self.user = user
+        self._attr_name = f"{config_entry.title} {user} Points"
+        self._attr_unique_id = f"{config_entry.entry_id}_points_{user}"
+        self._written: tuple[int, str | None] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Write state when this user's points or the reset date change."""
+        self._written = (self.native_value, self.store.board["last_reset"])
+        self.async_on_remove(self.store.async_add_listener(self._async_board_updated))
+
     @callback
-    def async_set_state(self, new_state, new_attributes):
-        """Properly update the sensor and notify HA only if the state changed."""
-        if (
-            self._attr_state != new_state
-            or self._attr_extra_state_attributes != new_attributes
-        ):
-            self._attr_state = new_state
-            self._attr_extra_state_attributes.update(new_attributes)
-            self.async_write_ha_state()  # ✅ Correct async update method
-            LOGGER.info(f"✅ Sensor {self.entity_id} updated: {new_state}")
-        else:
-            LOGGER.info(f"ℹ️ No state change for {self.entity_id}, skipping update.")
+    def _async_board_updated(self) -> None:
+        # Most changes touch one or two users; the others skip their write
+        current = (self.native_value, self.store.board["last_reset"])
+        if current != self._written:
+            self._written = current
+            self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> int:
+        """Points this week."""
+        return self.store.board["user_points"].get(self.user, 0)
+
+    @property
+    def last_reset(self):
+        """Start of the day of the last weekly reset."""
+        reset = parse_reset_date(self.store.board["last_reset"])
+        return None if reset is None else dt_util.start_of_local_day(reset)
+
+
+class ChoreCardLeaderboardSensor(SensorEntity):
+    """Household leader across all boards, with the full ranking as attributes."""
+
+    _attr_should_poll = False
+    _attr_icon = "mdi:trophy"
+    _attr_name = "Chore Card Leaderboard"
+    _attr_unique_id = f"{DOMAIN}_leaderboard"
+    # The ranking grows with the household; the leader alone is recorded
+    _unrecorded_attributes = frozenset({"ranking"})
+
+    def __init__(self, manager: ChoreCardManager):
+        """Initialize the household leaderboard sensor."""
+        self.leaderboard = manager.leaderboard
+
+    async def async_added_to_hass(self) -> None:
+        """Write state whenever any board's points change."""
+        self.async_on_remove(
+            self.leaderboard.async_add_listener(self.async_write_ha_state)
+        )
+
+    @property
+    def native_value(self) -> str | None:
+        """The user with the most points across all boards."""
+        ranking = self.leaderboard.ranking
+        return ranking[0]["user"] if ranking else None
+
+    @property
+    def extra_state_attributes(self):
+        """Every user's household points, highest first."""
+        return {"ranking": self.leaderboard.ranking}
+
+
+class ChoreCardDiagnosticSensor(SensorEntity):
+    """Optional sensor exposing a board's hot-path metrics (disabled by default)."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:speedometer"
+    _attr_native_unit_of_measurement = "writes"
+    _unrecorded_attributes = frozenset({"metrics"})
+
+    def __init__(self, config_entry: ConfigEntry, store: ChoreCardStore):
+        """Initialize the diagnostic sensor for one board."""
+        self.store = store
+        self._attr_name = f"{config_entry.title} Diagnostics"
+        self._attr_unique_id = f"{config_entry.entry_id}_diagnostics"
+
+    @property
+    def native_value(self):
+        """Number of state writes since startup."""
+        return self.store.metrics.counters.get("state_writes", 0)
+
+    @property
+    def extra_state_attributes(self):
+        """Counters and latency summaries for the board."""
+        return {"metrics": self.store.metrics.as_dict()}
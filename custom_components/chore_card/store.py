@@ -0,0 +1,781 @@
+"""Persistent chore state for Chore Card boards."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+import copy
+from datetime import date
+import logging
+from typing import Any, Callable
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
+
+from .board_config import (
+    CHORE_SCHEMAS,
+    OPTIONS_SCHEMA,
+    USER_SCHEMA,
+    board_config,
+    config_hash,
+    normalize_board_config,
+)
+from .const import (
+    BOARD_STORAGE_VERSION,
+    CAMEL_CASE_KEYS,
+    CHORE_SECTIONS,
+    CONF_WRITE_WINDOW,
+    DEFAULT_OPTIONS,
+    DEFAULT_WRITE_WINDOW,
+    EVENT_CHORE_COMPLETED,
+    EVENT_POINTS_CHANGED,
+    EVENT_RESET,
+    SAVE_DELAY,
+    STORAGE_KEY,
+)
+from .encoding import decode_board, encode_board
+from .ledger import PERIODS, ChoreCardLedger
+from .metrics import ChoreCardMetrics
+from .recurrence import ChoreCardRecurrence
+from .reset import parse_reset_date, week_start
+from .view import build_view
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def normalize_board_keys(attributes: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of a board payload using canonical snake_case keys."""
+    normalized = {}
+    for key, value in attributes.items():
+        normalized[CAMEL_CASE_KEYS.get(key, key)] = value
+    normalized.pop("cardId", None)
+    normalized.pop("revision", None)
+    return normalized
+
+
+def default_board(seed: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Build a board, seeding it from legacy config entry data if present."""
+    seed = normalize_board_keys(seed or {})
+    board = {
+        "data": seed.get("data", {}),
+        "user_points": seed.get("user_points", {}),
+        "last_reset": seed.get("last_reset"),
+        "last_monthly_reset": seed.get("last_monthly_reset"),
+        "users": seed.get("users", []),
+    }
+    for key, default in DEFAULT_OPTIONS.items():
+        board[key] = seed.get(key, default)
+    return board
+
+
+# Config entry keys that only ever held a copy of the board
+BOARD_KEYS = {
+    "data",
+    "user_points",
+    "last_reset",
+    "last_monthly_reset",
+    "users",
+    "cardId",
+    *DEFAULT_OPTIONS,
+    *CAMEL_CASE_KEYS,
+}
+
+
+class ChoreCardBoardStore(Store):
+    """Board storage that migrates older layouts to the compact encoding."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: dict
+    ) -> dict[str, Any]:
+        if old_major_version == 1:
+            _LOGGER.info("📦 Migrating board %s to the compact format", self.key)
+            return {
+                "state": old_data.get("state", "active"),
+                "board": encode_board(default_board(old_data.get("board", {}))),
+            }
+        raise NotImplementedError
+
+
+def _require_user(board: dict[str, Any], user: str) -> None:
+    if user not in {board_user.get("name") for board_user in board["users"]}:
+        raise HomeAssistantError(f"Unknown user: {user}")
+
+
+def _require_chores(board: dict[str, Any], section: str) -> list[dict[str, Any]]:
+    if section not in CHORE_SECTIONS:
+        raise HomeAssistantError(f"Unknown chore section: {section}")
+    return board["data"].setdefault(section, [])
+
+
+def cell_diff(change: dict[str, Any]) -> dict[str, Any]:
+    """The part of a selection change that subscribers need."""
+    return {
+        "section": change["section"],
+        "row": change["row"],
+        "day": change["day"],
+        "user": change["user"],
+    }
+
+
+def apply_selection(
+    board: dict[str, Any], section: str, row: int, day: int, user: str | None
+) -> dict[str, Any] | None:
+    """Assign (or clear) one cell of ``board`` and adjust points.
+
+    Returns a description of the change, or None if the cell already held
+    ``user``.
+    """
+    chores = _require_chores(board, section)
+    if not 0 <= row < len(chores):
+        raise HomeAssistantError(f"No {section} chore at row {row}")
+    if not 0 <= day < 7:
+        raise HomeAssistantError(f"Invalid day index: {day}")
+
+    user = user or None
+    if user is not None:
+        _require_user(board, user)
+
+    chore = chores[row]
+    selections = chore.get("selections") or [None] * 7
+    chore["selections"] = selections
+    previous = selections[day] or None
+
+    if previous == user:
+        return None
+
+    selections[day] = user
+    points = chore.get("points") or 0
+    user_points = board["user_points"]
+    if previous is not None:
+        user_points[previous] = user_points.get(previous, 0) - points
+    if user is not None:
+        user_points[user] = user_points.get(user, 0) + points
+
+    return {
+        "section": section,
+        "row": row,
+        "day": day,
+        "user": user,
+        "previous": previous,
+        "chore": chore.get("name"),
+        "points": points,
+    }
+
+
+def _validate(schema: vol.Schema, value: dict[str, Any]) -> dict[str, Any]:
+    """Normalize a chore or user the same way a saved board is."""
+    try:
+        return schema(dict(value))
+    except vol.Invalid as err:
+        raise HomeAssistantError(f"Invalid board configuration: {err}") from err
+
+
+def apply_operation(
+    board: dict[str, Any], operation: dict[str, Any]
+) -> tuple[list[dict[str, Any]], bool]:
+    """Apply one batch operation to ``board``.
+
+    Returns the selection/points changes for the ledger, and whether chores or
+    users changed (subscribers then need a snapshot). Both are empty/False
+    when the operation changed nothing.
+    """
+    op = operation["op"]
+
+    if op in ("assign", "clear"):
+        change = apply_selection(
+            board,
+            operation["section"],
+            operation["row"],
+            operation["day"],
+            operation.get("user") if op == "assign" else None,
+        )
+        return ([change] if change is not None else []), False
+
+    if op == "add_points":
+        user, points = operation["user"], operation["points"]
+        _require_user(board, user)
+        board["user_points"][user] = board["user_points"].get(user, 0) + points
+        return [
+            {
+                "user": user,
+                "previous": None,
+                "chore": operation.get("reason", "bonus"),
+                "points": points,
+            }
+        ], False
+
+    if op == "add_chore":
+        chores = _require_chores(board, operation["section"])
+        chore = _validate(CHORE_SCHEMAS[operation["section"]], operation["chore"])
+        if any(existing.get("name") == chore["name"] for existing in chores):
+            raise HomeAssistantError(f"Chore already exists: {chore['name']}")
+        chore["selections"] = [None] * 7
+        chores.append(chore)
+        return [], True
+
+    if op == "remove_chore":
+        chores = _require_chores(board, operation["section"])
+        if not 0 <= operation["row"] < len(chores):
+            raise HomeAssistantError(
+                f"No {operation['section']} chore at row {operation['row']}"
+            )
+        chore = chores.pop(operation["row"])
+        # Take back the points its cells earned, as clearing them would
+        points = chore.get("points") or 0
+        changes = []
+        for previous in chore.get("selections") or []:
+            if previous:
+                board["user_points"][previous] = (
+                    board["user_points"].get(previous, 0) - points
+                )
+                changes.append(
+                    {
+                        "user": None,
+                        "previous": previous,
+                        "chore": chore.get("name"),
+                        "points": points,
+                    }
+                )
+        return changes, True
+
+    if op == "add_user":
+        user = _validate(USER_SCHEMA, operation["user"])
+        if user["name"] in {board_user.get("name") for board_user in board["users"]}:
+            raise HomeAssistantError(f"User already exists: {user['name']}")
+        board["users"].append(user)
+        board["user_points"].setdefault(user["name"], 0)
+        return [], True
+
+    if op == "remove_user":
+        name = operation["user"]
+        _require_user(board, name)
+        board["users"] = [user for user in board["users"] if user.get("name") != name]
+        board["user_points"].pop(name, None)
+        for chores in board["data"].values():
+            for chore in chores:
+                if chore.get("selections"):
+                    chore["selections"] = [
+                        None if selection == name else selection
+                        for selection in chore["selections"]
+                    ]
+        return [], True
+
+    raise HomeAssistantError(f"Unknown operation: {op}")
+
+
+class ChoreCardStore:
+    """Authoritative, persisted chore state for a single board."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry):
+        self.hass = hass
+        self.entry = entry
+        self.state = "active"
+        self.board: dict[str, Any] = {}
+        self.last_change: dict[str, Any] | None = None
+        self._store: Store = ChoreCardBoardStore(
+            hass, BOARD_STORAGE_VERSION, f"{STORAGE_KEY}.{entry.entry_id}"
+        )
+        self.metrics = ChoreCardMetrics()
+        self.ledger = ChoreCardLedger(hass, entry.entry_id, self.metrics)
+        # Bumped on every change and persisted, so writers can name their base
+        self.revision = 0
+        # (date, view model); dropped whenever the board changes beyond a cell
+        self._view: tuple[date, dict[str, Any]] | None = None
+        # (hash, canonical configuration); dropped along with the view
+        self._config: tuple[str, dict[str, Any]] | None = None
+        # Expanded schedule per month, rebuilt when the config hash changes
+        self._recurrence = ChoreCardRecurrence(self.metrics)
+        self._listeners: list[Callable[[], None]] = []
+        self._diff_listeners: list[Callable[[dict[str, Any]], None]] = []
+        # Totals as of the last points event; compared on every notification
+        self._announced_points: dict[str, int] = {}
+        self._debouncer: Debouncer | None = None
+        self.async_set_write_window(
+            entry.options.get(CONF_WRITE_WINDOW, DEFAULT_WRITE_WINDOW)
+        )
+
+    @callback
+    def async_set_write_window(self, window: float) -> None:
+        """Coalesce listeners (the sensor's state write) over ``window`` seconds."""
+        if self._debouncer is not None:
+            if self._debouncer.cooldown == window:
+                return
+            self._debouncer.async_shutdown()
+            self._debouncer = None
+        if window > 0:
+            self._debouncer = Debouncer(
+                self.hass,
+                _LOGGER,
+                cooldown=window,
+                immediate=False,
+                function=self._async_call_listeners,
+            )
+
+    async def async_load(self) -> None:
+        """Load the board from disk, seeding from the config entry on first run."""
+        stored = await self._store.async_load()
+
+        if stored is None:
+            _LOGGER.info(
+                "📦 No stored board for %s, seeding from config entry",
+                self.entry.entry_id,
+            )
+            self.board = default_board(dict(self.entry.data))
+            self.async_schedule_save()
+
+            # The board lives in storage now; keep only settings in the entry
+            if BOARD_KEYS & self.entry.data.keys():
+                self.hass.config_entries.async_update_entry(
+                    self.entry,
+                    data={
+                        key: value
+                        for key, value in self.entry.data.items()
+                        if key not in BOARD_KEYS
+                    },
+                )
+        else:
+            self.state = stored.get("state", "active")
+            self.revision = stored.get("revision", 0)
+            self.board = default_board(decode_board(stored.get("board", {})))
+
+        # ✅ Store the board in the canonical form saved payloads are compared in
+        try:
+            normalized = copy.deepcopy(normalize_board_config(self.board))
+        except vol.Invalid as err:
+            _LOGGER.warning("⚠️ Stored board %s is invalid: %s", self.entry.title, err)
+        else:
+            if normalized != self.board:
+                self.board = normalized
+                self.async_schedule_save()
+
+        await self.ledger.async_load(self.board["first_day_of_week"])
+        self._announced_points = dict(self.board["user_points"])
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a debounced write of the board to disk."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """Write the board and its ledger to disk immediately."""
+        if self._debouncer is not None:
+            self._debouncer.async_shutdown()
+        await self._store.async_save(self._data_to_save())
+        await self.ledger.async_flush()
+
+    async def async_remove(self) -> None:
+        """Delete the persisted board and its ledger."""
+        await self._store.async_remove()
+        await self.ledger.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        self.metrics.increment("store.flushes")
+        return {
+            "state": self.state,
+            "revision": self.revision,
+            "board": encode_board(self.board),
+        }
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Listen for board changes. Returns a function to remove the listener."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_subscribe(
+        self, diff_callback: Callable[[dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        """Receive a diff (or a full snapshot) for every board change."""
+        self._diff_listeners.append(diff_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._diff_listeners.remove(diff_callback)
+
+        return remove_listener
+
+    @callback
+    def _async_call_listeners(self) -> None:
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def async_notify(self, diff: dict[str, Any] | None = None) -> None:
+        """Persist the board and let listeners know it changed.
+
+        Listeners are coalesced over the configured write window, so a burst
+        of changes produces one state write; subscribers still get every
+        diff right away so revisions stay contiguous.
+
+        ``diff`` describes the change as changed cells and point totals; when
+        omitted, subscribers receive a full snapshot of the board instead.
+        """
+        self.revision += 1
+        if diff is None:
+            self._view = self._config = None
+        self.async_schedule_save()
+        if self._debouncer is not None:
+            self.metrics.increment("notify.scheduled")
+            self._debouncer.async_schedule_call()
+        else:
+            self._async_call_listeners()
+
+        if self._diff_listeners:
+            message = {"revision": self.revision, **(diff or self.snapshot)}
+            for diff_callback in list(self._diff_listeners):
+                diff_callback(message)
+
+        self._async_fire_points_changed()
+
+    @callback
+    def async_update(
+        self,
+        new_state: str,
+        attributes: dict[str, Any],
+        base_revision: int | None = None,
+    ) -> dict[str, Any]:
+        """Merge a full board payload from the card.
+
+        Returns ``status`` ``not_modified`` when the payload matches the board,
+        ``conflict`` when it was based on an older revision than the current
+        one (nothing is written; the caller should reload), or ``updated``.
+        Raises if the options, users or chores in the payload are invalid.
+        """
+        try:
+            attributes = normalize_board_config(normalize_board_keys(attributes))
+        except vol.Invalid as err:
+            raise HomeAssistantError(f"Invalid board configuration: {err}") from err
+
+        changes = {
+            key: value
+            for key, value in attributes.items()
+            if self.board.get(key) != value
+        }
+
+        if self.state == new_state and not changes:
+            return {"status": "not_modified", "revision": self.revision}
+
+        if base_revision is not None and base_revision != self.revision:
+            self.metrics.increment("store.conflicts")
+            return {"status": "conflict", "revision": self.revision}
+
+        self.state = new_state
+        self.board.update(copy.deepcopy(changes))
+        self.async_notify()
+        return {"status": "updated", "revision": self.revision}
+
+    @callback
+    def async_set_selection(
+        self, section: str, row: int, day: int, user: str | None
+    ) -> dict[str, Any]:
+        """Assign one chore cell to a user (or clear it) and adjust points."""
+        user_points = dict(self.board["user_points"])
+        change = apply_selection(self.board, section, row, day, user)
+
+        if change is None:
+            return {
+                "changed": False,
+                "revision": self.revision,
+                "user_points": dict(self.board["user_points"]),
+            }
+
+        try:
+            self._record_changes([change])
+        except HomeAssistantError:
+            # The ledger refused the change; undo it on the board too
+            apply_selection(self.board, section, row, day, change["previous"])
+            self.board["user_points"] = user_points
+            raise
+        self._announce_changes([change])
+        self.async_notify(
+            {
+                "cells": [cell_diff(change)],
+                "user_points": {
+                    name: self.board["user_points"][name]
+                    for name in (change["previous"], change["user"])
+                    if name is not None
+                },
+            }
+        )
+        return {
+            "changed": True,
+            "revision": self.revision,
+            "user_points": dict(self.board["user_points"]),
+        }
+
+    @callback
+    def async_apply_batch(self, operations: list[dict[str, Any]]) -> dict[str, Any]:
+        """Validate and apply many operations at once, with a single notification.
+
+        Operations run against a copy of the board; if any of them fails the
+        board is left untouched and the error names the failing operation.
+        ``applied`` counts the operations that changed something.
+        """
+        board = copy.deepcopy(self.board)
+        changes: list[dict[str, Any]] = []
+        structural = False
+        applied = 0
+
+        for index, operation in enumerate(operations):
+            try:
+                operation_changes, operation_structural = apply_operation(
+                    board, operation
+                )
+            except HomeAssistantError as err:
+                raise HomeAssistantError(
+                    f"Operation {index} ({operation.get('op')}) failed: {err}"
+                ) from err
+
+            changes.extend(operation_changes)
+            structural |= operation_structural
+            applied += bool(operation_changes or operation_structural)
+
+        if not applied:
+            return {
+                "applied": 0,
+                "revision": self.revision,
+                "user_points": dict(self.board["user_points"]),
+            }
+
+        # The ledger is written first: if it rejects the batch, nothing changed
+        self._record_changes(changes)
+        before = self.board["user_points"]
+        self.board = board
+        self._announce_changes(changes)
+
+        diff = None
+        if not structural:
+            diff = {
+                "cells": [
+                    cell_diff(change) for change in changes if "section" in change
+                ],
+                "user_points": {
+                    name: points
+                    for name, points in board["user_points"].items()
+                    if before.get(name) != points
+                },
+            }
+        self.async_notify(diff)
+        return {
+            "applied": applied,
+            "revision": self.revision,
+            "user_points": dict(board["user_points"]),
+        }
+
+    @callback
+    def _async_fire(self, event_type: str, data: dict[str, Any]) -> None:
+        """Fire a board event on the bus."""
+        self.hass.bus.async_fire(
+            event_type,
+            {
+                "entity_id": self.entry.data.get("sensor_name"),
+                "entry_id": self.entry.entry_id,
+                **data,
+            },
+        )
+
+    @callback
+    def _async_fire_points_changed(self) -> None:
+        """Fire one points event per user whose total moved since the last one.
+
+        Every change, whatever its path, ends in ``async_notify``, which calls
+        this; removed users are announced as dropping to zero.
+        """
+        user_points = self.board["user_points"]
+        if user_points == self._announced_points:
+            return
+
+        for user in self._announced_points.keys() | user_points.keys():
+            points = user_points.get(user, 0)
+            delta = points - self._announced_points.get(user, 0)
+            if delta:
+                self._async_fire(
+                    EVENT_POINTS_CHANGED,
+                    {"user": user, "delta": delta, "points": points},
+                )
+        self._announced_points = dict(user_points)
+
+    @callback
+    def _record_changes(self, changes: list[dict[str, Any]]) -> None:
+        """Append point changes to the ledger; raises, recording none, if invalid."""
+        entries = []
+        for change in changes:
+            chore, points = change["chore"], change["points"]
+            if change["previous"] is not None:
+                entries.append((chore, change["previous"], -points))
+            if change["user"] is not None:
+                entries.append((chore, change["user"], points))
+        self.ledger.async_append_many(entries, self.board["first_day_of_week"])
+
+    @callback
+    def _announce_changes(self, changes: list[dict[str, Any]]) -> None:
+        """Fire completion events for applied changes and update last_change."""
+        for change in changes:
+            if "section" in change and change["user"] is not None:
+                self._async_fire(
+                    EVENT_CHORE_COMPLETED,
+                    {
+                        "section": change["section"],
+                        "chore": change["chore"],
+                        "user": change["user"],
+                        "day": change["day"],
+                        "delta": change["points"],
+                    },
+                )
+
+        # A batch is summarized by its final change and how many it applied;
+        # every change is in the ledger and in the events fired above
+        if changes:
+            change = changes[-1]
+            self.last_change = {
+                "user": change["user"] or change["previous"],
+                "chore": change["chore"],
+                "day": change.get("day"),
+                "delta": change["points"] if change["user"] else -change["points"],
+                "batch_size": len(changes),
+            }
+            if change["user"] is not None and change["previous"] is not None:
+                self.last_change["from"] = change["previous"]
+
+    @callback
+    def async_reset(self, today: date, sections: list[str] | None = None) -> None:
+        """Clear selections and, for a full weekly reset, zero all points."""
+        weekly = sections is None
+        for section in sections or CHORE_SECTIONS:
+            for chore in self.board["data"].get(section) or []:
+                chore["selections"] = [None] * 7
+
+        if weekly:
+            self.board["user_points"] = {
+                user: 0 for user in self.board["user_points"]
+            }
+            self.board["last_reset"] = today.isoformat()
+        self.board["last_monthly_reset"] = today.isoformat()
+        self.last_change = None
+        self.async_notify()
+        self._async_fire(
+            EVENT_RESET,
+            {
+                "sections": list(sections or CHORE_SECTIONS),
+                "points_cleared": weekly,
+                "date": today.isoformat(),
+            },
+        )
+
+    @callback
+    def async_reset_if_due(self, today: date) -> bool:
+        """Catch up on a missed weekly or monthly rollover. Returns True if reset."""
+        last_reset = parse_reset_date(self.board["last_reset"])
+        last_monthly_reset = parse_reset_date(self.board["last_monthly_reset"])
+
+        # Rollovers that were never tracked keep their selections; start now.
+        # Boards from before monthly resets still catch up on a missed week.
+        if last_reset is None:
+            self.board["last_reset"] = today.isoformat()
+        if last_monthly_reset is None:
+            self.board["last_monthly_reset"] = today.isoformat()
+        if last_reset is None or last_monthly_reset is None:
+            self.async_schedule_save()
+
+        if last_reset is not None and last_reset < week_start(
+            today, self.board["first_day_of_week"]
+        ):
+            self.async_reset(today)
+            return True
+
+        if last_monthly_reset is not None and last_monthly_reset < today.replace(
+            day=1
+        ):
+            self.async_reset(today, ["monthly"])
+            return True
+
+        return False
+
+    @property
+    def summary(self) -> dict[str, Any]:
+        """Small summary of the board suitable for entity attributes."""
+        return {
+            "user_points": dict(self.board["user_points"]),
+            "last_reset": self.board["last_reset"],
+            "users": [user.get("name") for user in self.board["users"]],
+            "chores": sum(len(chores) for chores in self.board["data"].values()),
+            "last_change": self.last_change,
+        }
+
+    def stats(self, today: date, limit: int = 5) -> dict[str, Any]:
+        """Points per user this week, month and year, plus the top chores."""
+        first_day_of_week = self.board["first_day_of_week"]
+        return {
+            **{
+                period: self.ledger.totals(period, today, first_day_of_week)
+                for period in PERIODS
+            },
+            "top_chores": self.ledger.top_chores(limit),
+        }
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> bool:
+        """Apply display options from the options flow. Returns True if changed.
+
+        Only called when the options flow saves, so the latest edit wins over
+        the options a card seeded the board with.
+        """
+        self.async_set_write_window(
+            options.get(CONF_WRITE_WINDOW, DEFAULT_WRITE_WINDOW)
+        )
+        options = vol.Schema(OPTIONS_SCHEMA, extra=vol.REMOVE_EXTRA)(dict(options))
+        changes = {
+            key: value for key, value in options.items() if self.board.get(key) != value
+        }
+        if not changes:
+            return False
+
+        self.board.update(changes)
+        self.async_notify()
+        return True
+
+    @property
+    def config(self) -> tuple[str, dict[str, Any]]:
+        """The board's canonical configuration and its hash, cached."""
+        if self._config is None:
+            config = board_config(self.board)
+            self._config = (config_hash(config), config)
+        return self._config
+
+    def view(self, today: date) -> dict[str, Any]:
+        """The board's view model for ``today``, computed once per day."""
+        if self._view is None or self._view[0] != today:
+            self.metrics.increment("view.builds")
+            self._view = (today, build_view(self.board, today))
+        return self._view[1]
+
+    def occurrences(self, start: date, end: date) -> list[dict[str, Any]]:
+        """Scheduled chore occurrences overlapping ``[start, end)``."""
+        config_hash, config = self.config
+        return self._recurrence.occurrences(config_hash, config, start, end)
+
+    @property
+    def snapshot(self) -> dict[str, Any]:
+        """Full board message, compactly encoded, for subscribers starting over."""
+        return {"board": {"state": self.state, **encode_board(self.board)}}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the complete board for the card."""
+        return {
+            "state": self.state,
+            "revision": self.revision,
+            **copy.deepcopy(self.board),
+        }
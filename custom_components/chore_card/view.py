@@ -0,0 +1,115 @@
+"""Per-day view model of a Chore Card board.
+
+The card used to redo its calendar math (day order, today's column, week of
+the month, weekly schedules and monthly highlights) on every render. The
+view model holds the results for one board and one day. It only depends on
+the board's configuration and the date, never on selections, so boards cache
+it until their configuration changes or the day rolls over.
+
+Day indexes follow the card's ``selections`` arrays: 0 is Sunday.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any
+
+from .const import CHORE_SECTIONS
+from .reset import (
+    LONG_DAY_NAMES,
+    SHORT_DAY_NAMES,
+    normalize_day_name,
+    split_day_names,
+    week_start,
+)
+
+
+def day_index(day_name: str | None) -> int | None:
+    """Index of a short or long day name in ``selections`` (0 = Sunday)."""
+    short = normalize_day_name(day_name)
+    if short is None:
+        return None
+    return (SHORT_DAY_NAMES.index(short) + 1) % 7
+
+
+def day_indexes(days: Any) -> set[int]:
+    """Indexes of a weekly chore's ``days``, given as a list or ``"Mon,Wed"``."""
+    return {day_index(day) for day in split_day_names(days)} - {None}
+
+
+def week_of_month(today: date, first_day_of_week: str | None) -> int:
+    """Which week of its month the current week is (1-based).
+
+    Weeks are counted from the first ``first_day_of_week`` of the month the
+    current week started in, matching how the card highlights monthly chores.
+    """
+    start = week_start(today, first_day_of_week)
+    first_of_month = start.replace(day=1)
+    first_week_start = first_of_month + timedelta(
+        days=(start.weekday() - first_of_month.weekday()) % 7
+    )
+    return (start - first_week_start).days // 7 + 1
+
+
+def _chore_view(
+    section: str, chore: dict[str, Any], current_week: int
+) -> dict[str, Any]:
+    """Schedule of one chore: enabled days, highlight and limits."""
+    view: dict[str, Any] = {
+        "days": None,
+        "highlight": None,
+        "active": True,
+        "max_days": None,
+    }
+
+    if section == "weekly":
+        days = chore.get("days")
+        if days:
+            view["days"] = sorted(day_indexes(days))
+
+    elif section == "monthly":
+        view["max_days"] = chore.get("max_days") or 1
+        schedule = chore.get("week_of_month")
+        if schedule:
+            view["active"] = schedule.get("week") == current_week
+            if view["active"]:
+                view["highlight"] = schedule.get("highlight_color") or None
+
+    return view
+
+
+def build_view(board: dict[str, Any], today: date) -> dict[str, Any]:
+    """Compute the view model of ``board`` for ``today``."""
+    first_day_of_week = board.get("first_day_of_week")
+    first_day = day_index(first_day_of_week)
+    if first_day is None:
+        first_day = day_index("Mon")
+    today_index = (today.weekday() + 1) % 7
+    current_week = week_of_month(today, first_day_of_week)
+
+    days = []
+    for offset in range(7):
+        index = (first_day + offset) % 7
+        name_index = (index - 1) % 7
+        days.append(
+            {
+                "index": index,
+                "short_name": SHORT_DAY_NAMES[name_index],
+                "long_name": LONG_DAY_NAMES[name_index].capitalize(),
+                "today": index == today_index,
+            }
+        )
+
+    data = board.get("data") or {}
+    return {
+        "date": today.isoformat(),
+        "week_of_month": current_week,
+        "days": days,
+        "sections": {
+            section: [
+                _chore_view(section, chore, current_week)
+                for chore in data.get(section) or []
+            ]
+            for section in CHORE_SECTIONS
+        },
+    }
@@ -0,0 +1,220 @@
+"""Websocket API for Chore Card boards."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .manager import async_get_manager
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.helpers.entity import Entity
+
+    from .store import ChoreCardStore
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the Chore Card websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+    websocket_api.async_register_command(hass, websocket_stats)
+    websocket_api.async_register_command(hass, websocket_view)
+    websocket_api.async_register_command(hass, websocket_config)
+    websocket_api.async_register_command(hass, websocket_list)
+    websocket_api.async_register_command(hass, websocket_get)
+    websocket_api.async_register_command(hass, websocket_leaderboard)
+
+
+def _board_info(
+    entry: ConfigEntry, entity: Entity, store: ChoreCardStore
+) -> dict[str, Any]:
+    """Metadata of one board, without its chores or selections."""
+    return {
+        "entity_id": entity.entity_id,
+        "entry_id": entry.entry_id,
+        "title": entry.title,
+        "state": store.state,
+        "revision": store.revision,
+        **store.summary,
+    }
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Push a board snapshot, then only diffs, to the subscribing card."""
+    manager = async_get_manager(hass)
+    store = manager.async_get_store(msg["entity_id"])
+
+    if store is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"{msg['entity_id']} not found"
+        )
+        return
+
+    @callback
+    def forward_diff(diff: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], diff))
+
+    # Follows the board across reloads; each reloaded board sends a snapshot
+    connection.subscriptions[msg["id"]] = manager.async_subscribe(
+        store.entry.entry_id, forward_diff
+    )
+    connection.send_result(msg["id"])
+    forward_diff({"revision": store.revision, **store.snapshot})
+    _LOGGER.debug("📡 Subscribed to %s", msg["entity_id"])
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/stats",
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("limit", default=5): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+@callback
+def websocket_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return points per user this week/month/year and the top chores."""
+    store = async_get_manager(hass).async_get_store(msg["entity_id"])
+
+    if store is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"{msg['entity_id']} not found"
+        )
+        return
+
+    connection.send_result(msg["id"], store.stats(dt_util.now().date(), msg["limit"]))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/view",
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+@callback
+def websocket_view(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return today's day order, schedules and highlights for a board."""
+    store = async_get_manager(hass).async_get_store(msg["entity_id"])
+
+    if store is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"{msg['entity_id']} not found"
+        )
+        return
+
+    connection.send_result(msg["id"], store.view(dt_util.now().date()))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/config",
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("hash"): str,
+    }
+)
+@callback
+def websocket_config(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return a board's normalized configuration unless the caller has it."""
+    store = async_get_manager(hass).async_get_store(msg["entity_id"])
+
+    if store is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"{msg['entity_id']} not found"
+        )
+        return
+
+    config_hash, config = store.config
+    if msg.get("hash") == config_hash:
+        connection.send_result(msg["id"], {"hash": config_hash, "modified": False})
+        return
+
+    connection.send_result(
+        msg["id"], {"hash": config_hash, "modified": True, "config": config}
+    )
+
+
+@websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/list"})
+@callback
+def websocket_list(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """List the chore boards, answered from the integration's own index."""
+    connection.send_result(
+        msg["id"],
+        [_board_info(*board) for board in async_get_manager(hass).async_list_boards()],
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/get",
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+@callback
+def websocket_get(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the metadata of one board."""
+    manager = async_get_manager(hass)
+    entry_id = manager.async_get_entry_id(msg["entity_id"])
+    entry = None if entry_id is None else manager.async_get_entry(entry_id)
+    store = None if entry_id is None else manager.async_get_board(entry_id)
+
+    if entry is None or store is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"{msg['entity_id']} not found"
+        )
+        return
+
+    connection.send_result(
+        msg["id"], _board_info(entry, manager.async_get_entity(entry_id), store)
+    )
+
+
+@websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/leaderboard"})
+@callback
+def websocket_leaderboard(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return household points per user across all boards."""
+    connection.send_result(msg["id"], async_get_manager(hass).leaderboard.as_dict())
@@ -0,0 +1,24 @@
+"""Tests for the Chore Card integration."""
+
+from typing import Any
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.chore_card.const import DOMAIN
+
+
+async def async_setup_board(
+    hass: HomeAssistant, data: dict[str, Any], title: str = "Chores"
+) -> MockConfigEntry:
+    """Set up a board seeded from config entry data, as older versions stored it."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=title,
+        data={"sensor_name": f"sensor.{title.lower()}", **data},
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
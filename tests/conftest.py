@@ -0,0 +1,42 @@
+"""Fixtures for Chore Card tests."""
+
+from collections.abc import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from . import async_setup_board
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load ``custom_components`` from this repository."""
+    yield
+
+
+@pytest.fixture
+def mock_frontend(hass: HomeAssistant) -> Generator[None]:
+    """Skip installing the frontend; it and the http server are not under test."""
+    hass.config.components.update({"http", "lovelace", "websocket_api"})
+    hass.http = MagicMock()
+    with patch("custom_components.chore_card.install.async_install_frontend"):
+        yield
+
+
+@pytest.fixture
+async def board(hass: HomeAssistant, mock_frontend: None) -> MockConfigEntry:
+    """A loaded board with two users and one chore per section."""
+    return await async_setup_board(
+        hass,
+        {
+            "users": [{"name": "Alice"}, {"name": "Bob"}],
+            "data": {
+                "daily": [{"name": "Dishes", "points": 2}],
+                "weekly": [{"name": "Trash", "points": 3, "days": ["Mon", "Thu"]}],
+                "monthly": [{"name": "Windows", "points": 5}],
+            },
+        },
+    )
@@ -0,0 +1,148 @@
+"""Tests for batch operations on a board."""
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from custom_components.chore_card.const import DOMAIN
+from custom_components.chore_card.manager import async_get_manager
+
+
+async def test_batch_normalizes_added_chores_and_users(
+    hass: HomeAssistant, board: MockConfigEntry
+) -> None:
+    """Chores and users added in a batch are stored in canonical form."""
+    store = async_get_manager(hass).async_get_board(board.entry_id)
+    store.async_apply_batch(
+        [
+            {
+                "op": "add_chore",
+                "section": "weekly",
+                "chore": {"name": " Laundry ", "days": "monday,Thu"},
+            },
+            {"op": "add_user", "user": {"name": "Carol"}},
+        ]
+    )
+
+    chore = store.board["data"]["weekly"][-1]
+    assert chore["name"] == "Laundry"
+    assert chore["days"] == ["Mon", "Thu"]
+    assert chore["points"] == 0
+    assert store.board["users"][-1] == {
+        "name": "Carol",
+        "background_color": "transparent",
+        "font_color": "white",
+    }
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        {"op": "add_chore", "section": "weekly", "chore": {"name": "X", "days": "Funday"}},
+        {"op": "add_chore", "section": "monthly", "chore": {"name": "X", "max_days": 9}},
+        {"op": "add_user", "user": {"name": "Carol", "font_color": "not a colour!"}},
+    ],
+)
+async def test_batch_rejects_invalid_chores_and_users(
+    hass: HomeAssistant, board: MockConfigEntry, operation: dict
+) -> None:
+    """An invalid chore or user fails the batch and leaves the board untouched."""
+    store = async_get_manager(hass).async_get_board(board.entry_id)
+    revision = store.revision
+
+    with pytest.raises(HomeAssistantError, match="Invalid board configuration"):
+        store.async_apply_batch([operation])
+    assert store.revision == revision
+
+
+async def test_last_change_summarizes_a_batch(
+    hass: HomeAssistant, board: MockConfigEntry
+) -> None:
+    """``last_change`` is the final change of a batch, with the batch size."""
+    store = async_get_manager(hass).async_get_board(board.entry_id)
+    store.async_apply_batch(
+        [
+            {"op": "assign", "section": "daily", "row": 0, "day": 1, "user": "Alice"},
+            {"op": "assign", "section": "daily", "row": 0, "day": 1, "user": "Bob"},
+            {"op": "add_points", "user": "Alice", "points": 1},
+        ]
+    )
+    assert store.last_change == {
+        "user": "Alice",
+        "chore": "bonus",
+        "day": None,
+        "delta": 1,
+        "batch_size": 3,
+    }
+
+    store.async_set_selection("daily", 0, 2, "Bob")
+    assert store.last_change["batch_size"] == 1
+
+
+async def test_batch_rejected_by_the_ledger_changes_nothing(
+    hass: HomeAssistant, board: MockConfigEntry
+) -> None:
+    """Points the ledger cannot store fail the batch before the board changes."""
+    store = async_get_manager(hass).async_get_board(board.entry_id)
+    store.board["data"]["daily"][0]["points"] = 2**40  # Stored before the limit
+    user_points = dict(store.board["user_points"])
+
+    with pytest.raises(HomeAssistantError, match="out of range"):
+        store.async_apply_batch(
+            [
+                {"op": "add_points", "user": "Bob", "points": 1},
+                {"op": "assign", "section": "daily", "row": 0, "day": 1, "user": "Alice"},
+            ]
+        )
+    with pytest.raises(HomeAssistantError, match="out of range"):
+        store.async_set_selection("daily", 0, 1, "Alice")
+
+    assert store.board["user_points"] == user_points
+    assert store.board["data"]["daily"][0]["selections"] in (None, [None] * 7)
+    assert store.revision == 0
+    assert len(store.ledger) == 0
+
+
+async def test_apply_batch_service_bounds_points(
+    hass: HomeAssistant, board: MockConfigEntry
+) -> None:
+    """The service rejects bonus and chore points outside the allowed range."""
+    for operation in (
+        {"op": "add_points", "user": "Alice", "points": 2**40},
+        {"op": "add_chore", "section": "daily", "chore": {"name": "X", "points": 10**6}},
+    ):
+        with pytest.raises(vol.Invalid):
+            await hass.services.async_call(
+                DOMAIN,
+                "apply_batch",
+                {"entity_id": "sensor.chores", "operations": [operation]},
+                blocking=True,
+                return_response=True,
+            )
+
+
+async def test_remove_chore_takes_back_its_points(
+    hass: HomeAssistant, board: MockConfigEntry
+) -> None:
+    """Removing a chore reverses its selections like clearing them would."""
+    store = async_get_manager(hass).async_get_board(board.entry_id)
+    store.async_set_selection("daily", 0, 1, "Alice")
+    store.async_set_selection("daily", 0, 2, "Alice")
+    store.async_set_selection("daily", 0, 3, "Bob")
+
+    result = store.async_apply_batch(
+        [
+            {"op": "remove_chore", "section": "daily", "row": 0},
+            {"op": "add_points", "user": "Bob", "points": 1},
+            {"op": "clear", "section": "weekly", "row": 0, "day": 1},
+        ]
+    )
+
+    assert result["applied"] == 2
+    assert store.board["user_points"] == {"Alice": 0, "Bob": 1}
+    assert store.board["data"]["daily"] == []
+    assert store.stats(dt_util.now().date())["week"] == {"Alice": 0, "Bob": 1}
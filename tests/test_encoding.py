@@ -0,0 +1,108 @@
+"""Tests for the compact board encoding and the storage migration."""
+
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.chore_card.const import DOMAIN
+from custom_components.chore_card.encoding import (
+    BOARD_FORMAT,
+    decode_board,
+    encode_board,
+)
+from custom_components.chore_card.manager import async_get_manager
+
+BOARD = {
+    "data": {
+        "daily": [
+            {
+                "name": "Dishes",
+                "points": 2,
+                "selections": ["Alice", None, "Bob", "Carol", None, None, "Alice"],
+            }
+        ],
+        "weekly": [],
+        "monthly": [
+            {
+                "name": "Windows",
+                "points": 5,
+                "week_of_month": {"week": 2, "highlight_color": "red"},
+                "selections": [None] * 7,
+            }
+        ],
+    },
+    # Carol left the board but still holds a cell and points
+    "users": [
+        {"name": "Alice", "background_color": "transparent", "font_color": "white"},
+        {"name": "Bob", "background_color": "#123456", "font_color": "black"},
+    ],
+    "user_points": {"Alice": 4, "Bob": 2, "Carol": 2},
+    "last_reset": "2026-10-12",
+    "last_monthly_reset": "2026-10-01",
+    "first_day_of_week": "Mon",
+}
+
+
+def test_encode_decode_round_trip() -> None:
+    """Decoding an encoded board gives the same board back."""
+    encoded = encode_board(BOARD)
+
+    assert encoded["v"] == BOARD_FORMAT
+    assert encoded["names"] == ["Carol"]
+    assert encoded["points"] == [4, 2, 2]
+    assert encoded["chores"]["daily"][0]["s"] == [1, 0, 2, 3, 0, 0, 1]
+    assert decode_board(encoded) == BOARD
+
+
+def test_encode_keeps_users_without_points() -> None:
+    """Users without a total stay without one after a round trip."""
+    board = {**BOARD, "user_points": {"Alice": 4}}
+    assert decode_board(encode_board(board))["user_points"] == {"Alice": 4}
+
+
+async def test_version_1_store_is_migrated(
+    hass: HomeAssistant, hass_storage: dict[str, Any], mock_frontend: None
+) -> None:
+    """A board stored in the version 1 layout loads and is saved as version 2."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, title="Chores", data={"sensor_name": "sensor.chores"}
+    )
+    key = f"{DOMAIN}.{entry.entry_id}"
+    hass_storage[key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": key,
+        "data": {
+            "state": "active",
+            "board": {
+                **{k: v for k, v in BOARD.items() if k != "user_points"},
+                "userPoints": BOARD["user_points"],
+            },
+        },
+    }
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    store = async_get_manager(hass).async_get_board(entry.entry_id)
+    assert store.board["user_points"] == BOARD["user_points"]
+    assert store.board["data"]["daily"][0]["selections"] == (
+        BOARD["data"]["daily"][0]["selections"]
+    )
+
+    await store.async_flush()
+    stored = hass_storage[key]
+    assert stored["version"] == 2
+    assert stored["data"]["board"]["v"] == BOARD_FORMAT
+    assert decode_board(stored["data"]["board"])["user_points"] == BOARD["user_points"]
+
+
+@pytest.mark.parametrize("selections", [None, []])
+def test_missing_selections_decode_as_empty_cells(selections) -> None:
+    """Chores stored without selections come back with seven empty cells."""
+    board = {"data": {"daily": [{"name": "Dishes", "selections": selections}]}}
+    decoded = decode_board(encode_board(board))
+    assert decoded["data"]["daily"][0]["selections"] == [None] * 7
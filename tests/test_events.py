@@ -0,0 +1,51 @@
+"""Tests for the events boards fire on the bus."""
+
+from datetime import date
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.chore_card.const import EVENT_POINTS_CHANGED
+from custom_components.chore_card.manager import async_get_manager
+
+
+async def test_points_changed_fires_for_every_change_path(
+    hass: HomeAssistant, board: MockConfigEntry
+) -> None:
+    """Selections, batches and resets all announce moved totals."""
+    store = async_get_manager(hass).async_get_board(board.entry_id)
+    events = async_capture_events(hass, EVENT_POINTS_CHANGED)
+
+    def announced() -> list[tuple[str, int, int]]:
+        result = sorted(
+            (event.data["user"], event.data["delta"], event.data["points"])
+            for event in events
+        )
+        events.clear()
+        return result
+
+    store.async_set_selection("daily", 0, 1, "Alice")
+    await hass.async_block_till_done()
+    assert announced() == [("Alice", 2, 2)]
+
+    store.async_apply_batch(
+        [
+            {"op": "add_points", "user": "Bob", "points": 5},
+            {"op": "assign", "section": "daily", "row": 0, "day": 1, "user": "Bob"},
+        ]
+    )
+    await hass.async_block_till_done()
+    assert announced() == [("Alice", -2, 0), ("Bob", 7, 7)]
+
+    store.async_apply_batch([{"op": "remove_user", "user": "Bob"}])
+    await hass.async_block_till_done()
+    assert announced() == [("Bob", -7, 0)]
+
+    store.async_apply_batch([{"op": "add_points", "user": "Alice", "points": 3}])
+    store.async_reset(date(2026, 10, 19))
+    await hass.async_block_till_done()
+    assert announced() == [("Alice", -3, 0), ("Alice", 3, 3)]
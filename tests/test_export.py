@@ -0,0 +1,50 @@
+"""Tests for the history export."""
+
+import json
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from custom_components.chore_card.manager import async_get_manager
+
+from . import async_setup_board
+
+
+async def test_history_export_running_total(hass: HomeAssistant, hass_client) -> None:
+    """Rows stream oldest first with a per-user running total of the export."""
+    assert await async_setup_component(hass, "http", {})
+    hass.config.components.update({"lovelace", "websocket_api"})
+    with patch("custom_components.chore_card.install.async_install_frontend"):
+        entry = await async_setup_board(
+            hass,
+            {
+                "users": [{"name": "Alice"}, {"name": "Bob"}],
+                "data": {"daily": [{"name": "Dishes", "points": 2}]},
+            },
+        )
+        store = async_get_manager(hass).async_get_board(entry.entry_id)
+        store.async_set_selection("daily", 0, 1, "Alice")
+        store.async_set_selection("daily", 0, 2, "Bob")
+        store.async_set_selection("daily", 0, 1, "Bob")
+
+        client = await hass_client()
+        response = await client.get("/api/chore_card/sensor.chores/history")
+        assert response.status == 200
+        lines = (await response.text()).splitlines()
+        assert lines[0] == "timestamp,chore,user,points,running_total"
+        assert [line.split(",", 1)[1] for line in lines[1:]] == [
+            "Dishes,Alice,2,2",
+            "Dishes,Bob,2,2",
+            "Dishes,Alice,-2,0",
+            "Dishes,Bob,2,4",
+        ]
+
+        response = await client.get(
+            "/api/chore_card/sensor.chores/history?format=ndjson&user=Alice"
+        )
+        rows = [json.loads(row) for row in (await response.text()).splitlines()]
+        assert [(row["user"], row["points"], row["running_total"]) for row in rows] == [
+            ("Alice", 2, 2),
+            ("Alice", -2, 0),
+        ]
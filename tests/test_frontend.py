@@ -0,0 +1,58 @@
+"""Tests for the Chore Card frontend registration."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from custom_components.chore_card.const import DATA_FRONTEND_VERSION, DATA_REGISTERED
+from custom_components.chore_card.frontend import (
+    CARD_PATH,
+    HACS_CARD_PATH,
+    ChoreCardRegistration,
+)
+from custom_components.chore_card.manager import async_get_manager
+
+
+async def test_register_chore_cards_reconciles_resources(hass: HomeAssistant) -> None:
+    """Stale card resources are replaced by one entry with the current version."""
+    assert await async_setup_component(hass, "lovelace", {})
+    resources = hass.data["lovelace"].resources
+    await resources.async_load()
+    resources.loaded = True
+    await resources.async_create_item(
+        {"res_type": "module", "url": f"{CARD_PATH}?v=1.0.0"}
+    )
+    await resources.async_create_item(
+        {"res_type": "module", "url": f"{HACS_CARD_PATH}?v=old"}
+    )
+    await resources.async_create_item({"res_type": "module", "url": "/local/other.js"})
+    hass.data[DATA_FRONTEND_VERSION] = "abc123"
+
+    registration = ChoreCardRegistration(hass)
+    await registration.async_register_chore_cards()
+    # A second run finds the resource already correct
+    await registration.async_register_chore_cards()
+
+    urls = sorted(resource["url"] for resource in resources.async_items())
+    assert urls == sorted(["/local/other.js", f"{CARD_PATH}?v=abc123"])
+    assert async_get_manager(hass).metrics.histograms["frontend.reconcile"].count == 2
+
+
+async def test_register_can_be_retried_after_a_failure(hass: HomeAssistant) -> None:
+    """A failed registration does not mark the frontend as registered."""
+    assert await async_setup_component(hass, "lovelace", {})
+    hass.data[DATA_FRONTEND_VERSION] = "abc123"
+    hass.http = MagicMock()
+    hass.http.async_register_static_paths = AsyncMock(
+        side_effect=[OSError("disk"), None]
+    )
+
+    registration = ChoreCardRegistration(hass)
+    await registration.async_register()
+    assert DATA_REGISTERED not in hass.data
+
+    await registration.async_register()
+    await hass.async_block_till_done()
+    assert hass.data[DATA_REGISTERED]
+    assert hass.http.async_register_static_paths.await_count == 2
@@ -0,0 +1,25 @@
+"""Tests for installing the frontend files."""
+
+import os
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.chore_card.install import install_frontend
+
+
+async def test_install_restores_deleted_files(hass: HomeAssistant, tmp_path) -> None:
+    """An unchanged hash does not skip the copy when installed files are gone."""
+    hass.config.config_dir = str(tmp_path)
+    source = tmp_path / "custom_components" / "chore_card" / "frontend"
+    source.mkdir(parents=True)
+    (source / "chore-card.js").write_text("console.log('chore card');")
+
+    content_hash = await hass.async_add_executor_job(install_frontend, hass)
+    installed = tmp_path / "www" / "community" / "chore-card" / "chore-card.js"
+    assert installed.exists()
+
+    os.remove(installed)
+    os.remove(f"{installed}.gz")
+    assert await hass.async_add_executor_job(install_frontend, hass) == content_hash
+    assert installed.read_text() == "console.log('chore card');"
+    assert os.path.exists(f"{installed}.gz")
@@ -0,0 +1,34 @@
+"""Tests for the household leaderboard."""
+
+from datetime import timedelta
+
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.chore_card.const import DEFAULT_WRITE_WINDOW
+from custom_components.chore_card.manager import async_get_manager
+
+from . import async_setup_board
+
+
+async def test_leaderboard_outlives_the_board_loaded_first(
+    hass: HomeAssistant, board: MockConfigEntry
+) -> None:
+    """The leaderboard sensor is not tied to any board's platform."""
+    other = await async_setup_board(hass, {"users": [{"name": "Alice"}]}, "Garden")
+
+    async_get_manager(hass).async_get_board(other.entry_id).async_apply_batch(
+        [{"op": "add_points", "user": "Alice", "points": 4}]
+    )
+    assert await hass.config_entries.async_unload(board.entry_id)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=DEFAULT_WRITE_WINDOW * 2))
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.chore_card_leaderboard")
+    assert state.state == "Alice"
+    assert state.attributes["ranking"] == [{"user": "Alice", "points": 4}]
@@ -0,0 +1,29 @@
+"""Tests for the completion ledger."""
+
+from datetime import date, datetime
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.chore_card.ledger import ChoreCardLedger
+from custom_components.chore_card.metrics import ChoreCardMetrics
+
+
+async def test_weekly_totals_follow_the_first_day_of_week(hass: HomeAssistant) -> None:
+    """Changing the week start re-keys weeks recorded under the old one."""
+    ledger = ChoreCardLedger(hass, "entry", ChoreCardMetrics())
+    await ledger.async_load("Mon")
+
+    # Sunday 2026-10-18 and Monday 2026-10-19
+    for day, points in ((18, 2), (19, 3)):
+        timestamp = dt_util.as_utc(
+            datetime(2026, 10, day, 12, tzinfo=dt_util.get_default_time_zone())
+        ).timestamp()
+        ledger.async_append("Dishes", "Alice", points, "Mon", timestamp)
+
+    monday = date(2026, 10, 19)
+    assert ledger.totals("week", monday, "Mon") == {"Alice": 3}
+    # Weeks starting on Sunday put both days in the same week
+    assert ledger.totals("week", monday, "Sun") == {"Alice": 5}
+    assert ledger.points("Alice", "week", date(2026, 10, 12), "Sunday") == 0
+    assert ledger.totals("month", monday, "Sun") == {"Alice": 5}
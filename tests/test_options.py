@@ -0,0 +1,56 @@
+"""Tests for applying options from the options flow."""
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.chore_card.manager import async_get_manager
+
+
+async def test_options_apply_only_when_saved(
+    hass: HomeAssistant, board: MockConfigEntry
+) -> None:
+    """Setup keeps the board's options; saving the options flow changes them."""
+    store = async_get_manager(hass).async_get_board(board.entry_id)
+    store.board["points_position"] = "bottom"  # Synced by a card
+
+    await hass.config_entries.async_reload(board.entry_id)
+    await hass.async_block_till_done()
+    store = async_get_manager(hass).async_get_board(board.entry_id)
+    assert store.board["points_position"] == "bottom"
+
+    hass.config_entries.async_update_entry(
+        board, options={"points_position": "top", "first_day_of_week": "Sunday"}
+    )
+    await hass.async_block_till_done()
+    assert store.board["points_position"] == "top"
+    assert store.board["first_day_of_week"] == "Sun"
+
+
+async def test_options_flow_saves_options(
+    hass: HomeAssistant, board: MockConfigEntry
+) -> None:
+    """The options form starts from the board and saves validated options."""
+    result = await hass.config_entries.options.async_init(board.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            "first_day_of_week": "Sun",
+            "show_long_day_names": True,
+            "points_position": "bottom",
+            "day_header_background_color": "#336699",
+            "day_header_font_color": "white",
+            "current_day_background_color": "red",
+            "current_day_font_color": "white",
+            "write_window": 0.5,
+        },
+    )
+    await hass.async_block_till_done()
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert board.options["points_position"] == "bottom"
+    store = async_get_manager(hass).async_get_board(board.entry_id)
+    assert store.board["first_day_of_week"] == "Sun"
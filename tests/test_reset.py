@@ -0,0 +1,49 @@
+"""Tests for catching up on missed resets."""
+
+from datetime import timedelta
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.chore_card.manager import async_get_manager
+from custom_components.chore_card.reset import week_start
+
+from . import async_setup_board
+
+
+def _baseline_board(last_reset: str) -> dict:
+    """Config entry data as the baseline card wrote it, before monthly resets."""
+    return {
+        "users": [{"name": "Alice"}],
+        "userPoints": {"Alice": 4},
+        "lastReset": last_reset,
+        "data": {"daily": [{"name": "Dishes", "points": 4, "selections": ["Alice"]}]},
+    }
+
+
+@pytest.mark.usefixtures("mock_frontend")
+async def test_upgraded_board_catches_up_on_a_missed_week(hass: HomeAssistant) -> None:
+    """A baseline board whose week rolled over while it was down is reset."""
+    entry = await async_setup_board(hass, _baseline_board("2020-01-06T00:00:00"))
+    store = async_get_manager(hass).async_get_board(entry.entry_id)
+    today = dt_util.now().date()
+
+    assert store.board["user_points"] == {"Alice": 0}
+    assert store.board["data"]["daily"][0]["selections"] == [None] * 7
+    assert store.board["last_reset"] == today.isoformat()
+    assert store.board["last_monthly_reset"] == today.isoformat()
+
+
+@pytest.mark.usefixtures("mock_frontend")
+async def test_upgraded_board_keeps_the_current_week(hass: HomeAssistant) -> None:
+    """A baseline board reset this week keeps its work and starts monthly tracking."""
+    this_week = week_start(dt_util.now().date(), "Mon")
+    entry = await async_setup_board(hass, _baseline_board(this_week.isoformat()))
+    store = async_get_manager(hass).async_get_board(entry.entry_id)
+
+    assert store.board["user_points"] == {"Alice": 4}
+    assert store.board["data"]["daily"][0]["selections"][0] == "Alice"
+    assert store.board["last_reset"] == this_week.isoformat()
+    assert not store.async_reset_if_due(this_week + timedelta(days=6))
@@ -0,0 +1,59 @@
+"""Tests for full-board updates from the card."""
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.chore_card.manager import async_get_manager
+
+
+def _echo(board: dict) -> dict:
+    """The board as the card sends it back: everything but state and revision."""
+    return {
+        key: value for key, value in board.items() if key not in ("state", "revision")
+    }
+
+
+async def test_unchanged_board_is_not_modified(
+    hass: HomeAssistant, board: MockConfigEntry
+) -> None:
+    """Echoing the loaded board back writes nothing and keeps the revision."""
+    store = async_get_manager(hass).async_get_board(board.entry_id)
+    payload = store.as_dict()
+
+    assert store.async_update("active", _echo(payload), payload["revision"]) == {
+        "status": "not_modified",
+        "revision": payload["revision"],
+    }
+    # An older base revision does not matter when nothing changes
+    assert store.async_update("active", _echo(payload), 0)["status"] == "not_modified"
+
+
+async def test_updates_bump_the_revision_and_detect_conflicts(
+    hass: HomeAssistant, board: MockConfigEntry
+) -> None:
+    """Each applied update bumps the revision; stale writers get a conflict."""
+    store = async_get_manager(hass).async_get_board(board.entry_id)
+    payload = store.as_dict()
+    revision = payload["revision"]
+
+    payload["data"]["daily"][0]["selections"] = ["Alice"] + [None] * 6
+    payload["user_points"] = {"Alice": 2, "Bob": 0}
+    assert store.async_update("active", _echo(payload), revision) == {
+        "status": "updated",
+        "revision": revision + 1,
+    }
+
+    # A second card still based on the first revision
+    payload["user_points"] = {"Alice": 2, "Bob": 5}
+    assert store.async_update("active", _echo(payload), revision) == {
+        "status": "conflict",
+        "revision": revision + 1,
+    }
+    assert store.board["user_points"] == {"Alice": 2, "Bob": 0}
+
+    assert store.async_update("active", _echo(payload), revision + 1) == {
+        "status": "updated",
+        "revision": revision + 2,
+    }
+    assert store.board["user_points"] == {"Alice": 2, "Bob": 5}
@@ -0,0 +1,24 @@
+"""Tests for the board view model and the recurrence index."""
+
+from datetime import date
+
+import pytest
+
+from custom_components.chore_card.recurrence import expand_month
+from custom_components.chore_card.view import build_view
+
+
+@pytest.mark.parametrize("days", ["Mon,Wed", "monday, Wednesday", ["Mon", "Wed"]])
+def test_weekly_days_match_in_view_and_calendar(days) -> None:
+    """A weekly chore's days mean the same to the card and the calendar."""
+    chore = {"name": "Trash", "points": 1, "days": days}
+    board = {"data": {"weekly": [chore]}, "first_day_of_week": "Mon"}
+
+    view = build_view(board, date(2026, 10, 14))
+    assert view["sections"]["weekly"][0]["days"] == [1, 3]
+
+    occurrences = expand_month({"chores": {"weekly": [chore]}}, date(2026, 10, 1))
+    assert {occurrence["start"].strftime("%a") for occurrence in occurrences} == {
+        "Mon",
+        "Wed",
+    }
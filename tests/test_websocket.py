@@ -0,0 +1,115 @@
+"""Tests for board subscriptions and coalesced writes."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from custom_components.chore_card.const import DEFAULT_WRITE_WINDOW, SAVE_DELAY
+from custom_components.chore_card.manager import async_get_manager
+
+from . import async_setup_board
+
+
+@pytest.fixture
+async def ws_board(hass: HomeAssistant) -> MockConfigEntry:
+    """A board behind real http and websocket servers."""
+    assert await async_setup_component(hass, "http", {})
+    assert await async_setup_component(hass, "websocket_api", {})
+    hass.config.components.add("lovelace")
+    with patch("custom_components.chore_card.install.async_install_frontend"):
+        yield await async_setup_board(
+            hass,
+            {
+                "users": [{"name": "Alice"}, {"name": "Bob"}],
+                "data": {"daily": [{"name": "Dishes", "points": 2}]},
+            },
+        )
+
+
+async def test_subscribers_get_cell_diffs_across_reloads(
+    hass: HomeAssistant, ws_board: MockConfigEntry, hass_ws_client
+) -> None:
+    """A snapshot, then one diff per change with contiguous revisions."""
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id(
+        {"type": "chore_card/subscribe", "entity_id": "sensor.chores"}
+    )
+    assert (await client.receive_json())["success"]
+    snapshot = (await client.receive_json())["event"]
+    assert "board" in snapshot
+    revision = snapshot["revision"]
+
+    store = async_get_manager(hass).async_get_board(ws_board.entry_id)
+    store.async_set_selection("daily", 0, 1, "Alice")
+    store.async_set_selection("daily", 0, 1, "Bob")
+
+    first = (await client.receive_json())["event"]
+    second = (await client.receive_json())["event"]
+    assert first == {
+        "revision": revision + 1,
+        "cells": [{"section": "daily", "row": 0, "day": 1, "user": "Alice"}],
+        "user_points": {"Alice": 2},
+    }
+    assert second == {
+        "revision": revision + 2,
+        "cells": [{"section": "daily", "row": 0, "day": 1, "user": "Bob"}],
+        "user_points": {"Alice": 0, "Bob": 2},
+    }
+
+    # A reloaded board picks the subscription up with a fresh snapshot
+    assert await hass.config_entries.async_reload(ws_board.entry_id)
+    await hass.async_block_till_done()
+    snapshot = (await client.receive_json())["event"]
+    assert snapshot["revision"] == revision + 2
+    assert "board" in snapshot
+
+    store = async_get_manager(hass).async_get_board(ws_board.entry_id)
+    store.async_set_selection("daily", 0, 2, "Alice")
+    assert (await client.receive_json())["event"]["revision"] == revision + 3
+
+
+async def test_burst_is_coalesced_into_one_write_and_one_save(
+    hass: HomeAssistant, board: MockConfigEntry, freezer: FrozenDateTimeFactory
+) -> None:
+    """Ten quick clicks produce one state write and one save."""
+    store = async_get_manager(hass).async_get_board(board.entry_id)
+    freezer.tick(timedelta(seconds=SAVE_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    with patch.object(
+        store._store, "_async_write_data", wraps=store._store._async_write_data
+    ) as write_data:
+        for day in range(7):
+            store.async_set_selection("daily", 0, day, "Alice")
+        for day in range(3):
+            store.async_set_selection("daily", 0, day, "Bob")
+
+        freezer.tick(timedelta(seconds=DEFAULT_WRITE_WINDOW * 2))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        board_writes = [
+            event for event in events if event.data["entity_id"] == "sensor.chores"
+        ]
+        assert len(board_writes) == 1
+        assert board_writes[0].data["new_state"].attributes["user_points"] == {
+            "Alice": 8,
+            "Bob": 6,
+        }
+
+        freezer.tick(timedelta(seconds=SAVE_DELAY))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert write_data.call_count == 1